@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Corpus view storing simple tenses only, with compound tenses derived on access
+
+Eight tenses of a record (PasseCompose ... ConditionnelPasseII, and
+ImperatifPasse) are the auxiliary's simple tense plus the past participle.
+The view stores each record with those tenses replaced by null, plus what
+it takes to rebuild them with conjugation_engine.compound_forms():
+
+    derivation  [participle, auxiliary, agreement] when it is not the
+                record's own ParticipePasse, Auxiliaire and (e)/(s) markers
+                (capitalized "Conduit" records, "se dire": "me suis dit")
+    exceptions  {tense: {person: form}} for the stored cells the derivation
+                does not reproduce
+
+A person is empty in the compound tenses when it is empty in the Present
+(in the Imperatif for ImperatifPasse), so impersonal verbs (neiger,
+falloir) derive without exceptions. A compound tense is built the first
+time it is read and kept on the verb; records that are only looked up
+never pay for theirs. Views are Mappings, so verb_schema.conjugation_row()
+and the other consumers of flat columns read them like records, and export
+writes them back to the corpus layout for tools that need the JSON file.
+
+View document (JSON):
+    version  FORMAT_VERSION
+    verbs    [[record with null compound tenses, derivation or null, exceptions], ...]
+
+Usage:
+    from compound_view import CompoundView
+    view = CompoundView.for_corpus()
+    view['se lever']['PasseCompose'][0]   # 'me suis levé(e)'
+
+    python3 compound_view.py pack [conjugation.json] [conjugation.simple.json]
+    python3 compound_view.py export [conjugation.simple.json] [conjugation.flat.json]
+    python3 compound_view.py verify [conjugation.json]
+"""
+
+import json
+import os
+import sys
+import time
+from collections.abc import Mapping
+
+from conjugation_engine import AUXILIARY_FORMS, COMPOUND_TENSES, compound_forms, split_reflexive
+from verb_corpus import DEFAULT_CORPUS_PATH, PERSONS, load_verbs, write_verbs_json
+from verb_index import normalize_infinitive
+from verb_schema import KEY_ALIASES, conjugation_row
+
+FORMAT_VERSION = 1
+# Compound tense keys of a record, older spellings included
+COMPOUND_KEYS = {**{tense: tense for tense in COMPOUND_TENSES},
+                 **{alias: canonical for alias, canonical in KEY_ALIASES.items() if canonical in COMPOUND_TENSES}}
+
+
+def _is_compound(key, value):
+    return key in COMPOUND_KEYS and isinstance(value, list) and len(value) == PERSONS
+
+
+def _empty_persons(record, tense):
+    """Return the persons a compound tense leaves empty, from the matching simple tense"""
+    forms = record.get('Imperatif' if tense == 'ImperatifPasse' else 'Present')
+    if not isinstance(forms, list):
+        return ()
+    return tuple(person for person, form in enumerate(forms) if not form)
+
+
+def derive(record, tense, participle, auxiliary, agreement=True):
+    """Return the 6 forms of a compound tense of a record"""
+    pronominal = split_reflexive(normalize_infinitive(record.get('Infinitif') or ''))[1]
+    forms = compound_forms(tense, participle, auxiliary, pronominal, agreement)
+    for person in _empty_persons(record, tense):
+        forms[person] = ''
+    return forms
+
+
+def _parsed_participle(verb_data):
+    """Return the participle written in the first stored compound cell, or None"""
+    for key, value in verb_data.items():
+        if _is_compound(key, value) and COMPOUND_KEYS[key] != 'ImperatifPasse':
+            for form in value:
+                if form:
+                    return form.split(' ')[-1].split('(')[0]
+    return None
+
+
+def _exceptions(verb_data, derivation):
+    exceptions = {}
+    for key, value in verb_data.items():
+        if _is_compound(key, value):
+            forms = derive(verb_data, COMPOUND_KEYS[key], *derivation)
+            diff = {person: form for person, (form, derived) in enumerate(zip(value, forms)) if form != derived}
+            if diff:
+                exceptions[key] = diff
+    return exceptions
+
+
+def encode_verb(verb_data):
+    """Return (record without compound tenses, derivation or None, exceptions)
+
+    The record's own participle and auxiliary are tried first; the other
+    candidates (the participle of the stored cells, the other auxiliary,
+    no agreement) are kept only when they leave fewer exceptions.
+    """
+    stored = {key: None if _is_compound(key, value) else value for key, value in verb_data.items()}
+    if None not in stored.values():
+        return stored, None, {}
+
+    participle = verb_data.get('ParticipePasse') or ''
+    auxiliary = normalize_infinitive(verb_data.get('Auxiliaire') or '')
+    own = (participle, auxiliary, True)
+    best = (own, _exceptions(verb_data, own)) if auxiliary in AUXILIARY_FORMS else None
+    if best is None or best[1]:
+        participles = dict.fromkeys((participle, _parsed_participle(verb_data) or participle))
+        auxiliaries = dict.fromkeys((auxiliary, 'avoir', 'être'))
+        for candidate_participle in participles:
+            for candidate_auxiliary in auxiliaries:
+                if candidate_auxiliary not in AUXILIARY_FORMS:
+                    continue
+                for agreement in (True, False) if candidate_auxiliary == 'être' else (True,):
+                    derivation = (candidate_participle, candidate_auxiliary, agreement)
+                    exceptions = _exceptions(verb_data, derivation)
+                    cells = sum(len(diff) for diff in exceptions.values())
+                    if best is None or cells < sum(len(diff) for diff in best[1].values()):
+                        best = (derivation, exceptions)
+    derivation, exceptions = best
+    return stored, (None if derivation == own else list(derivation)), exceptions
+
+
+def encode_corpus(verbs):
+    """Encode a list of verb records as a view document"""
+    encoded = []
+    for verb_data in verbs:
+        stored, derivation, exceptions = encode_verb(verb_data)
+        encoded.append([stored, derivation, {key: {str(person): form for person, form in diff.items()}
+                                             for key, diff in exceptions.items()}])
+    return {'version': FORMAT_VERSION, 'verbs': encoded}
+
+
+class LazyVerb(Mapping):
+    """A verb record whose compound tenses are built on first access"""
+
+    __slots__ = ('_stored', '_derivation', '_exceptions', '_derived')
+
+    def __init__(self, stored, derivation=None, exceptions=None):
+        self._stored = stored
+        self._derivation = derivation
+        self._exceptions = exceptions or {}
+        self._derived = {}
+
+    def __getitem__(self, key):
+        value = self._stored[key]
+        if value is not None or key not in COMPOUND_KEYS:
+            return value
+        forms = self._derived.get(key)
+        if forms is None:
+            derivation = self._derivation or (self._stored.get('ParticipePasse') or '',
+                                              normalize_infinitive(self._stored.get('Auxiliaire') or ''), True)
+            forms = derive(self._stored, COMPOUND_KEYS[key], *derivation)
+            for person, form in self._exceptions.get(key, {}).items():
+                forms[person] = form
+            self._derived[key] = forms
+        return forms
+
+    def __iter__(self):
+        return iter(self._stored)
+
+    def __len__(self):
+        return len(self._stored)
+
+    def to_dict(self):
+        """Return the record with its compound tenses materialized"""
+        return {key: self[key] for key in self._stored}
+
+
+class CompoundView:
+    """Verb records of a view document, by position or by infinitive"""
+
+    def __init__(self, document):
+        if document.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported view format: {document.get('version')}")
+        self.verbs = [LazyVerb(stored, derivation,
+                               {key: {int(person): form for person, form in diff.items()}
+                                for key, diff in exceptions.items()})
+                      for stored, derivation, exceptions in document['verbs']]
+        self.index = {}
+        for verb in self.verbs:
+            self.index.setdefault(normalize_infinitive(verb.get('Infinitif') or ''), verb)
+
+    @classmethod
+    def for_corpus(cls, path=None):
+        return cls(encode_corpus(load_verbs(path)))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self.verbs)
+
+    def __iter__(self):
+        return iter(self.verbs)
+
+    def __getitem__(self, infinitive):
+        return self.index[normalize_infinitive(infinitive)]
+
+    def __contains__(self, infinitive):
+        return normalize_infinitive(infinitive) in self.index
+
+    def materialize(self):
+        """Return the records with every compound tense filled in"""
+        return [verb.to_dict() for verb in self.verbs]
+
+
+def dumps(document):
+    """Serialize a view document compactly"""
+    return json.dumps(document, ensure_ascii=False, separators=(',', ':'))
+
+
+def verify(corpus_path=None):
+    """Encode a corpus, check the round trip and report sizes and timings"""
+    corpus_path = corpus_path or DEFAULT_CORPUS_PATH
+    verbs = load_verbs(corpus_path)
+
+    start = time.perf_counter()
+    document = encode_corpus(verbs)
+    encode_time = time.perf_counter() - start
+
+    view = CompoundView(json.loads(dumps(document)))
+    start = time.perf_counter()
+    rows = [conjugation_row(verb) for verb in view]
+    derive_time = time.perf_counter() - start
+
+    mismatches = [verb_data.get('Infinitif') for verb_data, verb in zip(verbs, view) if verb_data != verb.to_dict()]
+    mismatches += [verb_data.get('Infinitif') for verb_data, row in zip(verbs, rows)
+                   if conjugation_row(verb_data) != row]
+    original = json.dumps(verbs, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    encoded = dumps(document).encode('utf-8')
+    derivations = sum(1 for _, derivation, _ in document['verbs'] if derivation)
+    exceptions = [sum(len(diff) for diff in verb[2].values()) for verb in document['verbs']]
+
+    print(f"Verbs: {len(verbs)} ({derivations} with their own derivation, "
+          f"{sum(1 for cells in exceptions if cells)} with {sum(exceptions)} exception cells)")
+    print(f"Round trip: {'OK' if not mismatches else f'{len(mismatches)} mismatches'}")
+    print(f"Size: minified {len(original) / 1024:.0f} KB, view {len(encoded) / 1024:.0f} KB "
+          f"({len(original) / len(encoded):.1f}x)")
+    print(f"Encode: {encode_time * 1000:.0f} ms, flat columns: {derive_time / len(verbs) * 1e6:.1f} µs/verb")
+    if mismatches:
+        print(f"  Mismatched: {', '.join(sorted(set(mismatches))[:20])}")
+    return not mismatches
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else 'verify'
+    if command == 'pack':
+        corpus = sys.argv[2] if len(sys.argv) > 2 else None
+        output_file = sys.argv[3] if len(sys.argv) > 3 else 'conjugation.simple.json'
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(dumps(encode_corpus(load_verbs(corpus))))
+        print(f"✓ Packed corpus: {output_file} ({os.path.getsize(output_file) / 1024:.0f} KB)")
+    elif command == 'export':
+        view_file = sys.argv[2] if len(sys.argv) > 2 else 'conjugation.simple.json'
+        output_file = sys.argv[3] if len(sys.argv) > 3 else 'conjugation.flat.json'
+        count = write_verbs_json(output_file, (verb.to_dict() for verb in CompoundView.load(view_file)))
+        print(f"✓ Exported {count} verbs with compound tenses: {output_file}")
+    elif command == 'verify':
+        sys.exit(0 if verify(sys.argv[2] if len(sys.argv) > 2 else None) else 1)
+    else:
+        print(__doc__.strip().split('Usage:')[1])
+        sys.exit(1)
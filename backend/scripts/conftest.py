@@ -0,0 +1,28 @@
+"""
+Shared fixtures of the script tests
+
+Tests run on a copy of conjugation.json in a temporary directory, so the
+caches and stores they write (.corpus_cache/, *.vstore) stay out of the tree.
+"""
+
+import json
+import shutil
+
+import pytest
+
+from verb_corpus import DEFAULT_CORPUS_PATH
+
+
+@pytest.fixture(scope='session')
+def corpus_path(tmp_path_factory):
+    """Path of a private copy of the corpus"""
+    path = tmp_path_factory.mktemp('corpus') / 'conjugation.json'
+    shutil.copyfile(DEFAULT_CORPUS_PATH, path)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def corpus(corpus_path):
+    """The corpus records as parsed by json.load"""
+    with open(corpus_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
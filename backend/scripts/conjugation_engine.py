@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rule-based conjugation of French verbs from stem and ending tables
+
+A verb is reduced to its principal parts: present singular forms, the
+nous/vous stem (present plural, imparfait, participe présent), the ils stem
+(subjonctif présent), a passé simple stem and vowel, a future stem and the
+past participle. Every simple tense is a stem plus an ending from the
+tables below; compound tenses are the auxiliary's simple tense plus the
+participle, with (e)/(s) agreement markers when the auxiliary is être.
+
+-er verbs (1st group) get their principal parts from spelling rules:
+c -> ç and g -> ge before a/o (placer, manger), é -> è (céder, régner) and
+e -> è or a doubled l/t (lever, appeler, jeter, acheter) before a mute e,
+y -> i (employer) and both spellings for -ayer (paie, paye). -ir verbs are
+finir-type unless a 3rd group family (partir, venir, ouvrir, ...) matches,
+and -re/-oir verbs only conjugate through a family table (vendre, battre,
+conduire, recevoir, ...); other verbs and defective ones (paître, poindre)
+have no rule.
+
+Records are built in the corpus layout (verb_corpus.py): 6 persons per
+tense, imperatives on persons 2, 4 and 5, and pronominal verbs ("se lever",
+"s'habiller") with their pronouns, être and no ImperatifPasse. Participles
+of pronominal verbs agree unless the pronoun is an indirect object
+(INVARIABLE_PARTICIPLES: "elle s'est dit").
+
+Usage:
+    from conjugation_engine import conjugate
+    verb_data = conjugate('négliger')
+
+    python3 conjugation_engine.py négliger "se rappeler" [--bench]
+"""
+
+import json
+import sys
+import time
+
+from verb_corpus import PERSONS
+from verb_index import normalize_infinitive
+
+VOWELS = frozenset('aeiouyàâäéèêëîïôöùûüœæ')
+CONSONANTS = frozenset('bcdfghjklmnpqrstvwxzç')
+REFLEXIVE_PREFIXES = ("se ", "s'", "s’")
+REFLEXIVE_PRONOUNS = ('me', 'te', 'se', 'nous', 'vous', 'se')
+IMPERATIVE_PRONOUNS = ('', 'toi', '', 'nous', 'vous', '')
+# Verbs starting with an aspirated h take "se" rather than "s'"
+ASPIRATED_H = ('hai', 'haï', 'hâ', 'hach', 'hal', 'hant', 'harc', 'hasard', 'hériss', 'heurt', 'hiss', 'hurl')
+
+# Simple tense endings, persons 1-6
+IMPARFAIT = ('ais', 'ais', 'ait', 'ions', 'iez', 'aient')
+FUTUR = ('ai', 'as', 'a', 'ons', 'ez', 'ont')
+SUBJONCTIF_PRESENT = ('e', 'es', 'e', 'ions', 'iez', 'ent')
+PASSE_SIMPLE = {
+    'a': ('ai', 'as', 'a', 'âmes', 'âtes', 'èrent'),
+    'i': ('is', 'is', 'it', 'îmes', 'îtes', 'irent'),
+    'u': ('us', 'us', 'ut', 'ûmes', 'ûtes', 'urent'),
+    'ï': ('ïs', 'ïs', 'ït', 'ïmes', 'ïtes', 'ïrent'),
+    'in': ('ins', 'ins', 'int', 'înmes', 'întes', 'inrent'),
+}
+SUBJONCTIF_IMPARFAIT = {
+    'a': ('asse', 'asses', 'ât', 'assions', 'assiez', 'assent'),
+    'i': ('isse', 'isses', 'ît', 'issions', 'issiez', 'issent'),
+    'u': ('usse', 'usses', 'ût', 'ussions', 'ussiez', 'ussent'),
+    'ï': ('ïsse', 'ïsses', 'ït', 'ïssions', 'ïssiez', 'ïssent'),
+    'in': ('insse', 'insses', 'înt', 'inssions', 'inssiez', 'inssent'),
+}
+
+# Non -er verbs by infinitive suffix, the longest match wins. The parts
+# replace the suffix: (present je/tu/il, nous/vous stem, ils stem,
+# (passé simple stem, vowel), future stem, past participle)
+FAMILIES = {
+    'ir': (('is', 'is', 'it'), 'iss', 'iss', ('', 'i'), 'ir', 'i'),
+    'aïr': (('ais', 'ais', 'ait'), 'aïss', 'aïss', ('a', 'ï'), 'aïr', 'aï'),
+    'dormir': (('dors', 'dors', 'dort'), 'dorm', 'dorm', ('dorm', 'i'), 'dormir', 'dormi'),
+    'partir': (('pars', 'pars', 'part'), 'part', 'part', ('part', 'i'), 'partir', 'parti'),
+    'sortir': (('sors', 'sors', 'sort'), 'sort', 'sort', ('sort', 'i'), 'sortir', 'sorti'),
+    'sentir': (('sens', 'sens', 'sent'), 'sent', 'sent', ('sent', 'i'), 'sentir', 'senti'),
+    'mentir': (('mens', 'mens', 'ment'), 'ment', 'ment', ('ment', 'i'), 'mentir', 'menti'),
+    'pentir': (('pens', 'pens', 'pent'), 'pent', 'pent', ('pent', 'i'), 'pentir', 'penti'),
+    'servir': (('sers', 'sers', 'sert'), 'serv', 'serv', ('serv', 'i'), 'servir', 'servi'),
+    'enir': (('iens', 'iens', 'ient'), 'en', 'ienn', ('', 'in'), 'iendr', 'enu'),
+    'courir': (('cours', 'cours', 'court'), 'cour', 'cour', ('cour', 'u'), 'courr', 'couru'),
+    'vrir': (('vre', 'vres', 'vre'), 'vr', 'vr', ('vr', 'i'), 'vrir', 'vert'),
+    'frir': (('fre', 'fres', 'fre'), 'fr', 'fr', ('fr', 'i'), 'frir', 'fert'),
+    'cueillir': (('cueille', 'cueilles', 'cueille'), 'cueill', 'cueill', ('cueill', 'i'), 'cueiller', 'cueilli'),
+    'aillir': (('aille', 'ailles', 'aille'), 'aill', 'aill', ('aill', 'i'), 'aillir', 'ailli'),
+    'cevoir': (('çois', 'çois', 'çoit'), 'cev', 'çoiv', ('ç', 'u'), 'cevr', 'çu'),
+    'dre': (('ds', 'ds', 'd'), 'd', 'd', ('d', 'i'), 'dr', 'du'),
+    'ompre': (('omps', 'omps', 'ompt'), 'omp', 'omp', ('omp', 'i'), 'ompr', 'ompu'),
+    'attre': (('ats', 'ats', 'at'), 'att', 'att', ('att', 'i'), 'attr', 'attu'),
+    'ettre': (('ets', 'ets', 'et'), 'ett', 'ett', ('', 'i'), 'ettr', 'is'),
+    'prendre': (('prends', 'prends', 'prend'), 'pren', 'prenn', ('pr', 'i'), 'prendr', 'pris'),
+    'eindre': (('eins', 'eins', 'eint'), 'eign', 'eign', ('eign', 'i'), 'eindr', 'eint'),
+    'aindre': (('ains', 'ains', 'aint'), 'aign', 'aign', ('aign', 'i'), 'aindr', 'aint'),
+    'oindre': (('oins', 'oins', 'oint'), 'oign', 'oign', ('oign', 'i'), 'oindr', 'oint'),
+    'uire': (('uis', 'uis', 'uit'), 'uis', 'uis', ('uis', 'i'), 'uir', 'uit'),
+    'nuire': (('nuis', 'nuis', 'nuit'), 'nuis', 'nuis', ('nuis', 'i'), 'nuir', 'nui'),
+    'luire': (('luis', 'luis', 'luit'), 'luis', 'luis', ('luis', 'i'), 'luir', 'lui'),
+    'crire': (('cris', 'cris', 'crit'), 'criv', 'criv', ('criv', 'i'), 'crir', 'crit'),
+    'aître': (('ais', 'ais', 'aît'), 'aiss', 'aiss', ('', 'u'), 'aîtr', 'u'),
+}
+FAMILY_SUFFIXES = sorted(FAMILIES, key=len, reverse=True)
+# Verbs that no family covers although a shorter suffix matches (-cevoir is covered)
+UNRULED_SUFFIXES = ('oir', 'oudre', 'quérir', 'mourir', 'bouillir', 'fuir', 'vêtir', 'gésir', 'ouïr', 'faillir')
+# finir-type verbs whose suffix matches a 3rd group family
+SECOND_GROUP = frozenset(('asservir', 'répartir', 'impartir', 'assortir', 'désassortir', 'réassortir'))
+# Verbs whose rows no table describes
+IRREGULAR_VERBS = frozenset(('aller', 'raller', 'avoir', 'être', 'naître', 'renaître'))
+# Clitics before the verb ("s'en aller", "s'y prendre"), which no rule places
+CLITICS = ('en ', 'y ')
+# Defective verbs a family would fill in completely (no passé simple for
+# paître, only a few forms of poindre and sourdre) and saillir, which is
+# not an -aillir verb in its "gush out" sense
+DEFECTIVE_VERBS = frozenset(('paître', 'poindre', 'sourdre', 'saillir'))
+# Verbs that only exist in the pronominal form ("se souvenir")
+PRONOMINAL_ONLY = frozenset(('souvenir',))
+
+# -eler/-eter verbs taking è instead of a doubled consonant
+E_GRAVE_ELER_ETER = frozenset((
+    'acheter', 'racheter', 'bégueter', 'corseter', 'crocheter', 'fileter', 'fureter', 'haleter',
+    'celer', 'déceler', 'receler', 'ciseler', 'démanteler', 'écarteler', 'encasteler', 'geler',
+    'dégeler', 'congeler', 'surgeler', 'regeler', 'marteler', 'modeler', 'peler',
+))
+# Future stems that no spelling rule gives
+FUTURE_STEMS = {'envoyer': 'enverr', 'renvoyer': 'renverr'}
+# Verbs conjugated with être (pronominal verbs always are)
+ETRE_VERBS = frozenset((
+    'aller', 'arriver', 'advenir', 'apparaître', 'décéder', 'descendre', 'devenir', 'échoir',
+    'entrer', 'intervenir', 'monter', 'mourir', 'naître', 'partir', 'parvenir', 'passer', 'provenir',
+    'redescendre', 'redevenir', 'remonter', 'renaître', 'rentrer', 'repartir', 'ressortir',
+    'rester', 'retomber', 'retourner', 'revenir', 'sortir', 'survenir', 'tomber', 'venir',
+))
+# Pronominal verbs whose pronoun is an indirect object: the participle stays
+# invariable with être ("elle s'est dit", "ils se sont parlé")
+INVARIABLE_PARTICIPLES = frozenset((
+    'acheter', 'agir', 'appartenir', 'complaire', 'convenir', 'déplaire', 'dire', 'écrire', 'imaginer', 'mentir',
+    'nuire', 'parler', 'permettre', 'plaire', 'raconter', 'ressembler', 'répondre', 'rire', 'sourire',
+    'succéder', 'suffire', 'téléphoner',
+))
+# Weather verbs: third person singular only
+IMPERSONAL_VERBS = frozenset(('neiger', 'grêler', 'bruiner', 'venter', 'brumer', 'verglacer'))
+
+# Auxiliary forms used by the compound tenses
+AUXILIARY_FORMS = {
+    'avoir': {
+        'Present': ('ai', 'as', 'a', 'avons', 'avez', 'ont'),
+        'Imparfait': ('avais', 'avais', 'avait', 'avions', 'aviez', 'avaient'),
+        'PasseSimple': ('eus', 'eus', 'eut', 'eûmes', 'eûtes', 'eurent'),
+        'FuturSimple': ('aurai', 'auras', 'aura', 'aurons', 'aurez', 'auront'),
+        'SubjonctifPresent': ('aie', 'aies', 'ait', 'ayons', 'ayez', 'aient'),
+        'SubjonctifImparfait': ('eusse', 'eusses', 'eût', 'eussions', 'eussiez', 'eussent'),
+        'ConditionnelPresent': ('aurais', 'aurais', 'aurait', 'aurions', 'auriez', 'auraient'),
+        'Imperatif': ('', 'aie', '', 'ayons', 'ayez', ''),
+    },
+    'être': {
+        'Present': ('suis', 'es', 'est', 'sommes', 'êtes', 'sont'),
+        'Imparfait': ('étais', 'étais', 'était', 'étions', 'étiez', 'étaient'),
+        'PasseSimple': ('fus', 'fus', 'fut', 'fûmes', 'fûtes', 'furent'),
+        'FuturSimple': ('serai', 'seras', 'sera', 'serons', 'serez', 'seront'),
+        'SubjonctifPresent': ('sois', 'sois', 'soit', 'soyons', 'soyez', 'soient'),
+        'SubjonctifImparfait': ('fusse', 'fusses', 'fût', 'fussions', 'fussiez', 'fussent'),
+        'ConditionnelPresent': ('serais', 'serais', 'serait', 'serions', 'seriez', 'seraient'),
+        'Imperatif': ('', 'sois', '', 'soyons', 'soyez', ''),
+    },
+}
+# Compound tense -> simple tense of the auxiliary
+COMPOUND_TENSES = {
+    'PasseCompose': 'Present',
+    'PlusQueParfait': 'Imparfait',
+    'PasseAnterieur': 'PasseSimple',
+    'FuturAnterieur': 'FuturSimple',
+    'SubjonctifPasse': 'SubjonctifPresent',
+    'SubjonctifPlusQueParfait': 'SubjonctifImparfait',
+    'ConditionnelPasse': 'ConditionnelPresent',
+    'ConditionnelPasseII': 'SubjonctifImparfait',
+    'ImperatifPasse': 'Imperatif',
+}
+# Agreement markers after an être participle, persons 1-6
+AGREEMENT = ('(e)', '(e)', '(e)', '(e)s', '(e)(s)', '(e)s')
+AGREEMENT_S = ('(e)', '(e)', '(e)', '(es)', '(e(s))', '(es)')
+
+# Tenses of a record, in corpus order
+RECORD_TENSES = (
+    'Present', 'Imparfait', 'PasseSimple', 'FuturSimple',
+    'PasseCompose', 'PlusQueParfait', 'PasseAnterieur', 'FuturAnterieur',
+    'SubjonctifPresent', 'SubjonctifImparfait', 'SubjonctifPasse', 'SubjonctifPlusQueParfait',
+    'ConditionnelPresent', 'ConditionnelPasse', 'ConditionnelPasseII',
+    'Imperatif', 'ImperatifPasse',
+)
+
+
+def split_reflexive(infinitive):
+    """Return (infinitive without "se "/"s'", whether it was pronominal)"""
+    for prefix in REFLEXIVE_PREFIXES:
+        if infinitive.startswith(prefix):
+            return infinitive[len(prefix):], True
+    return infinitive, False
+
+
+def _elides(word):
+    first = word[:1]
+    if first == 'h':
+        return not word.startswith(ASPIRATED_H)
+    return first in VOWELS
+
+
+def with_pronoun(pronoun, form):
+    """Return form after a pronoun, eliding me/te/se before a vowel or mute h"""
+    if not form:
+        return ''
+    if pronoun in ('me', 'te', 'se') and _elides(form):
+        return f"{pronoun[0]}'{form}"
+    return f"{pronoun} {form}"
+
+
+def reflexive_infinitive(infinitive):
+    """Return the pronominal form of an infinitive ("se laver", "s'habiller")"""
+    return with_pronoun('se', infinitive)
+
+
+def rule_for(infinitive):
+    """Return the rule conjugating an infinitive: 'er', a FAMILIES suffix or None"""
+    verb, pronominal = split_reflexive(normalize_infinitive(infinitive))
+    if verb in IRREGULAR_VERBS or verb in DEFECTIVE_VERBS or verb.startswith(CLITICS):
+        return None
+    if verb in PRONOMINAL_ONLY and not pronominal:
+        return None
+    if verb.endswith('er'):
+        return 'er'
+    if verb in SECOND_GROUP:
+        return 'ir'
+    if verb.endswith(UNRULED_SUFFIXES) and not verb.endswith('cevoir'):
+        return None
+    for suffix in FAMILY_SUFFIXES:
+        if verb.endswith(suffix):
+            return suffix
+    return None
+
+
+def auxiliary_for(infinitive):
+    """Return 'être' or 'avoir' for an infinitive"""
+    verb, pronominal = split_reflexive(normalize_infinitive(infinitive))
+    return 'être' if pronominal or verb in ETRE_VERBS else 'avoir'
+
+
+def _soft(stem, ending):
+    """Keep c and g soft before a and o (plaçons, mangeons)"""
+    if ending[:1] in ('a', 'â', 'o'):
+        if stem.endswith('c'):
+            return stem[:-1] + 'ç'
+        if stem.endswith('g'):
+            return stem + 'e'
+    return stem
+
+
+def _strong_stems(verb, stem):
+    """Return (stems before a mute e, future stems) of an -er verb"""
+    if stem.endswith('ay'):
+        return (stem[:-1] + 'i', stem), (stem[:-1] + 'ier', stem + 'er')
+    if stem.endswith(('oy', 'uy')):
+        strong = stem[:-1] + 'i'
+        return (strong,), (FUTURE_STEMS.get(verb, strong + 'er'),)
+    # Last vowel of the stem and the consonants after it
+    end = len(stem)
+    while end and stem[end - 1] in CONSONANTS:
+        end -= 1
+    cluster = stem[end:]
+    vowel = stem[end - 1:end]
+    if vowel == 'é' and cluster:
+        # Future and conditional keep é (céderai)
+        strong = stem[:end - 1] + 'è' + cluster
+        return (strong,), (stem + 'er',)
+    if vowel == 'e' and (len(cluster) == 1 or (len(cluster) == 2 and cluster[1] in 'lr'
+                                               and cluster[0] not in 'lr')):
+        if cluster in ('l', 't') and verb not in E_GRAVE_ELER_ETER:
+            strong = stem + cluster
+        else:
+            strong = stem[:end - 1] + 'è' + cluster
+        return (strong,), (strong + 'er',)
+    return (stem,), (FUTURE_STEMS.get(verb, stem + 'er'),)
+
+
+def _variants(stems, ending, soften=False):
+    return ', '.join((_soft(stem, ending) if soften else stem) + ending for stem in stems)
+
+
+def _first_group(verb):
+    """Return (simple tenses, past participle, present participle) of an -er verb"""
+    stem = verb[:-2]
+    strong, future = _strong_stems(verb, stem)
+    weak = (stem,)
+    present = tuple(_variants(strong if ending in ('e', 'es', 'ent') else weak, ending, True)
+                    for ending in ('e', 'es', 'e', 'ons', 'ez', 'ent'))
+    tenses = {
+        'Present': present,
+        'Imparfait': tuple(_variants(weak, ending, True) for ending in IMPARFAIT),
+        'PasseSimple': tuple(_variants(weak, ending, True) for ending in PASSE_SIMPLE['a']),
+        'FuturSimple': tuple(_variants(future, ending) for ending in FUTUR),
+        'SubjonctifPresent': tuple(_variants(strong if person in (0, 1, 2, 5) else weak, ending)
+                                   for person, ending in enumerate(SUBJONCTIF_PRESENT)),
+        'SubjonctifImparfait': tuple(_variants(weak, ending, True) for ending in SUBJONCTIF_IMPARFAIT['a']),
+        'ConditionnelPresent': tuple(_variants(future, ending) for ending in IMPARFAIT),
+    }
+    return tenses, stem + 'é', _soft(stem, 'ant') + 'ant'
+
+
+def _family(verb, suffix):
+    """Return (simple tenses, past participle, present participle) from a family table"""
+    prefix = verb[:-len(suffix)]
+    singular, plural, third, (simple, vowel), future, participle = FAMILIES[suffix]
+    plural, third, future = prefix + plural, prefix + third, prefix + future
+    tenses = {
+        'Present': tuple(prefix + form for form in singular) + (plural + 'ons', plural + 'ez', third + 'ent'),
+        'Imparfait': tuple(plural + ending for ending in IMPARFAIT),
+        'PasseSimple': tuple(prefix + simple + ending for ending in PASSE_SIMPLE[vowel]),
+        'FuturSimple': tuple(future + ending for ending in FUTUR),
+        'SubjonctifPresent': tuple((plural if person in (3, 4) else third) + ending
+                                   for person, ending in enumerate(SUBJONCTIF_PRESENT)),
+        'SubjonctifImparfait': tuple(prefix + simple + ending for ending in SUBJONCTIF_IMPARFAIT[vowel]),
+        'ConditionnelPresent': tuple(future + ending for ending in IMPARFAIT),
+    }
+    return tenses, prefix + participle, plural + 'ant'
+
+
+def _imperative(present):
+    """Return the 6-slot imperative: tu, nous and vous of the present"""
+    second = present[1]
+    if second.endswith('es'):
+        # mange, ouvre: -es loses its s
+        second = ', '.join(form[:-1] if form.endswith('es') else form for form in second.split(', '))
+    return ('', second, '', present[3], present[4], '')
+
+
+def _imperative_form(form, pronoun=''):
+    """Return "mange !" or, for pronominal verbs, "lève-toi !" (each spelling of "paie, paye")"""
+    if not form:
+        return ''
+    if pronoun:
+        form = ', '.join(f"{variant}-{pronoun}" for variant in form.split(', '))
+    return f"{form} !"
+
+
+def compound_forms(tense, participle, auxiliary='avoir', pronominal=False, agreement=True):
+    """Return the 6 forms of a compound tense
+
+    Participles of être verbs carry (e)/(s) agreement markers unless
+    agreement is false (se dire: "je me suis dit"), and pronominal verbs put
+    the reflexive pronoun before the auxiliary.
+    """
+    auxiliary_forms = AUXILIARY_FORMS[auxiliary][COMPOUND_TENSES[tense]]
+    if auxiliary == 'être' and agreement:
+        agreement = AGREEMENT_S if participle.endswith(('s', 'x')) else AGREEMENT
+        participles = tuple(participle + marker for marker in agreement)
+    else:
+        participles = (participle,) * PERSONS
+    forms = []
+    for person, (auxiliary_form, form) in enumerate(zip(auxiliary_forms, participles)):
+        if not auxiliary_form:
+            forms.append('')
+        elif tense == 'ImperatifPasse':
+            forms.append(f"{auxiliary_form} {form} !")
+        elif pronominal:
+            forms.append(with_pronoun(REFLEXIVE_PRONOUNS[person], f"{auxiliary_form} {form}"))
+        else:
+            forms.append(f"{auxiliary_form} {form}")
+    return forms
+
+
+def conjugate(infinitive, auxiliary=None):
+    """Return a corpus record for infinitive built from the conjugation rules
+
+    auxiliary overrides auxiliary_for(). Raises ValueError when no rule
+    covers the verb (aller, faire, -oir verbs, ...).
+    """
+    infinitive = normalize_infinitive(infinitive)
+    verb, pronominal = split_reflexive(infinitive)
+    rule = rule_for(infinitive)
+    if rule is None:
+        raise ValueError(f"No conjugation rule for {infinitive!r}")
+    if rule == 'er':
+        tenses, participle, present_participle = _first_group(verb)
+    else:
+        tenses, participle, present_participle = _family(verb, rule)
+    tenses['Imperatif'] = _imperative(tenses['Present'])
+    auxiliary = normalize_infinitive(auxiliary) if auxiliary else auxiliary_for(infinitive)
+    if auxiliary not in AUXILIARY_FORMS:
+        raise ValueError(f"Unknown auxiliary {auxiliary!r}")
+
+    if verb in IMPERSONAL_VERBS:
+        tenses = {tense: ('', '', forms[2], '', '', '') for tense, forms in tenses.items()}
+        tenses['Imperatif'] = ('',) * PERSONS
+
+    record = {
+        'Infinitif': infinitive,
+        'ParticipePasse': participle,
+        'ParticipePresent': with_pronoun('se', present_participle) if pronominal else present_participle,
+        'Auxiliaire': auxiliary,
+    }
+    if pronominal:
+        record['formeNonPronominale'] = verb
+    else:
+        # Impersonal verbs have no pronominal form ("se neiger")
+        record['FormePronominale'] = '' if verb in IMPERSONAL_VERBS else reflexive_infinitive(verb)
+    for tense in RECORD_TENSES:
+        if tense in COMPOUND_TENSES:
+            if pronominal and tense == 'ImperatifPasse':
+                continue
+            forms = compound_forms(tense, participle, auxiliary, pronominal,
+                                   agreement=not (pronominal and verb in INVARIABLE_PARTICIPLES))
+            if verb in IMPERSONAL_VERBS:
+                forms = ['', '', forms[2], '', '', '']
+            record[tense] = forms
+        elif tense == 'Imperatif':
+            record[tense] = [_imperative_form(form, pronoun if pronominal else '')
+                             for form, pronoun in zip(tenses[tense], IMPERATIVE_PRONOUNS)]
+        elif pronominal:
+            record[tense] = [with_pronoun(pronoun, form) for pronoun, form in zip(REFLEXIVE_PRONOUNS, tenses[tense])]
+        else:
+            record[tense] = list(tenses[tense])
+    return record
+
+
+def benchmark(infinitives, rounds=20):
+    """Return verbs conjugated per second over infinitives"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for infinitive in infinitives:
+            conjugate(infinitive)
+    return rounds * len(infinitives) / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    args = [arg for arg in sys.argv[1:] if arg != '--bench']
+    for infinitive in args:
+        try:
+            print(json.dumps(conjugate(infinitive), ensure_ascii=False, indent=2))
+        except ValueError as e:
+            print(f"✗ {e}")
+    if '--bench' in sys.argv:
+        sample = ['aimer', 'manger', 'placer', 'céder', 'appeler', 'acheter', 'employer', 'payer',
+                  'finir', 'vendre', 'partir', 'venir', 'ouvrir', 'conduire', 'recevoir', 'se lever']
+        print(f"✓ {benchmark(sample):,.0f} verbs/s")
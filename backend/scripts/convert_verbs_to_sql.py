@@ -2,8 +2,9 @@
 """
 Convert verb JSONB data to SQL INSERT statements matching the actual database schema.
 """
-import json
-import sys
+import argparse
+
+from sql_emitter import Batching, add_batching_arguments, open_sql, write_lines, write_set_import
 
 # Verb data from the original SQL file
 verbs_data = {
@@ -15,111 +16,18 @@ verbs_data = {
     "continuer": {"Infinitif": "Continuer", "ParticipePasse": "Continué", "ParticipePresent": "Continuant", "Auxiliaire": "avoir", "Present": ["Continue", "Continues", "Continue", "Continuons", "Continuez", "Continuent"], "Imparfait": ["Continuais", "Continuais", "Continuait", "Continuions", "Continuiez", "Continuaient"], "PasseSimple": ["Continuai", "Continuas", "Continua", "Continuâmes", "Continuâtes", "Continuèrent"], "FuturSimple": ["Continuerai", "Continueras", "Continuera", "Continuerons", "Continuerez", "Continueront"], "PasseCompose": ["ai continué", "as continué", "a continué", "avons continué", "avez continué", "ont continué"], "PlusQueParfait": ["avais continué", "avais continué", "avait continué", "avions continué", "aviez continué", "avaient continué"], "PasseAnterieur": ["eus continué", "eus continué", "eut continué", "eûmes continué", "eûtes continué", "eurent continué"], "FuturAnterieur": ["aurai continué", "auras continué", "aura continué", "aurons continué", "aurez continué", "auront continué"], "SubjonctifPresent": ["Continue", "Continues", "Continue", "Continuions", "Continuiez", "Continuent"], "SubjonctifImparfait": ["Continuasse", "Continuasses", "Continuât", "Continuassions", "Continuassiez", "Continuassent"], "SubjonctifPasse": ["aie continué", "aies continué", "ait continué", "ayons continué", "ayez continué", "aient continué"], "SubjonctifPlusQueParfait": ["eusse continué", "eusses continué", "eût continué", "eussions continué", "eussiez continué", "eussent continué"], "ConditionnelPresent": ["Continuerais", "Continuerais", "Continuerait", "Continuerions", "Continueriez", "Continueraient"], "ConditionnelPasse": ["aurais continué", "aurais continué", "aurait continué", "aurions continué", "auriez continué", "auraient continué"], "ConditionnelPasseII": ["eusse continué", "eusses continué", "eût continué", "eussions continué", "eussiez continué", "eussent continué"], "Imperatif": ["", "Continue !", "", "Continuons !", "Continuez !", ""], "ImperatifPasse": ["", "aie continué !", "", "ayons continué !", "ayez continué !", ""]}
 }
 
-def escape_sql(text):
-    """Escape single quotes for SQL."""
-    if text is None:
-        return 'NULL'
-    return "'" + str(text).replace("'", "''") + "'"
-
-def generate_verb_insert(infinitive, data):
-    """Generate INSERT for verbs table."""
-    past_participle = data.get('ParticipePasse', '')
-    present_participle = data.get('ParticipePresent', '')
-    auxiliary = data.get('Auxiliaire', '')
-    pronominal_form = data.get('FormePronominale', '')
-    
-    return f"""INSERT INTO verbs (infinitive, past_participle, present_participle, auxiliary, pronomininal_form)
-VALUES ({escape_sql(infinitive)}, {escape_sql(past_participle)}, {escape_sql(present_participle)}, {escape_sql(auxiliary)}, {escape_sql(pronominal_form)});
-"""
-
-def generate_conjugation_insert(infinitive, data):
-    """Generate INSERT for verb_conjugations table."""
-    # Map JSONB keys to database columns
-    conjugations = []
-    
-    # Present
-    present = data.get('Present', [''] * 6)
-    conjugations.extend([f"present_{i+1} = {escape_sql(v)}" for i, v in enumerate(present)])
-    
-    # Imparfait
-    imparfait = data.get('Imparfait', [''] * 6)
-    conjugations.extend([f"imparfait_{i+1} = {escape_sql(v)}" for i, v in enumerate(imparfait)])
-    
-    # Passé Simple
-    passe_simple = data.get('PasseSimple', [''] * 6)
-    conjugations.extend([f"passe_simple_{i+1} = {escape_sql(v)}" for i, v in enumerate(passe_simple)])
-    
-    # Futur Simple
-    futur_simple = data.get('FuturSimple', [''] * 6)
-    conjugations.extend([f"futur_simple_{i+1} = {escape_sql(v)}" for i, v in enumerate(futur_simple)])
-    
-    # Passé Composé
-    passe_compose = data.get('PasseCompose', [''] * 6)
-    conjugations.extend([f"passe_compose_{i+1} = {escape_sql(v)}" for i, v in enumerate(passe_compose)])
-    
-    # Plus-que-Parfait
-    plus_que_parfait = data.get('PlusQueParfait', [''] * 6)
-    conjugations.extend([f"plus_que_parfait_{i+1} = {escape_sql(v)}" for i, v in enumerate(plus_que_parfait)])
-    
-    # Passé Antérieur
-    passe_anterieur = data.get('PasseAnterieur', [''] * 6)
-    conjugations.extend([f"passe_anterieur_{i+1} = {escape_sql(v)}" for i, v in enumerate(passe_anterieur)])
-    
-    # Futur Antérieur
-    futur_anterieur = data.get('FuturAnterieur', [''] * 6)
-    conjugations.extend([f"futur_anterieur_{i+1} = {escape_sql(v)}" for i, v in enumerate(futur_anterieur)])
-    
-    # Subjonctif Présent
-    subj_present = data.get('SubjonctifPresent', [''] * 6)
-    conjugations.extend([f"subjonctif_present_{i+1} = {escape_sql(v)}" for i, v in enumerate(subj_present)])
-    
-    # Subjonctif Imparfait
-    subj_imparfait = data.get('SubjonctifImparfait', [''] * 6)
-    conjugations.extend([f"subjonctif_imparfait_{i+1} = {escape_sql(v)}" for i, v in enumerate(subj_imparfait)])
-    
-    # Subjonctif Passé
-    subj_passe = data.get('SubjonctifPasse', [''] * 6)
-    conjugations.extend([f"subjonctif_passe_{i+1} = {escape_sql(v)}" for i, v in enumerate(subj_passe)])
-    
-    # Subjonctif Plus-que-Parfait
-    subj_pqp = data.get('SubjonctifPlusQueParfait', [''] * 6)
-    conjugations.extend([f"subjonctif_plus_que_parfait_{i+1} = {escape_sql(v)}" for i, v in enumerate(subj_pqp)])
-    
-    # Conditionnel Présent
-    cond_present = data.get('ConditionnelPresent', [''] * 6)
-    conjugations.extend([f"conditionnel_present_{i+1} = {escape_sql(v)}" for i, v in enumerate(cond_present)])
-    
-    # Conditionnel Passé
-    cond_passe = data.get('ConditionnelPasse', [''] * 6)
-    conjugations.extend([f"conditionnel_passe_{i+1} = {escape_sql(v)}" for i, v in enumerate(cond_passe)])
-    
-    # Conditionnel Passé II
-    cond_passe_ii = data.get('ConditionnelPasseII', [''] * 6)
-    conjugations.extend([f"conditionnel_passe_ii_{i+1} = {escape_sql(v)}" for i, v in enumerate(cond_passe_ii)])
-    
-    # Impératif
-    imperatif = data.get('Imperatif', [''] * 6)
-    conjugations.extend([f"imperatif_{i+1} = {escape_sql(v)}" for i, v in enumerate(imperatif)])
-    
-    # Impératif Passé
-    imp_passe = data.get('ImperatifPasse', [''] * 6)
-    conjugations.extend([f"imperatif_passe_{i+1} = {escape_sql(v)}" for i, v in enumerate(imp_passe)])
-    
-    return f"""INSERT INTO verb_conjugations (verb_id, {', '.join([c.split(' = ')[0] for c in conjugations])})
-SELECT id, {', '.join([c.split(' = ')[1] for c in conjugations])}
-FROM verbs WHERE infinitive = {escape_sql(infinitive)};
-"""
-
 def main():
-    print("-- Auto-generated SQL to add missing verbs")
-    print("-- Generated from convert_verbs_to_sql.py")
-    print()
-    
-    for infinitive, data in verbs_data.items():
-        print(f"-- Adding {infinitive}")
-        print(generate_verb_insert(infinitive, data))
-        print(generate_conjugation_insert(infinitive, data))
-        print()
+    parser = argparse.ArgumentParser(description="Print SQL adding the embedded verbs")
+    add_batching_arguments(parser)
+    args = parser.parse_args()
+
+    with open_sql('-') as out:
+        write_lines(out, [
+            "-- Auto-generated SQL to add missing verbs",
+            "-- Generated from convert_verbs_to_sql.py",
+            "",
+        ])
+        write_set_import(out, verbs_data.values(), on_conflict=None, batching=Batching.from_args(args))
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diff two conjugation corpora and write the minimal SQL migration between them
+
+Snapshots (conjugation_backup.json, conjugation.json,
+conjugation_updated.json, ...) are aligned by normalized infinitive with a
+hash join and compared on the database rows they produce (verb_schema.py),
+so key order and NFD vs NFC spellings are not changes. Changed verbs are
+reported down to the (tense, person) cell and migrated with targeted
+UPDATEs; added verbs are upserted and removed verbs deleted.
+
+Usage:
+    python3 corpus_diff.py conjugation_backup.json conjugation.json
+    python3 corpus_diff.py old.json new.json -o migration.sql [--limit 50]
+    psql -v ON_ERROR_STOP=1 -U verber_user -d verber_db -f migration.sql
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from sql_emitter import open_sql, sql_literal, unique_verbs, write_lines, write_set_import, write_verb_deletes
+from verb_corpus import PERSONS, load_verbs
+from verb_index import normalize_infinitive
+from verb_schema import CONJUGATION_COLUMNS, TENSE_COLUMNS, VERB_COLUMNS, VERB_FIELDS, conjugation_row, verb_row
+
+# Column -> corpus location used in the summary, persons numbered from 1
+COLUMN_LABELS = dict(zip(VERB_COLUMNS, (key for key, _ in VERB_FIELDS)))
+COLUMN_LABELS.update(zip(CONJUGATION_COLUMNS, (
+    f"{key}[{person}]" for key, _ in TENSE_COLUMNS for person in range(1, PERSONS + 1))))
+
+
+class CorpusDiff:
+    """Differences between two corpora
+
+    added: records only in the new corpus, in its order
+    removed: infinitives only in the old corpus, in its order
+    changed: (infinitive, verb changes, conjugation changes) in new corpus
+        order, where changes are (column, old value, new value)
+    """
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.unchanged = 0
+
+    @property
+    def cell_count(self):
+        return sum(len(cells) for _, _, cells in self.changed)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+def _changes(columns, old_row, new_row):
+    return [(column, old, new) for column, old, new in zip(columns, old_row, new_row) if old != new]
+
+
+def diff_corpora(old_verbs, new_verbs):
+    """Return the CorpusDiff from old_verbs to new_verbs
+
+    The old corpus is indexed by infinitive and the new one streamed
+    against it. Identical records are skipped without building their rows;
+    the others are compared as whole rows and then cell by cell.
+    """
+    old_records = {normalize_infinitive(verb_data.get('Infinitif', '')): verb_data
+                   for verb_data in unique_verbs(old_verbs)}
+
+    diff = CorpusDiff()
+    seen = set()
+    for verb_data in unique_verbs(new_verbs):
+        infinitive = normalize_infinitive(verb_data.get('Infinitif', ''))
+        seen.add(infinitive)
+        old_data = old_records.get(infinitive)
+        if old_data is None:
+            diff.added.append(verb_data)
+            continue
+        if old_data == verb_data:
+            diff.unchanged += 1
+            continue
+        old_row, row = verb_row(old_data), verb_row(verb_data)
+        old_conjugations, conjugations = conjugation_row(old_data), conjugation_row(verb_data)
+        if row == old_row and conjugations == old_conjugations:
+            # Only key order or Unicode normalization differ
+            diff.unchanged += 1
+            continue
+        diff.changed.append((infinitive,
+                             _changes(VERB_COLUMNS, old_row, row),
+                             _changes(CONJUGATION_COLUMNS, old_conjugations, conjugations)))
+    diff.removed = [infinitive for infinitive in old_records if infinitive not in seen]
+    return diff
+
+
+def _set_list(changes):
+    return ', '.join(f"{column} = {sql_literal(new)}" for column, _, new in changes)
+
+
+def write_migration(out, diff):
+    """Write the SQL applying diff in one transaction"""
+    write_lines(out, [
+        f"-- {len(diff.added)} verbs added, {len(diff.changed)} changed ({diff.cell_count} cells), "
+        f"{len(diff.removed)} removed",
+        "",
+    ])
+    if not diff:
+        return
+    write_lines(out, ["BEGIN;", ""])
+    write_verb_deletes(out, diff.removed)
+    for infinitive, verb_changes, cells in diff.changed:
+        where = sql_literal(infinitive)
+        if verb_changes:
+            write_lines(out, [f"UPDATE verbs SET {_set_list(verb_changes)} WHERE infinitive = {where};"])
+        if cells:
+            write_lines(out, [
+                f"UPDATE verb_conjugations SET {_set_list(cells)}",
+                f"FROM verbs WHERE verbs.id = verb_conjugations.verb_id AND verbs.infinitive = {where};",
+            ])
+    if diff.changed:
+        out.write("\n")
+    if diff.added:
+        write_set_import(out, diff.added)
+    write_lines(out, ["COMMIT;"])
+
+
+def _names(names, limit):
+    names = list(names)
+    text = ', '.join(names[:limit])
+    if len(names) > limit:
+        text += f", ... ({len(names) - limit} more)"
+    return text
+
+
+def print_summary(diff, old_name, new_name, limit=20, file=sys.stdout):
+    """Print a human-readable summary listing up to limit verbs per section"""
+    print(f"{old_name} -> {new_name}", file=file)
+    print(f"  {diff.unchanged} unchanged, {len(diff.added)} added, {len(diff.changed)} changed "
+          f"({diff.cell_count} cells), {len(diff.removed)} removed", file=file)
+    if diff.added:
+        print(f"  + {_names((verb_row(verb_data)[0] for verb_data in diff.added), limit)}", file=file)
+    if diff.removed:
+        print(f"  - {_names(diff.removed, limit)}", file=file)
+    for infinitive, verb_changes, cells in diff.changed[:limit]:
+        print(f"  ~ {infinitive}", file=file)
+        for column, old, new in (verb_changes + cells)[:limit]:
+            print(f"      {COLUMN_LABELS[column]}: {old!r} -> {new!r}", file=file)
+        hidden = len(verb_changes) + len(cells) - limit
+        if hidden > 0:
+            print(f"      ... ({hidden} more)", file=file)
+    if len(diff.changed) > limit:
+        print(f"  ~ ... ({len(diff.changed) - limit} more verbs)", file=file)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Diff two conjugation corpora and write the SQL migration")
+    parser.add_argument('old', help="corpus the database currently holds")
+    parser.add_argument('new', help="corpus to migrate to")
+    parser.add_argument('-o', '--output', help="write the migration SQL ('-' for stdout)")
+    parser.add_argument('--limit', type=int, default=20, help="verbs and cells listed per section (default: 20)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    diff = diff_corpora(load_verbs(args.old), load_verbs(args.new))
+    elapsed = time.perf_counter() - start
+    # Keep stdout clean when the SQL goes there
+    summary_file = sys.stderr if args.output == '-' else sys.stdout
+    print_summary(diff, os.path.basename(args.old), os.path.basename(args.new), args.limit, summary_file)
+    print(f"✓ Compared in {elapsed * 1000:.0f} ms", file=summary_file)
+
+    if args.output:
+        with open_sql(args.output) as f:
+            write_migration(f, diff)
+        if args.output != '-':
+            print(f"✓ Generated SQL file: {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Export verbs, verb_conjugations and sentences as COPY data files
+
+Writes one data file per table plus load.sql, a psql script that truncates
+the tables and loads every file with \\copy in a single transaction. Rows
+carry explicit ids, and the id sequences are reset after loading. With
+--format binary the verb tables are written by pgcopy.py with bigint ids,
+as GORM creates them (--id-size 4 for the SERIAL ids of the create_*.sql
+schemas), and sentences (JSONB and TEXT[] columns) stay in text format.
+
+Usage:
+    python3 export_copy.py [out_dir] [--format text|csv|binary] [--no-sentences] [--jobs N] [--id-size 4|8]
+    cd seed_copy && psql -v ON_ERROR_STOP=1 -U verber_user -d verber_db -f load.sql
+"""
+
+import argparse
+import os
+import time
+
+from generate_sentences import SENTENCE_COPY_COLUMNS, SENTENCES_TABLE_SQL, TARGET_SENTENCES, generate_copy_file
+from pgcopy import ID_FIELDS, ID_SIZE, write_binary_verbs
+from sql_emitter import COPY_EXTENSIONS, COPY_FORMATS, OUTPUT_BUFFER_SIZE, open_sql, write_copy_driver, write_copy_verbs
+from verb_corpus import iter_verbs
+from verb_schema import CONJUGATION_COPY_COLUMNS, VERB_COPY_COLUMNS
+
+
+def export_copy(out_dir='seed_copy', fmt='text', sentences=True, corpus_path=None, jobs=None,
+                id_size=ID_SIZE):
+    """Write the COPY data files and load.sql into out_dir; returns the verb count"""
+    os.makedirs(out_dir, exist_ok=True)
+    extension = COPY_EXTENSIONS[fmt]
+    verbs_file = f"verbs.{extension}"
+    conjugations_file = f"verb_conjugations.{extension}"
+    sentence_fmt = 'text' if fmt == 'binary' else fmt
+    sentences_file = f"sentences.{COPY_EXTENSIONS[sentence_fmt]}"
+
+    if fmt == 'binary':
+        with open(os.path.join(out_dir, verbs_file), 'wb', buffering=OUTPUT_BUFFER_SIZE) as verbs_out, \
+                open(os.path.join(out_dir, conjugations_file), 'wb', buffering=OUTPUT_BUFFER_SIZE) as conjugations_out:
+            verb_count = write_binary_verbs(verbs_out, conjugations_out, iter_verbs(corpus_path), id_size)
+    else:
+        with open_sql(os.path.join(out_dir, verbs_file)) as verbs_out, \
+                open_sql(os.path.join(out_dir, conjugations_file)) as conjugations_out:
+            verb_count = write_copy_verbs(verbs_out, conjugations_out, iter_verbs(corpus_path), fmt, jobs)
+    print(f"✓ Wrote {verb_count} verbs: {verbs_file}, {conjugations_file}")
+
+    loads = [
+        ('verbs', VERB_COPY_COLUMNS, verbs_file),
+        ('verb_conjugations', CONJUGATION_COPY_COLUMNS, conjugations_file),
+    ]
+    truncate = ['verb_conjugations', 'verbs']
+    preamble = []
+    if sentences:
+        generate_copy_file(os.path.join(out_dir, sentences_file), TARGET_SENTENCES, sentence_fmt)
+        loads.append(('sentences', SENTENCE_COPY_COLUMNS, sentences_file, sentence_fmt))
+        truncate.append('sentences')
+        preamble = SENTENCES_TABLE_SQL + [""]
+
+    with open_sql(os.path.join(out_dir, 'load.sql')) as f:
+        write_copy_driver(f, loads, fmt, preamble=preamble, truncate=truncate)
+    return verb_count
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Export seed data as COPY files with a \\copy load script")
+    parser.add_argument('out_dir', nargs='?', default='seed_copy')
+    parser.add_argument('--format', choices=COPY_FORMATS + ('binary',), default='text',
+                        help="COPY format (default: text)")
+    parser.add_argument('--no-sentences', action='store_true', help="only export verbs and conjugations")
+    parser.add_argument('--jobs', type=int, metavar='N', help="format verbs in N processes (text and CSV)")
+    parser.add_argument('--id-size', type=int, choices=sorted(ID_FIELDS), default=ID_SIZE,
+                        help=f"binary id width in bytes (default: {ID_SIZE}, 4 for SERIAL ids)")
+    args = parser.parse_args()
+    if args.jobs and args.format == 'binary':
+        parser.error("--jobs only applies to --format text and csv")
+
+    start = time.perf_counter()
+    export_copy(args.out_dir, args.format, sentences=not args.no_sentences, jobs=args.jobs,
+                id_size=args.id_size)
+    print(f"✓ Generated COPY files in {args.out_dir}/ in {time.perf_counter() - start:.2f}s")
+    print("\nTo load, run:")
+    print(f"cd {args.out_dir} && psql -v ON_ERROR_STOP=1 -U verber_user -d verber_db -f load.sql")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reverse index from conjugated form to (infinitive, tense, person)
+
+Every cell of every tense is indexed under an accent- and case-insensitive
+key, with the imperative "!" dropped and agreement markers expanded, so
+"suis allé(e)" is found as "suis alle", "suis allée" and "Suis allé". Persons
+are numbered 1-6 as in the verb_conjugations columns. The index is built once
+per corpus version and cached in .corpus_cache/ (see verb_corpus.py).
+
+Usage:
+    from form_index import FormIndex
+    forms = FormIndex.for_corpus()
+    forms.lookup('conduis')
+    # [('conduire', 'Present', 1), ('conduire', 'Present', 2), ('conduire', 'Imperatif', 2)]
+
+    python3 form_index.py conduis "suis allée"
+"""
+
+import itertools
+import re
+import sys
+import time
+import unicodedata
+
+from verb_corpus import DEFAULT_CORPUS_PATH, TENSE_KEYS, load_verbs, read_cached, write_cached
+from verb_index import normalize_infinitive
+
+# Bumped when the indexed cells change, so older caches are not reused
+FORM_CACHE_SUFFIX = 'forms.v2.marshal'
+AGREEMENT_MARKER = re.compile(r'\((e|s)\)')
+# Older key a tense may be stored under
+TENSE_ALIASES = {'ConditionnelPasseII': 'ConditionnelPasseDeuxiemeForme'}
+# Persons (1-6) of the slots of a 3-slot imperative: tu, nous, vous
+IMPERATIVE_SLOTS = (2, 4, 5)
+
+
+def _accent_table():
+    """Return a str.translate table folding accented Latin letters to their base"""
+    table = {ord('’'): "'", ord('!'): None}
+    for code in range(0xC0, 0x250):
+        base = unicodedata.normalize('NFD', chr(code))[0]
+        if base != chr(code) and base.isascii():
+            table[code] = base
+    # Combining marks left over from decomposed input
+    for code in range(0x300, 0x370):
+        table[code] = None
+    return table
+
+
+ACCENT_TABLE = _accent_table()
+
+
+def normalize_form(form):
+    """Return the lookup key for a conjugated form"""
+    return ' '.join(form.casefold().translate(ACCENT_TABLE).split())
+
+
+def normalize_forms(forms):
+    """Return normalize_form() of each form, folding the whole batch at once"""
+    folded = '\n'.join(forms).casefold().translate(ACCENT_TABLE)
+    return [' '.join(key.split()) for key in folded.split('\n')]
+
+
+def expand_agreement(form):
+    """Return every spelling of a form written with (e)/(s) agreement markers"""
+    if '(' not in form:
+        return [form]
+    parts = AGREEMENT_MARKER.split(form)
+    if len(parts) == 1:
+        return [form]
+    # parts alternates literal text and optional letters
+    literals = parts[0::2]
+    optional = parts[1::2]
+    variants = []
+    for choice in itertools.product((False, True), repeat=len(optional)):
+        pieces = [literals[0]]
+        for used, letter, literal in zip(choice, optional, literals[1:]):
+            pieces.append(letter if used else '')
+            pieces.append(literal)
+        variants.append(''.join(pieces))
+    return variants
+
+
+def tense_cells(verb_data, tense):
+    """Yield (person, form) for the cells of a tense, aliased keys and 3-slot imperatives included"""
+    cells = verb_data.get(tense)
+    if cells is None and tense in TENSE_ALIASES:
+        cells = verb_data.get(TENSE_ALIASES[tense])
+    if not isinstance(cells, list):
+        return
+    if tense.startswith('Imperatif') and len(cells) == 3:
+        yield from zip(IMPERATIVE_SLOTS, cells)
+    else:
+        yield from enumerate(cells, 1)
+
+
+def build_form_map(verbs):
+    """Return {normalized form: [(infinitive, tense, person), ...]}"""
+    forms = {}
+    seen = set()
+    for verb_data in verbs:
+        infinitive = normalize_infinitive(verb_data.get('Infinitif', ''))
+        if infinitive in seen:
+            continue
+        seen.add(infinitive)
+        cell_entries = []
+        variants = []
+        for tense in TENSE_KEYS:
+            for person, form in tense_cells(verb_data, tense):
+                if form:
+                    for variant in expand_agreement(form):
+                        cell_entries.append((infinitive, tense, person))
+                        variants.append(variant)
+        for entry, key in zip(cell_entries, normalize_forms(variants)):
+            entries = forms.setdefault(key, [])
+            if entry not in entries:
+                entries.append(entry)
+    return forms
+
+
+class FormIndex:
+    """Map of normalized conjugated form to the cells that produce it"""
+
+    def __init__(self, forms):
+        self.forms = forms
+
+    @classmethod
+    def for_corpus(cls, path=None):
+        """Return the reverse index for a corpus file, building and caching it if needed"""
+        path = path or DEFAULT_CORPUS_PATH
+        forms = read_cached(path, FORM_CACHE_SUFFIX)
+        if forms is None:
+            forms = build_form_map(load_verbs(path))
+            write_cached(path, forms, FORM_CACHE_SUFFIX)
+        return cls(forms)
+
+    def __len__(self):
+        return len(self.forms)
+
+    def __contains__(self, form):
+        return normalize_form(form) in self.forms
+
+    def lookup(self, form):
+        """Return every (infinitive, tense, person) producing form"""
+        return [tuple(entry) for entry in self.forms.get(normalize_form(form), ())]
+
+    def is_ambiguous(self, form):
+        """Return True if form belongs to more than one verb"""
+        return len({entry[0] for entry in self.forms.get(normalize_form(form), ())}) > 1
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    forms = FormIndex.for_corpus()
+    print(f"{len(forms)} distinct forms indexed in {(time.perf_counter() - start) * 1000:.0f} ms")
+    for query in sys.argv[1:]:
+        matches = forms.lookup(query)
+        print(f"{query}: " + (', '.join(f"{inf} {tense} {person}" for inf, tense, person in matches) or '(none)'))
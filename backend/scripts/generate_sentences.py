@@ -5,9 +5,14 @@ Sentence Generator for French Verb Conjugation Practice
 Generates sentences with balanced tense distribution (50+ per tense)
 """
 
+import argparse
 import json
 import random
 
+from shadow_swap import shadow_table, write_swap_reload
+from sql_emitter import (COPY_FORMATS, Batching, add_batching_arguments, copy_line, open_sql, pg_array,
+                         write_lines, write_values_insert)
+
 # Target: 50 sentences minimum per tense
 # We'll generate enough sentences to cover all 17 tenses with 50+ each
 TARGET_SENTENCES = 1800
@@ -1773,8 +1778,21 @@ def generate_variations(base_sentences):
     
     return variations
 
-def generate_sql_file(output_file="populate_sentences_full.sql", target_count=900):
-    """Generate SQL file with sentences ensuring minimum 50 per tense"""
+# Sentences table, shared by the SQL file and the COPY load script
+SENTENCES_TABLE_SQL = [
+    "CREATE TABLE IF NOT EXISTS sentences (",
+    "    id SERIAL PRIMARY KEY,",
+    "    text TEXT NOT NULL,",
+    "    verbs JSONB NOT NULL,",
+    "    tenses TEXT[] NOT NULL,",
+    "    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,",
+    "    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+    ");",
+]
+SENTENCE_COPY_COLUMNS = ('id', 'text', 'verbs', 'tenses')
+
+def build_sentences(target_count=900):
+    """Return (sentences, tense counts) ensuring minimum 50 per tense"""
     
     # Collect all base sentences
     all_sentences = []
@@ -1815,53 +1833,94 @@ def generate_sql_file(output_file="populate_sentences_full.sql", target_count=90
             if tense in tense_counts:
                 tense_counts[tense] += 1
     
-    # Generate SQL
-    sql_lines = [
-        "-- Populate sentences table with French sentences for conjugation practice",
-        "-- Generated: 2025-10-31",
-        f"-- Total sentences: {len(all_sentences)}",
-        f"-- Tense distribution: {', '.join(f'{k}: {v}' for k, v in sorted(tense_counts.items()))}",
-        "",
-        "CREATE TABLE IF NOT EXISTS sentences (",
-        "    id SERIAL PRIMARY KEY,",
-        "    text TEXT NOT NULL,",
-        "    verbs JSONB NOT NULL,",
-        "    tenses TEXT[] NOT NULL,",
-        "    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,",
-        "    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
-        ");",
-        "",
-        "-- Clear existing data",
-        "TRUNCATE TABLE sentences RESTART IDENTITY CASCADE;",
-        "",
-        "-- Insert sentences",
-        "INSERT INTO sentences (text, verbs, tenses) VALUES"
-    ]
+    return all_sentences, tense_counts
+
+def print_distribution(tense_counts):
+    print(f"Tense distribution:")
+    for tense, count in sorted(tense_counts.items()):
+        print(f"  - {tense}: {count} sentences")
+
+def generate_sql_file(output_file="populate_sentences_full.sql", target_count=900, batching=None, swap=False):
+    """Generate SQL file with sentences ensuring minimum 50 per tense
+
+    With swap=True the sentences are loaded into a shadow table that replaces
+    the live one (see shadow_swap.py) instead of truncating it.
+    """
+    all_sentences, tense_counts = build_sentences(target_count)
+    distribution = ', '.join(f'{k}: {v}' for k, v in sorted(tense_counts.items()))
     
-    for i, sentence in enumerate(all_sentences):
-        verbs_json = json.dumps(sentence["verbs"], ensure_ascii=False)
-        tenses_array = "{" + ",".join(sentence["tenses"]) + "}"
-        
-        comma = "," if i < len(all_sentences) - 1 else ";"
-        sql_lines.append(
-            f"('{escape_sql_string(sentence['text'])}', '{escape_sql_string(verbs_json)}', '{tenses_array}'){comma}"
-        )
+    rows = (
+        f"('{escape_sql_string(sentence['text'])}', "
+        f"'{escape_sql_string(json.dumps(sentence['verbs'], ensure_ascii=False))}', "
+        f"'{escape_sql_string(pg_array(sentence['tenses']))}')"
+        for sentence in all_sentences
+    )
     
-    sql_lines.append("")
-    sql_lines.append(f"-- Total sentences inserted: {len(all_sentences)}")
-    sql_lines.append(f"-- Tense distribution: {', '.join(f'{k}: {v}' for k, v in sorted(tense_counts.items()))}")
+    with open_sql(output_file) as f:
+        write_lines(f, [
+            "-- Populate sentences table with French sentences for conjugation practice",
+            "-- Generated: 2025-10-31",
+            f"-- Total sentences: {len(all_sentences)}",
+            f"-- Tense distribution: {distribution}",
+            "",
+            *SENTENCES_TABLE_SQL,
+            "",
+        ])
+        if swap:
+            count = write_swap_reload(f, ('sentences',), lambda out: write_values_insert(
+                out, f"INSERT INTO {shadow_table('sentences')} (text, verbs, tenses) VALUES", rows,
+                batching=batching, label='sentences'))
+        else:
+            write_lines(f, [
+                "-- Clear existing data",
+                "TRUNCATE TABLE sentences RESTART IDENTITY CASCADE;",
+                "",
+                "-- Insert sentences",
+            ])
+            count = write_values_insert(f, "INSERT INTO sentences (text, verbs, tenses) VALUES", rows,
+                                        batching=batching, label='sentences')
+        write_lines(f, [
+            "",
+            f"-- Total sentences inserted: {count}",
+        ])
+        f.write(f"-- Tense distribution: {distribution}")
     
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_lines))
+    print(f"Generated SQL file with {count} sentences: {output_file}")
+    print_distribution(tense_counts)
+    return count
+
+def write_sentences_copy(out, sentences, fmt='text'):
+    """Write sentences as COPY data with ids numbered from 1"""
+    for sentence_id, sentence in enumerate(sentences, 1):
+        out.write(copy_line((
+            sentence_id,
+            sentence["text"],
+            json.dumps(sentence["verbs"], ensure_ascii=False),
+            pg_array(sentence["tenses"]),
+        ), fmt))
+    return len(sentences)
+
+def generate_copy_file(output_file="sentences.tsv", target_count=900, fmt='text'):
+    """Generate a COPY data file for the sentences table"""
+    all_sentences, tense_counts = build_sentences(target_count)
+    with open_sql(output_file) as f:
+        count = write_sentences_copy(f, all_sentences, fmt)
     
-    print(f"Generated SQL file with {len(all_sentences)} sentences: {output_file}")
-    print(f"Tense distribution:")
-    for tense, count in sorted(tense_counts.items()):
-        print(f"  - {tense}: {count} sentences")
-    return len(all_sentences)
+    print(f"Generated COPY file with {count} sentences: {output_file}")
+    print_distribution(tense_counts)
+    return count
 
 if __name__ == "__main__":
-    count = generate_sql_file(target_count=TARGET_SENTENCES)
+    parser = argparse.ArgumentParser(description="Generate practice sentences for the sentences table")
+    parser.add_argument('--copy', metavar='PATH', help="write COPY data to PATH instead of the SQL file")
+    parser.add_argument('--format', choices=COPY_FORMATS, default='text', help="COPY format (default: text)")
+    parser.add_argument('--swap', action='store_true',
+                        help="reload through a shadow table and a rename swap instead of TRUNCATE")
+    add_batching_arguments(parser, jobs=False)
+    args = parser.parse_args()
+    
+    if args.copy:
+        count = generate_copy_file(args.copy, target_count=TARGET_SENTENCES, fmt=args.format)
+    else:
+        count = generate_sql_file(target_count=TARGET_SENTENCES, batching=Batching.from_args(args), swap=args.swap)
     print(f"✓ Successfully generated {count} sentences")
-
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generate conjugations for a word list and stream them to JSON Lines
+
+Reads one infinitive per line (see missing_verbs.txt), drops duplicates and
+verbs the corpus already has (verb_index.py), and generates the rest with
+the model classifier and rule engine (verb_classifier.py) in a process
+pool. Each worker builds the classifier once; words are sent in chunks and
+results are written in word list order as they arrive, one JSON object per
+line:
+
+    {"infinitive": "séduire", "model": "réduire", "confidence": 1.0, "verb": {...}}
+    {"infinitive": "prévoir", "error": "Cannot derive 'prévoir' from ..."}
+
+Usage:
+    python3 generate_verbs.py missing_verbs.txt [-o new_verbs.jsonl] [--jobs N] [--include-existing]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sql_emitter import open_sql
+from verb_classifier import ModelClassifier
+from verb_corpus import read_word_list
+from verb_index import VerbIndex, normalize_infinitive
+
+CHUNK_SIZE = 256
+
+# Classifier of the current process (built by _load_classifier)
+_classifier = None
+
+
+def _load_classifier(corpus_path):
+    global _classifier
+    _classifier = ModelClassifier.for_corpus(corpus_path)
+
+
+def generate_chunk(infinitives):
+    """Return one result per infinitive; runs in a worker process"""
+    results = []
+    for infinitive in infinitives:
+        try:
+            verb_data, model, confidence = _classifier.generate(infinitive)
+        except ValueError as e:
+            results.append({'infinitive': infinitive, 'error': str(e)})
+            continue
+        results.append({'infinitive': infinitive, 'model': model,
+                        'confidence': round(confidence, 3), 'verb': verb_data})
+    return results
+
+
+def new_words(words, index=None):
+    """Return (words to generate, words skipped as duplicates or already in the index)"""
+    seen = set()
+    pending = []
+    skipped = []
+    for word in words:
+        key = normalize_infinitive(word)
+        if key in seen or (index is not None and key in index):
+            skipped.append(word)
+            continue
+        seen.add(key)
+        pending.append(word)
+    return pending, skipped
+
+
+def generate_verbs(infinitives, corpus_path=None, jobs=None):
+    """Yield a result dict per infinitive, in input order"""
+    jobs = jobs or os.cpu_count() or 1
+    chunks = [infinitives[start:start + CHUNK_SIZE] for start in range(0, len(infinitives), CHUNK_SIZE)]
+    if jobs == 1 or len(chunks) < 2:
+        _load_classifier(corpus_path)
+        for chunk in chunks:
+            yield from generate_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks)), initializer=_load_classifier,
+                             initargs=(corpus_path,)) as executor:
+        for results in executor.map(generate_chunk, chunks):
+            yield from results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate conjugations for a word list as JSON Lines")
+    parser.add_argument('words', help="word list, one infinitive per line")
+    parser.add_argument('-o', '--output', default='new_verbs.jsonl', help="JSON Lines output ('-' for stdout)")
+    parser.add_argument('--corpus', help="corpus to skip known verbs and find models in (default: conjugation.json)")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--include-existing', action='store_true', help="also generate verbs the corpus has")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    words = read_word_list(args.words)
+    index = None if args.include_existing else VerbIndex.for_corpus(args.corpus)
+    pending, skipped = new_words(words, index)
+
+    generated = failed = 0
+    # Keep stdout clean when the results go there
+    report = sys.stderr if args.output == '-' else sys.stdout
+    with open_sql(args.output) as out:
+        for result in generate_verbs(pending, args.corpus, args.jobs):
+            out.write(json.dumps(result, ensure_ascii=False))
+            out.write('\n')
+            if 'error' in result:
+                failed += 1
+                print(f"✗ {result['infinitive']}: {result['error']}", file=report)
+            else:
+                generated += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{len(words)} words: {generated} generated, {failed} failed, {len(skipped)} skipped "
+          f"(duplicates or already in the corpus) in {elapsed:.2f}s", file=report)
+    if args.output != '-':
+        print(f"✓ Wrote {args.output}", file=report)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
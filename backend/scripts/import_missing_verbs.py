@@ -2,12 +2,37 @@
 # -*- coding: utf-8 -*-
 """
 Import missing verbs into the database
+
+By default verbs already in the database are skipped and the rest are
+inserted with a constant number of round trips (see import_verbs()).
+
+With --upsert, existing verbs are updated in place (ON CONFLICT ... DO
+UPDATE) and every --batch-size verbs are committed on their own. After each
+commit a checkpoint (verbs.checkpoint.json) records the last committed batch
+and the hash of the verbs being imported, so rerunning the same import after
+a failure resumes after that batch; a different verb list starts over. The
+checkpoint is removed once the import completes.
+
+Usage:
+    python3 import_missing_verbs.py
+    python3 import_missing_verbs.py --upsert [--corpus big.json] [--batch-size 500]
 """
 
+import argparse
+import io
 import json
+import os
+import time
+
 import psycopg2
 from psycopg2.extras import execute_values
 
+from sql_emitter import copy_strings, unique_verbs
+from sql_manifest import corpus_hashes, hashes_digest
+from verb_corpus import MISSING_VERBS_PATH, SCRIPTS_DIR, load_verbs, read_word_list
+from verb_schema import CONJUGATION_COLUMNS, VERB_COLUMNS, conjugation_row, verb_row
+from verb_store import open_store
+
 # Database connection parameters
 DB_PARAMS = {
     'host': 'localhost',
@@ -17,169 +42,191 @@ DB_PARAMS = {
     'password': 'verber_password'
 }
 
-# List of missing verbs
-missing_verbs = [
-    'assembler', 'calculer', 'combattre', 'conduire', 'connaître', 'construire',
-    'consulter', 'contenir', 'continuer', 'cuisiner', 'cultiver', 'décoller',
-    'déguster', 'développer', 'fleurir', 'instruire', 'interpréter', 'introduire',
-    'mémoriser', 'mûrir', 'neiger', 'négliger', 'ordonner', 'participer',
-    'publier', 'ranger', 'reproduire', 'régner', 'réviser', 'soigner',
-    'séduire', 'vieillir', 'visiter', 'être'
-]
-
-# Load conjugation data
-with open('/home/fndui/projects/verber/backend/scripts/conjugation.json', 'r', encoding='utf-8') as f:
-    all_verbs = json.load(f)
-
-# Find the missing verbs
-found_verbs = []
-for verb_data in all_verbs:
-    infinitive = verb_data.get('Infinitif', '').lower()
-    if infinitive in missing_verbs:
-        found_verbs.append(verb_data)
-
-print(f"Found {len(found_verbs)}/{len(missing_verbs)} verbs in conjugation.json")
-
-# Connect to database
-conn = psycopg2.connect(**DB_PARAMS)
-cur = conn.cursor()
-
-added_count = 0
-skipped_count = 0
-
-for verb_data in found_verbs:
-    infinitive = verb_data.get('Infinitif', '').lower()
-    
-    # Check if verb already exists
-    cur.execute("SELECT id FROM verbs WHERE infinitive = %s", (infinitive,))
-    if cur.fetchone():
-        print(f"Skipping {infinitive} - already exists")
-        skipped_count += 1
-        continue
-    
-    # Extract verb metadata
-    past_participle = verb_data.get('ParticipePasse', '')
-    present_participle = verb_data.get('ParticipePresent', '')
-    auxiliary = verb_data.get('Auxiliaire', 'avoir')
-    pronominal_form = verb_data.get('FormePronominale', '')
-    
-    # Insert verb
-    cur.execute("""
-        INSERT INTO verbs (infinitive, past_participle, present_participle, auxiliary, pronomininal_form, difficulty)
-        VALUES (%s, %s, %s, %s, %s, 1)
-        RETURNING id
-    """, (infinitive, past_participle, present_participle, auxiliary, pronominal_form))
-    
-    verb_id = cur.fetchone()[0]
-    
-    # Extract conjugations
-    conjugations = {}
-    
-    # Present
-    if 'Present' in verb_data and len(verb_data['Present']) == 6:
-        for i, form in enumerate(verb_data['Present'], 1):
-            conjugations[f'present_{i}'] = form
-    
-    # Imparfait
-    if 'Imparfait' in verb_data and len(verb_data['Imparfait']) == 6:
-        for i, form in enumerate(verb_data['Imparfait'], 1):
-            conjugations[f'imparfait_{i}'] = form
-    
-    # Passé Simple
-    if 'PasseSimple' in verb_data and len(verb_data['PasseSimple']) == 6:
-        for i, form in enumerate(verb_data['PasseSimple'], 1):
-            conjugations[f'passe_simple_{i}'] = form
-    
-    # Futur Simple
-    if 'FuturSimple' in verb_data and len(verb_data['FuturSimple']) == 6:
-        for i, form in enumerate(verb_data['FuturSimple'], 1):
-            conjugations[f'futur_simple_{i}'] = form
-    
-    # Passé Composé
-    if 'PasseCompose' in verb_data and len(verb_data['PasseCompose']) == 6:
-        for i, form in enumerate(verb_data['PasseCompose'], 1):
-            conjugations[f'passe_compose_{i}'] = form
-    
-    # Plus-que-parfait
-    if 'PlusQueParfait' in verb_data and len(verb_data['PlusQueParfait']) == 6:
-        for i, form in enumerate(verb_data['PlusQueParfait'], 1):
-            conjugations[f'plus_que_parfait_{i}'] = form
-    
-    # Passé Antérieur
-    if 'PasseAnterieur' in verb_data and len(verb_data['PasseAnterieur']) == 6:
-        for i, form in enumerate(verb_data['PasseAnterieur'], 1):
-            conjugations[f'passe_anterieur_{i}'] = form
-    
-    # Futur Antérieur
-    if 'FuturAnterieur' in verb_data and len(verb_data['FuturAnterieur']) == 6:
-        for i, form in enumerate(verb_data['FuturAnterieur'], 1):
-            conjugations[f'futur_anterieur_{i}'] = form
-    
-    # Subjonctif Présent
-    if 'SubjonctifPresent' in verb_data and len(verb_data['SubjonctifPresent']) == 6:
-        for i, form in enumerate(verb_data['SubjonctifPresent'], 1):
-            conjugations[f'subjonctif_present_{i}'] = form
-    
-    # Subjonctif Imparfait
-    if 'SubjonctifImparfait' in verb_data and len(verb_data['SubjonctifImparfait']) == 6:
-        for i, form in enumerate(verb_data['SubjonctifImparfait'], 1):
-            conjugations[f'subjonctif_imparfait_{i}'] = form
-    
-    # Subjonctif Passé
-    if 'SubjonctifPasse' in verb_data and len(verb_data['SubjonctifPasse']) == 6:
-        for i, form in enumerate(verb_data['SubjonctifPasse'], 1):
-            conjugations[f'subjonctif_passe_{i}'] = form
-    
-    # Subjonctif Plus-que-parfait
-    if 'SubjonctifPlusQueParfait' in verb_data and len(verb_data['SubjonctifPlusQueParfait']) == 6:
-        for i, form in enumerate(verb_data['SubjonctifPlusQueParfait'], 1):
-            conjugations[f'subjonctif_plus_que_parfait_{i}'] = form
-    
-    # Conditionnel Présent
-    if 'ConditionnelPresent' in verb_data and len(verb_data['ConditionnelPresent']) == 6:
-        for i, form in enumerate(verb_data['ConditionnelPresent'], 1):
-            conjugations[f'conditionnel_present_{i}'] = form
-    
-    # Conditionnel Passé
-    if 'ConditionnelPasse' in verb_data and len(verb_data['ConditionnelPasse']) == 6:
-        for i, form in enumerate(verb_data['ConditionnelPasse'], 1):
-            conjugations[f'conditionnel_passe_{i}'] = form
-    
-    # Conditionnel Passé II
-    if 'ConditionnelPasseII' in verb_data and len(verb_data['ConditionnelPasseII']) == 6:
-        for i, form in enumerate(verb_data['ConditionnelPasseII'], 1):
-            conjugations[f'conditionnel_passe_ii_{i}'] = form
-    
-    # Impératif
-    if 'Imperatif' in verb_data and len(verb_data['Imperatif']) == 6:
-        for i, form in enumerate(verb_data['Imperatif'], 1):
-            conjugations[f'imperatif_{i}'] = form
-    
-    # Impératif Passé
-    if 'ImperatifPasse' in verb_data and len(verb_data['ImperatifPasse']) == 6:
-        for i, form in enumerate(verb_data['ImperatifPasse'], 1):
-            conjugations[f'imperatif_passe_{i}'] = form
-    
-    # Build INSERT statement
-    columns = ['verb_id'] + list(conjugations.keys())
-    values = [verb_id] + list(conjugations.values())
-    
-    placeholders = ', '.join(['%s'] * len(values))
-    columns_str = ', '.join(columns)
-    
-    cur.execute(f"""
-        INSERT INTO verb_conjugations ({columns_str})
-        VALUES ({placeholders})
-    """, values)
-    
-    print(f"Added {infinitive} (ID: {verb_id}) with {len(conjugations)} conjugation forms")
-    added_count += 1
-
-conn.commit()
-cur.close()
-conn.close()
-
-print(f"\n✅ Summary:")
-print(f"   Added: {added_count} verbs")
-print(f"   Skipped: {skipped_count} verbs (already existed)")
-print(f"   Total verbs now: {962 + added_count}")
+# Verbs missing from the database (missing_verbs.txt)
+missing_verbs = read_word_list(MISSING_VERBS_PATH)
+
+CHECKPOINT_PATH = os.path.join(SCRIPTS_DIR, 'verbs.checkpoint.json')
+CHECKPOINT_VERSION = 1
+UPSERT_BATCH = 500
+
+
+def import_verbs(conn, verbs, difficulty=1):
+    """Insert the verbs that are not in the database yet; returns (added, skipped)
+
+    added is a list of (infinitive, verb id, conjugation forms) and skipped a
+    list of infinitives. Three statements are sent whatever the verb count:
+    one existence query over ANY(), one multi-row INSERT ... RETURNING for
+    verbs and one COPY of all their conjugation rows.
+    """
+    rows = {}
+    for verb_data in unique_verbs(verbs):
+        row = verb_row(verb_data)
+        rows[row[0]] = (row, conjugation_row(verb_data))
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT infinitive FROM verbs WHERE infinitive = ANY(%s)", (list(rows),))
+        existing = {infinitive for infinitive, in cur.fetchall()}
+        new_rows = [(row, conjugations) for infinitive, (row, conjugations) in rows.items()
+                    if infinitive not in existing]
+
+        ids = {}
+        if new_rows:
+            # ON CONFLICT covers verbs inserted since the existence query
+            inserted = execute_values(
+                cur,
+                f"INSERT INTO verbs ({', '.join(VERB_COLUMNS)}, difficulty) VALUES %s "
+                f"ON CONFLICT (infinitive) DO NOTHING RETURNING infinitive, id",
+                [row for row, _ in new_rows],
+                template=f"({', '.join(['%s'] * len(VERB_COLUMNS))}, {int(difficulty)})",
+                page_size=len(new_rows),
+                fetch=True,
+            )
+            ids = dict(inserted)
+
+        added = [(row[0], ids[row[0]], conjugations) for row, conjugations in new_rows if row[0] in ids]
+        if added:
+            data = ''.join(f"{verb_id}\t{copy_strings(conjugations)}\n" for _, verb_id, conjugations in added)
+            cur.copy_expert(f"COPY verb_conjugations (verb_id, {', '.join(CONJUGATION_COLUMNS)}) FROM STDIN",
+                            io.StringIO(data))
+    skipped = [infinitive for infinitive in rows if infinitive not in ids]
+    return added, skipped
+
+
+def upsert_batch(cur, verbs, difficulty=1):
+    """Insert or update a batch of verbs and their conjugations; returns (inserted, updated)"""
+    rows = [(verb_row(verb_data), conjugation_row(verb_data)) for verb_data in verbs]
+    # xmax is 0 only for rows this statement inserted
+    returned = execute_values(
+        cur,
+        f"INSERT INTO verbs ({', '.join(VERB_COLUMNS)}, difficulty) VALUES %s "
+        f"ON CONFLICT (infinitive) DO UPDATE SET "
+        f"{', '.join(f'{column} = EXCLUDED.{column}' for column in VERB_COLUMNS[1:])} "
+        f"RETURNING infinitive, id, xmax = 0",
+        [row for row, _ in rows],
+        template=f"({', '.join(['%s'] * len(VERB_COLUMNS))}, {int(difficulty)})",
+        page_size=len(rows),
+        fetch=True,
+    )
+    ids = {infinitive: verb_id for infinitive, verb_id, _ in returned}
+    inserted = sum(1 for _, _, is_new in returned if is_new)
+    execute_values(
+        cur,
+        f"INSERT INTO verb_conjugations (verb_id, {', '.join(CONJUGATION_COLUMNS)}) VALUES %s "
+        f"ON CONFLICT (verb_id) DO UPDATE SET "
+        f"{', '.join(f'{column} = EXCLUDED.{column}' for column in CONJUGATION_COLUMNS)}",
+        [(ids[row[0]],) + conjugations for row, conjugations in rows],
+        page_size=len(rows),
+    )
+    return inserted, len(returned) - inserted
+
+
+def read_checkpoint(path, digest, batch_size):
+    """Return the number of batches already committed for this import"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return 0
+    if (checkpoint.get('version') != CHECKPOINT_VERSION or checkpoint.get('digest') != digest
+            or checkpoint.get('batch_size') != batch_size):
+        print(f"Ignoring {path}: it belongs to a different import")
+        return 0
+    return checkpoint['batches']
+
+
+def write_checkpoint(path, digest, batch_size, batches, verbs):
+    """Atomically record that the first batches of this import are committed"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CHECKPOINT_VERSION, 'digest': digest, 'batch_size': batch_size,
+                   'batches': batches, 'verbs': verbs}, f)
+    os.replace(tmp_path, path)
+
+
+def upsert_verbs(conn, verbs, batch_size=UPSERT_BATCH, checkpoint_path=CHECKPOINT_PATH):
+    """Upsert verbs in committed batches, resuming from the checkpoint
+
+    Returns (inserted, updated, resumed verbs). A batch that was committed
+    but not yet checkpointed is upserted again, which leaves the same rows.
+    """
+    verbs = list(unique_verbs(verbs))
+    digest = hashes_digest(corpus_hashes(verbs))
+    done = read_checkpoint(checkpoint_path, digest, batch_size)
+    if done:
+        print(f"Resuming after batch {done} ({min(done * batch_size, len(verbs))}/{len(verbs)} verbs committed)")
+
+    inserted = updated = 0
+    for number, start in enumerate(range(done * batch_size, len(verbs), batch_size), done + 1):
+        batch = verbs[start:start + batch_size]
+        with conn.cursor() as cur:
+            batch_inserted, batch_updated = upsert_batch(cur, batch)
+        conn.commit()
+        write_checkpoint(checkpoint_path, digest, batch_size, number, start + len(batch))
+        inserted += batch_inserted
+        updated += batch_updated
+        print(f"Batch {number}: {start + len(batch)}/{len(verbs)} verbs "
+              f"({batch_inserted} inserted, {batch_updated} updated)")
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return inserted, updated, min(done * batch_size, len(verbs))
+
+
+def count_verbs(conn):
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM verbs")
+        return cur.fetchone()[0]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Import missing verbs into the database")
+    parser.add_argument('--upsert', action='store_true',
+                        help="update existing verbs and commit in resumable batches")
+    parser.add_argument('--corpus', help="import every verb of this corpus instead of the missing list (with --upsert)")
+    parser.add_argument('--batch-size', type=int, default=UPSERT_BATCH,
+                        help=f"verbs per committed batch (default: {UPSERT_BATCH})")
+    args = parser.parse_args()
+    if args.corpus and not args.upsert:
+        parser.error("--corpus requires --upsert")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    if args.corpus:
+        found_verbs = load_verbs(args.corpus)
+        print(f"Loaded {len(found_verbs)} verbs from {args.corpus}")
+    else:
+        # Fetch only the missing verbs from the memory-mapped store
+        with open_store() as store:
+            found_verbs = list(store.get_many(missing_verbs).values())
+        print(f"Found {len(found_verbs)}/{len(missing_verbs)} verbs in conjugation.json")
+
+    # Connect to database
+    start = time.perf_counter()
+    conn = psycopg2.connect(**DB_PARAMS)
+    try:
+        if args.upsert:
+            inserted, updated, resumed = upsert_verbs(conn, found_verbs, args.batch_size)
+        else:
+            added, skipped = import_verbs(conn, found_verbs)
+            conn.commit()
+        total = count_verbs(conn)
+    finally:
+        conn.close()
+
+    if not args.upsert:
+        for infinitive in skipped:
+            print(f"Skipping {infinitive} - already exists")
+        for infinitive, verb_id, conjugations in added:
+            print(f"Added {infinitive} (ID: {verb_id}) with {sum(1 for form in conjugations if form)} conjugation forms")
+
+    print(f"\n✅ Summary:")
+    if args.upsert:
+        print(f"   Inserted: {inserted} verbs")
+        print(f"   Updated: {updated} verbs")
+        if resumed:
+            print(f"   Resumed: {resumed} verbs were committed by an earlier run")
+    else:
+        print(f"   Added: {len(added)} verbs")
+        print(f"   Skipped: {len(skipped)} verbs (already existed)")
+    print(f"   Total verbs now: {total}")
+    print(f"   Time: {time.perf_counter() - start:.2f}s")
@@ -2,101 +2,120 @@
 # -*- coding: utf-8 -*-
 """
 Generate SQL to import all verbs with their conjugations into the existing database schema
-"""
-
-import json
 
-# Load all verbs from updated conjugation.json
-with open('conjugation.json', 'r', encoding='utf-8') as f:
-    all_verbs = json.load(f)
+By default the tables are truncated and refilled from one DO block
+(--batch-size verbs per block). With --set-based, all verbs are upserted by
+one INSERT ... ON CONFLICT and all conjugations by one INSERT ... SELECT
+joined on the infinitive, so the file can be re-run safely without
+truncating.
 
-print(f"Generating SQL for {len(all_verbs)} verbs...")
+With --swap, the verbs are loaded into shadow tables that replace the live
+ones in one short transaction (see shadow_swap.py): readers never see empty
+tables, and verbs keep their ids.
 
-# Mapping from JSON keys to database column names
-tense_mapping = {
-    'Present': 'present',
-    'Imparfait': 'imparfait',
-    'PasseSimple': 'passe_simple',
-    'FuturSimple': 'futur_simple',
-    'PasseCompose': 'passe_compose',
-    'PlusQueParfait': 'plus_que_parfait',
-    'PasseAnterieur': 'passe_anterieur',
-    'FuturAnterieur': 'futur_anterieur',
-    'SubjonctifPresent': 'subjonctif_present',
-    'SubjonctifImparfait': 'subjonctif_imparfait',
-    'SubjonctifPasse': 'subjonctif_passe',
-    'SubjonctifPlusQueParfait': 'subjonctif_plus_que_parfait',
-    'ConditionnelPresent': 'conditionnel_present',
-    'ConditionnelPasse': 'conditionnel_passe',
-    'ConditionnelPasseDeuxiemeForme': 'conditionnel_passe_ii',
-    'Imperatif': 'imperatif',
-    'ImperatifPasse': 'imperatif_passe'
-}
+Every run records per-verb hashes in verbs.manifest.json next to the output
+(see sql_manifest.py). With --incremental, only the verbs added, changed or
+removed since that manifest are written, as upserts and DELETEs.
+"""
 
-# Generate SQL
-sql_lines = [
-    "-- Import all verbs with conjugations",
-    "-- Generated: 2025-10-31",
-    f"-- Total verbs: {len(all_verbs)}",
-    "",
-    "-- Clear existing data",
-    "TRUNCATE TABLE verb_conjugations RESTART IDENTITY CASCADE;",
-    "TRUNCATE TABLE verbs RESTART IDENTITY CASCADE;",
-    ""
-]
+import argparse
+import os
+import sys
+import time
 
-# Insert verbs and their conjugations using DO block
-sql_lines.append("DO $$")
-sql_lines.append("DECLARE")
-sql_lines.append("  verb_id INT;")
-sql_lines.append("BEGIN")
+from shadow_swap import shadow_table, write_swap_reload
+from sql_emitter import Batching, add_batching_arguments, open_sql, write_lines, write_returning_import, write_set_import
+from sql_manifest import corpus_hashes, manifest_path_for, read_manifest, write_incremental, write_manifest
+from verb_corpus import iter_verbs
 
-for verb_data in all_verbs:
-    infinitive = verb_data.get('Infinitif', '').lower().replace("'", "''")
-    past_participle = verb_data.get('ParticipePasse', '').replace("'", "''")
-    present_participle = verb_data.get('ParticipePresent', '').replace("'", "''")
-    auxiliary = verb_data.get('Auxiliaire', '').replace("'", "''")
-    pronominal = verb_data.get('FormePronominale', '').replace("'", "''")
-    
-    # Insert verb and get ID
-    sql_lines.append(
-        f"  INSERT INTO verbs (infinitive, past_participle, present_participle, auxiliary, pronominal_form) "
-        f"VALUES ('{infinitive}', '{past_participle}', '{present_participle}', '{auxiliary}', '{pronominal}') "
-        f"RETURNING id INTO verb_id;"
-    )
-    
-    # Build conjugation insert
-    columns = []
-    values = []
-    
-    for json_key, db_prefix in tense_mapping.items():
-        if json_key in verb_data and isinstance(verb_data[json_key], list):
-            forms = verb_data[json_key]
-            for i in range(min(6, len(forms))):  # 6 persons max
-                col_name = f"{db_prefix}{i+1}"
-                value = forms[i].replace("'", "''") if forms[i] else ''
-                columns.append(col_name)
-                values.append(f"'{value}'")
-    
-    if columns:
-        sql_lines.append(
-            f"  INSERT INTO verb_conjugations (verb_id, {', '.join(columns)}) "
-            f"VALUES (verb_id, {', '.join(values)});"
-        )
-    
-    sql_lines.append("")
+parser = argparse.ArgumentParser(description="Generate SQL importing all verbs with their conjugations")
+parser.add_argument('--set-based', action='store_true', help="idempotent set-based upsert instead of a DO block")
+parser.add_argument('--swap', action='store_true',
+                    help="reload through shadow tables and a rename swap instead of TRUNCATE")
+parser.add_argument('--incremental', action='store_true',
+                    help="only write changes since the manifest next to the output")
+parser.add_argument('-o', '--output', help="output file ('-' for stdout)")
+parser.add_argument('--corpus', help="corpus file (default: conjugation.json)")
+add_batching_arguments(parser)
+args = parser.parse_args()
+batching = Batching.from_args(args)
 
-sql_lines.append("END $$;")
-sql_lines.append("")
+# Keep stdout clean when the SQL goes there
+report = sys.stderr if args.output == '-' else sys.stdout
+print("Generating SQL for all verbs...", file=report)
+start = time.perf_counter()
+hashes = None
 
-sql_lines.append(f"-- Total verbs inserted: {len(all_verbs)}")
+if args.incremental:
+    output_file = args.output or 'import_verbs_incremental.sql'
+    manifest_path = manifest_path_for(output_file)
+    old_hashes = read_manifest(manifest_path)
+    if old_hashes is None:
+        parser.error(f"no manifest at {manifest_path}; generate a full import first")
+    with open_sql(output_file) as f:
+        write_lines(f, [
+            "-- Incremental verb import",
+            "-- Generated: 2025-10-31",
+            "",
+        ])
+        hashes, upserted, removed = write_incremental(f, iter_verbs(args.corpus), old_hashes, batching)
+    verb_count = len(upserted)
+    print(f"  Added or changed: {', '.join(upserted) or '-'}", file=report)
+    print(f"  Removed: {', '.join(removed) or '-'}", file=report)
+elif args.swap:
+    output_file = args.output or 'import_all_verbs_swap.sql'
+    tables = ('verbs', 'verb_conjugations')
+    with open_sql(output_file) as f:
+        write_lines(f, [
+            "-- Reload all verbs with conjugations through shadow tables",
+            "-- Generated: 2025-10-31",
+            "",
+        ])
+        verb_count = write_swap_reload(f, tables, lambda out: write_set_import(
+            out, iter_verbs(args.corpus), on_conflict=None, batching=batching,
+            tables=tuple(shadow_table(table) for table in tables), keep_ids_from='verbs'))
+        f.write(f"-- Total verbs loaded: {verb_count}")
+elif args.set_based:
+    output_file = args.output or 'import_all_verbs_upsert.sql'
+    # One transaction for the whole file unless batches get their own
+    single_transaction = batching.batches_per_transaction is None
+    with open_sql(output_file) as f:
+        write_lines(f, [
+            "-- Upsert all verbs with conjugations",
+            "-- Generated: 2025-10-31",
+            "",
+        ])
+        if single_transaction:
+            write_lines(f, ["BEGIN;", ""])
+        verb_count = write_set_import(f, iter_verbs(args.corpus), batching=batching)
+        if single_transaction:
+            write_lines(f, ["COMMIT;", ""])
+        f.write(f"-- Total verbs upserted: {verb_count}")
+else:
+    output_file = args.output or 'import_all_verbs_proper.sql'
+    # Stream verbs from conjugation.json straight into the SQL file
+    with open_sql(output_file) as f:
+        write_lines(f, [
+            "-- Import all verbs with conjugations",
+            "-- Generated: 2025-10-31",
+            "",
+            "-- Clear existing data",
+            "TRUNCATE TABLE verb_conjugations RESTART IDENTITY CASCADE;",
+            "TRUNCATE TABLE verbs RESTART IDENTITY CASCADE;",
+            "",
+        ])
+        # Insert verbs and their conjugations using DO blocks
+        verb_count = write_returning_import(f, iter_verbs(args.corpus), batching)
+        f.write("\n")
+        f.write(f"-- Total verbs inserted: {verb_count}")
 
-# Write to file
-output_file = 'import_all_verbs_proper.sql'
-with open(output_file, 'w', encoding='utf-8') as f:
-    f.write('\n'.join(sql_lines))
+if output_file == '-':
+    print(f"✓ Generated SQL on stdout in {(time.perf_counter() - start) * 1000:.0f} ms", file=report)
+    print(f"  Total verbs: {verb_count}", file=report)
+else:
+    # The manifest now describes the database once this file has been applied
+    write_manifest(manifest_path_for(output_file), hashes or corpus_hashes(iter_verbs(args.corpus)))
 
-content_size = len('\n'.join(sql_lines)) / 1024
-print(f"✓ Generated SQL file: {output_file}")
-print(f"  Total verbs: {len(all_verbs)}")
-print(f"  File size: {content_size:.1f} KB")
+    print(f"✓ Generated SQL file: {output_file} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"  Total verbs: {verb_count}")
+    print(f"  File size: {os.path.getsize(output_file) / 1024:.1f} KB")
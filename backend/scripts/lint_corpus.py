@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lint and normalize a conjugation corpus
+
+Reports every structural issue with its location and can write a canonical
+copy of the corpus. Records are sharded across a process pool; duplicate
+infinitives are detected after the shards are merged.
+
+Checks (code: what is fixed by --write):
+    alias-key       ConditionnelPasseDeuxiemeForme renamed to ConditionnelPasseII
+    unknown-key     reported only
+    missing-tense   reported only
+    short-tense     3-slot imperatives spread to the 6-person layout
+    bad-length      reported only
+    not-nfc         strings NFC-normalized
+    whitespace      leading/trailing/double spaces collapsed
+    capitalized     first letter of a tense cell lowercased ("Conduis" -> "conduis")
+    empty-form      reported only (impersonal and defective verbs)
+    empty-scalar    empty FormePronominale dropped
+    missing-scalar  reported only
+    duplicate       later records with the same infinitive dropped
+
+missing-tense and empty-form are expected for defective and impersonal
+verbs: the exit status is 1 only for the other codes, unless --strict.
+
+Usage:
+    python3 lint_corpus.py [conjugation.json] [--jobs N] [--write normalized.json] [--strict]
+"""
+
+import argparse
+import os
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+from verb_corpus import DEFAULT_CORPUS_PATH, PERSONS, SCALAR_KEYS, TENSE_KEYS, load_verbs, write_verbs_json
+from verb_index import normalize_infinitive
+from verb_schema import IMPERATIVE_PERSONS, IMPERATIVE_TENSES, KEY_ALIASES
+
+REQUIRED_SCALARS = ('Infinitif', 'ParticipePasse', 'ParticipePresent', 'Auxiliaire')
+CANONICAL_ORDER = {key: i for i, key in enumerate(SCALAR_KEYS + TENSE_KEYS)}
+CHUNK_SIZE = 256
+# Issues that do not fail the lint without --strict
+EXPECTED_CODES = ('missing-tense', 'empty-form')
+
+
+def _clean_string(value, where, issues, lowercase):
+    """Return the canonical form of a string and record what had to change"""
+    cleaned = value
+    if not unicodedata.is_normalized('NFC', cleaned):
+        issues.append(('not-nfc', where, f"{cleaned!r} is not NFC-normalized"))
+        cleaned = unicodedata.normalize('NFC', cleaned)
+    collapsed = ' '.join(cleaned.split())
+    if collapsed != cleaned:
+        issues.append(('whitespace', where, f"{cleaned!r} has stray whitespace"))
+        cleaned = collapsed
+    if lowercase and cleaned[:1].isupper():
+        issues.append(('capitalized', where, f"{cleaned!r} is capitalized"))
+        cleaned = cleaned[:1].lower() + cleaned[1:]
+    return cleaned
+
+
+def lint_record(verb_data):
+    """Return (issues, normalized record) for one verb record
+
+    Issues are (code, field, message) tuples; the field is e.g. "Present[3]"
+    with persons numbered from 1.
+    """
+    issues = []
+    normalized = {}
+
+    for key, value in verb_data.items():
+        canonical_key = KEY_ALIASES.get(key, key)
+        if canonical_key != key:
+            issues.append(('alias-key', key, f"should be named {canonical_key}"))
+        elif key not in CANONICAL_ORDER:
+            issues.append(('unknown-key', key, "not part of the corpus schema"))
+
+        if isinstance(value, str):
+            if not value:
+                issues.append(('empty-scalar', canonical_key, "is empty"))
+                if canonical_key == 'FormePronominale':
+                    continue
+            normalized[canonical_key] = _clean_string(value, canonical_key, issues, lowercase=False)
+            continue
+        if not isinstance(value, list):
+            normalized[canonical_key] = value
+            continue
+
+        forms = [_clean_string(form, f"{canonical_key}[{person}]", issues, lowercase=True)
+                 for person, form in enumerate(value, 1)]
+        if canonical_key in IMPERATIVE_TENSES and len(forms) == 3:
+            issues.append(('short-tense', canonical_key, "has 3 slots instead of 6"))
+            spread = [''] * PERSONS
+            for person, form in zip(IMPERATIVE_PERSONS, forms):
+                spread[person] = form
+            forms = spread
+        elif len(forms) != PERSONS and forms:
+            issues.append(('bad-length', canonical_key, f"has {len(forms)} slots instead of {PERSONS}"))
+
+        for person, form in enumerate(forms):
+            if form:
+                continue
+            if canonical_key in IMPERATIVE_TENSES and person not in IMPERATIVE_PERSONS:
+                continue
+            issues.append(('empty-form', f"{canonical_key}[{person + 1}]", "is empty"))
+        normalized[canonical_key] = forms
+
+    for key in REQUIRED_SCALARS:
+        if key not in normalized:
+            issues.append(('missing-scalar', key, "is missing"))
+    for key in TENSE_KEYS:
+        if key not in normalized:
+            issues.append(('missing-tense', key, "is missing"))
+
+    ordered = dict(sorted(normalized.items(), key=lambda item: CANONICAL_ORDER.get(item[0], len(CANONICAL_ORDER))))
+    return issues, ordered
+
+
+def lint_chunk(chunk):
+    """Lint a list of (position, record) pairs; runs in a worker process"""
+    return [(position, *lint_record(verb_data)) for position, verb_data in chunk]
+
+
+def lint_corpus(verbs, jobs=None):
+    """Lint all records and return (issues, normalized records)
+
+    Issues are (position, infinitive, code, field, message) tuples in corpus
+    order. Later duplicates of an infinitive are reported and left out of the
+    normalized records.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    pairs = list(enumerate(verbs))
+    chunks = [pairs[start:start + CHUNK_SIZE] for start in range(0, len(pairs), CHUNK_SIZE)]
+    if jobs == 1:
+        chunk_results = list(map(lint_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunk_results = list(executor.map(lint_chunk, chunks))
+
+    issues = []
+    normalized_verbs = []
+    first_seen = {}
+    for chunk_result in chunk_results:
+        for position, record_issues, normalized in chunk_result:
+            infinitive = normalized.get('Infinitif', '')
+            issues.extend((position, infinitive, *issue) for issue in record_issues)
+            key = normalize_infinitive(infinitive)
+            if key in first_seen:
+                issues.append((position, infinitive, 'duplicate', 'Infinitif',
+                               f"already defined by record #{first_seen[key]}"))
+                continue
+            first_seen[key] = position
+            normalized_verbs.append(normalized)
+    return issues, normalized_verbs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lint and normalize a conjugation corpus")
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS_PATH)
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--write', metavar='PATH', help="write the normalized corpus to PATH")
+    parser.add_argument('--quiet', action='store_true', help="only print the summary")
+    parser.add_argument('--strict', action='store_true', help="also fail on missing tenses and empty forms")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    verbs = load_verbs(args.corpus)
+    issues, normalized_verbs = lint_corpus(verbs, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    name = os.path.basename(args.corpus)
+    if not args.quiet:
+        for position, infinitive, code, field, message in issues:
+            print(f"{name}:#{position} {infinitive}: {field}: {message} [{code}]")
+
+    counts = {}
+    for issue in issues:
+        counts[issue[2]] = counts.get(issue[2], 0) + 1
+    print(f"\n{len(verbs)} verbs checked in {elapsed:.2f}s, {len(issues)} issues")
+    for code, count in sorted(counts.items()):
+        print(f"  - {code}: {count}")
+
+    if args.write:
+        write_verbs_json(args.write, normalized_verbs)
+        print(f"✓ Wrote normalized corpus: {args.write} ({len(normalized_verbs)} verbs)")
+    failing = [issue for issue in issues if args.strict or issue[2] not in EXPECTED_CODES]
+    return 1 if failing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Paradigm-compressed encoding of the conjugation corpus
+
+Each verb is reduced to stems plus templates: every string of the record has
+its stem replaced by a one-character placeholder, so "abandonnons" and
+"ai abandonné" become "\\x00ons" and "ai \\x00é". Verbs whose template lists
+are identical share one paradigm (aimer-type, finir-type, conduire-type...).
+A verb that matches no shared paradigm is attached to the closest one with
+the same record layout when only a few cells differ, and those cells are
+stored verbatim as exceptions. A verb is therefore stored as
+(paradigm id, stems, exceptions).
+
+Encoded document (JSON):
+    layouts    [[key, length or null for scalars], ...] per record shape
+    paradigms  [layout id, [template, ...]]
+    verbs      [paradigm id, [stem, ...], {cell index: form}]
+
+Usage:
+    python3 paradigm_codec.py encode [conjugation.json] [out.json]
+    python3 paradigm_codec.py verify [conjugation.json]
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+
+from verb_corpus import DEFAULT_CORPUS_PATH, load_verbs
+
+FORMAT_VERSION = 1
+# A verb may borrow a paradigm when at most this many cells differ
+MAX_EXCEPTIONS = 12
+REFLEXIVE_PREFIXES = ("se ", "s'", "s’")
+
+
+def _common_prefix(strings):
+    first = min(strings)
+    last = max(strings)
+    n = 0
+    while n < len(first) and first[n] == last[n]:
+        n += 1
+    return first[:n]
+
+
+def _strip_reflexive(value):
+    for prefix in REFLEXIVE_PREFIXES:
+        if value.startswith(prefix):
+            return value[len(prefix):]
+    return value
+
+
+def find_stems(verb_data):
+    """Return the stems used to template a record
+
+    The main stem is the common prefix of the infinitive and participles
+    (reflexive pronoun removed); capitalized records get a lowercase second
+    stem because their compound tenses are written in lowercase.
+    """
+    parts = [_strip_reflexive(verb_data.get(key) or '')
+             for key in ('Infinitif', 'ParticipePasse', 'ParticipePresent')]
+    parts = [p for p in parts if p]
+    stem = _common_prefix(parts) if parts else ''
+    if not stem:
+        return []
+    if stem.lower() != stem:
+        return [stem, stem.lower()]
+    return [stem]
+
+
+def _template(value, stems):
+    for i, stem in enumerate(stems):
+        if stem in value:
+            return value.replace(stem, chr(i), 1)
+    return value
+
+
+def _fill(template, stems):
+    for i, stem in enumerate(stems):
+        template = template.replace(chr(i), stem, 1)
+    return template
+
+
+def _flatten(verb_data):
+    """Return (layout, flat list of strings) for a record"""
+    layout = []
+    values = []
+    for key, value in verb_data.items():
+        if isinstance(value, list):
+            layout.append((key, len(value)))
+            values.extend(value)
+        else:
+            layout.append((key, None))
+            values.append(value)
+    return tuple(layout), values
+
+
+def encode_corpus(verbs, max_exceptions=MAX_EXCEPTIONS):
+    """Encode a list of verb records as a paradigm document"""
+    layouts = {}
+    paradigm_ids = {}
+    paradigm_templates = []
+    paradigm_layouts = []
+    members = []
+    flat = []
+
+    for verb_data in verbs:
+        layout, values = _flatten(verb_data)
+        layout_id = layouts.setdefault(layout, len(layouts))
+        stems = find_stems(verb_data)
+        templates = tuple(_template(v, stems) for v in values)
+        signature = (layout_id, templates)
+        if signature not in paradigm_ids:
+            paradigm_ids[signature] = len(paradigm_templates)
+            paradigm_templates.append(templates)
+            paradigm_layouts.append(layout_id)
+            members.append(0)
+        members[paradigm_ids[signature]] += 1
+        flat.append((paradigm_ids[signature], stems, templates))
+
+    # Re-home single-member paradigms onto a shared one when few cells differ
+    shared_by_layout = {}
+    for pid, count in enumerate(members):
+        if count > 1:
+            shared_by_layout.setdefault(paradigm_layouts[pid], []).append(pid)
+
+    encoded_verbs = []
+    used = {}
+    for pid, stems, templates in flat:
+        exceptions = {}
+        if members[pid] == 1:
+            best = None
+            for candidate in shared_by_layout.get(paradigm_layouts[pid], ()):
+                reference = paradigm_templates[candidate]
+                diff = {}
+                for i, (a, b) in enumerate(zip(templates, reference)):
+                    if a != b:
+                        diff[i] = _fill(a, stems)
+                        if len(diff) > max_exceptions:
+                            break
+                else:
+                    if best is None or len(diff) < len(best[1]):
+                        best = (candidate, diff)
+            if best is not None:
+                pid, exceptions = best
+        new_pid = used.setdefault(pid, len(used))
+        encoded_verbs.append([new_pid, stems, {str(i): form for i, form in exceptions.items()}])
+
+    layout_list = [None] * len(layouts)
+    for layout, layout_id in layouts.items():
+        layout_list[layout_id] = [list(item) for item in layout]
+    paradigms = [None] * len(used)
+    for pid, new_pid in used.items():
+        paradigms[new_pid] = [paradigm_layouts[pid], list(paradigm_templates[pid])]
+
+    return {
+        'version': FORMAT_VERSION,
+        'layouts': layout_list,
+        'paradigms': paradigms,
+        'verbs': encoded_verbs,
+    }
+
+
+class ParadigmDecoder:
+    """Rebuild verb records from an encoded paradigm document"""
+
+    def __init__(self, document):
+        if document.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported paradigm format: {document.get('version')}")
+        self.paradigms = document['paradigms']
+        self.verbs = [(pid, stems, {int(i): form for i, form in exceptions.items()})
+                      for pid, stems, exceptions in document['verbs']]
+        # Per layout: (key, start, end) with end None for scalar fields
+        self.slices = []
+        for layout in document['layouts']:
+            slices = []
+            pos = 0
+            for key, length in layout:
+                if length is None:
+                    slices.append((key, pos, None))
+                    pos += 1
+                else:
+                    slices.append((key, pos, pos + length))
+                    pos += length
+            self.slices.append(slices)
+
+    def __len__(self):
+        return len(self.verbs)
+
+    def decode(self, i):
+        """Return the record of verb i"""
+        pid, stems, exceptions = self.verbs[i]
+        layout_id, templates = self.paradigms[pid]
+        if len(stems) == 1:
+            stem = stems[0]
+            values = [t.replace('\x00', stem, 1) for t in templates]
+        else:
+            values = [_fill(t, stems) for t in templates]
+        for cell, form in exceptions.items():
+            values[cell] = form
+        return {key: values[start] if end is None else values[start:end]
+                for key, start, end in self.slices[layout_id]}
+
+    def __iter__(self):
+        for i in range(len(self.verbs)):
+            yield self.decode(i)
+
+
+def dumps(document):
+    """Serialize an encoded document compactly"""
+    return json.dumps(document, ensure_ascii=False, separators=(',', ':'))
+
+
+def verify(corpus_path=None):
+    """Encode a corpus, check the round trip and report sizes and timings"""
+    corpus_path = corpus_path or DEFAULT_CORPUS_PATH
+    verbs = load_verbs(corpus_path)
+
+    start = time.perf_counter()
+    document = encode_corpus(verbs)
+    encode_time = time.perf_counter() - start
+
+    decoder = ParadigmDecoder(json.loads(dumps(document)))
+    start = time.perf_counter()
+    decoded = list(decoder)
+    decode_time = time.perf_counter() - start
+
+    mismatches = [verb_data.get('Infinitif') for verb_data, rebuilt in zip(verbs, decoded) if verb_data != rebuilt]
+    original = json.dumps(verbs, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    encoded = dumps(document).encode('utf-8')
+    with_exceptions = sum(1 for v in document['verbs'] if v[2])
+    shared = len(verbs) - len(document['paradigms'])
+
+    print(f"Verbs: {len(verbs)} -> {len(document['paradigms'])} paradigms "
+          f"({shared} verbs share one, {with_exceptions} use exceptions)")
+    print(f"Round trip: {'OK' if not mismatches else f'{len(mismatches)} mismatches'}")
+    print(f"Size: source {os.path.getsize(corpus_path) / 1024:.0f} KB, "
+          f"minified {len(original) / 1024:.0f} KB, encoded {len(encoded) / 1024:.0f} KB "
+          f"({len(original) / len(encoded):.1f}x)")
+    print(f"Gzipped: minified {len(gzip.compress(original)) / 1024:.0f} KB, "
+          f"encoded {len(gzip.compress(encoded)) / 1024:.0f} KB")
+    print(f"Encode: {encode_time * 1000:.0f} ms, decode: {decode_time / len(verbs) * 1e6:.1f} µs/verb")
+    if mismatches:
+        print(f"  Mismatched: {', '.join(mismatches[:20])}")
+    return not mismatches
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else 'verify'
+    if command == 'encode':
+        corpus = sys.argv[2] if len(sys.argv) > 2 else None
+        output_file = sys.argv[3] if len(sys.argv) > 3 else 'conjugation.paradigms.json'
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(dumps(encode_corpus(load_verbs(corpus))))
+        print(f"✓ Encoded corpus: {output_file} ({os.path.getsize(output_file) / 1024:.0f} KB)")
+    elif command == 'verify':
+        sys.exit(0 if verify(sys.argv[2] if len(sys.argv) > 2 else None) else 1)
+    else:
+        print(__doc__.strip().split('Usage:')[1])
+        sys.exit(1)
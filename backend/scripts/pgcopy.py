@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PostgreSQL binary COPY writer for verbs and verb_conjugations
+
+Binary COPY skips the quoting and repeated column lists of SQL text: each
+tuple is an int16 field count followed by int32-length-prefixed fields
+(-1 for NULL), between a fixed header and an int16 -1 trailer. Strings are
+sent as UTF-8 (VARCHAR's binary form).
+
+Binary COPY needs the exact width of every integer column. The tables the
+API creates with GORM AutoMigrate (internal/models) have uint, i.e. bigint,
+ids, so ids are written as int8 by default; the create_*.sql schemas use
+SERIAL/INTEGER (int4) ids instead. load_binary() reads the id column types
+from pg_attribute and encodes to match; files written without a database
+take id_size=4 for those schemas.
+
+load_binary() streams both tables to a database through psycopg2's
+copy_expert without writing files; psycopg2 is only needed for that path.
+
+Usage:
+    python3 pgcopy.py bench [--dsn "dbname=verber_db user=verber_user"]
+    python3 pgcopy.py load --dsn "host=localhost port=5433 dbname=verber_db user=verber_user"
+"""
+
+import argparse
+import io
+import struct
+import time
+
+from sql_emitter import unique_verbs, write_copy_verbs, write_returning_import
+from verb_corpus import iter_verbs, load_verbs
+from verb_schema import CONJUGATION_COLUMNS, CONJUGATION_COPY_COLUMNS, VERB_COPY_COLUMNS, conjugation_row, verb_row
+
+PGCOPY_SIGNATURE = b'PGCOPY\n\xff\r\n\x00'
+# Signature, flags (no OIDs), header extension length
+PGCOPY_HEADER = PGCOPY_SIGNATURE + struct.pack('>ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('>h', -1)
+NULL_FIELD = struct.pack('>i', -1)
+TUPLE_BATCH = 256
+
+_int16 = struct.Struct('>h').pack
+_int32 = struct.Struct('>i').pack
+# Id width in bytes -> packer of the length followed by the value
+ID_FIELDS = {4: struct.Struct('>ii').pack, 8: struct.Struct('>iq').pack}
+# bigint, as GORM creates uint ids
+ID_SIZE = 8
+# pg_attribute type of an id column -> width
+ID_TYPE_SIZES = {'integer': 4, 'bigint': 8}
+
+
+def id_field(value, size=ID_SIZE):
+    """Return an id as a length-prefixed int4 or int8 field"""
+    return ID_FIELDS[size](size, value)
+
+
+def binary_field(value, id_size=ID_SIZE):
+    """Return one length-prefixed field; ints are sent as ids of id_size bytes"""
+    if value is None:
+        return NULL_FIELD
+    if isinstance(value, int):
+        return id_field(value, id_size)
+    data = value.encode('utf-8')
+    return _int32(len(data)) + data
+
+
+def binary_strings(values):
+    """Return a row of strings as length-prefixed fields, encoded in one pass"""
+    parts = []
+    for data in '\0'.join(values).encode('utf-8').split(b'\0'):
+        parts.append(_int32(len(data)))
+        parts.append(data)
+    return b''.join(parts)
+
+
+def verb_tuples(verbs, id_size=ID_SIZE):
+    """Yield binary verbs tuples with ids numbered from 1"""
+    field_count = _int16(len(VERB_COPY_COLUMNS))
+    for verb_id, verb_data in enumerate(unique_verbs(verbs), 1):
+        yield field_count + id_field(verb_id, id_size) + binary_strings(verb_row(verb_data))
+
+
+def conjugation_tuples(verbs, id_size=ID_SIZE, verb_id_size=None):
+    """Yield binary verb_conjugations tuples; row i belongs to verb i"""
+    field_count = _int16(len(CONJUGATION_COPY_COLUMNS))
+    verb_id_size = verb_id_size or id_size
+    for verb_id, verb_data in enumerate(unique_verbs(verbs), 1):
+        yield (field_count + id_field(verb_id, id_size) + id_field(verb_id, verb_id_size)
+               + binary_strings(conjugation_row(verb_data)))
+
+
+def binary_copy_chunks(tuples, batch=TUPLE_BATCH):
+    """Yield a complete binary COPY stream in chunks of batch tuples"""
+    yield PGCOPY_HEADER
+    pending = []
+    for data in tuples:
+        pending.append(data)
+        if len(pending) == batch:
+            yield b''.join(pending)
+            pending = []
+    if pending:
+        yield b''.join(pending)
+    yield PGCOPY_TRAILER
+
+
+def write_binary_verbs(verbs_out, conjugations_out, verbs, id_size=ID_SIZE):
+    """Write verbs and verb_conjugations binary COPY files in one pass; returns the verb count"""
+    verb_field_count = _int16(len(VERB_COPY_COLUMNS))
+    conjugation_field_count = _int16(len(CONJUGATION_COPY_COLUMNS))
+    verbs_out.write(PGCOPY_HEADER)
+    conjugations_out.write(PGCOPY_HEADER)
+    count = 0
+    for verb_data in unique_verbs(verbs):
+        count += 1
+        ids = id_field(count, id_size)
+        verbs_out.write(verb_field_count + ids + binary_strings(verb_row(verb_data)))
+        conjugations_out.write(conjugation_field_count + ids + ids + binary_strings(conjugation_row(verb_data)))
+    verbs_out.write(PGCOPY_TRAILER)
+    conjugations_out.write(PGCOPY_TRAILER)
+    return count
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterable of byte chunks, for copy_expert"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b'')
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+def _copy_sql(table, columns, fmt):
+    return f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT {fmt})"
+
+
+def _reset_sequences(cur):
+    for table in ('verbs', 'verb_conjugations'):
+        cur.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"COALESCE(MAX(id), 0) + 1, false) FROM {table}")
+
+
+def id_sizes(cur):
+    """Return the width of verbs.id, verb_conjugations.id and verb_conjugations.verb_id"""
+    cur.execute("SELECT attrelid::regclass::text, attname, format_type(atttypid, NULL) FROM pg_attribute "
+                "WHERE attrelid IN ('verbs'::regclass, 'verb_conjugations'::regclass) "
+                "AND attname IN ('id', 'verb_id') AND NOT attisdropped")
+    types = {(table, column): column_type for table, column, column_type in cur.fetchall()}
+    sizes = []
+    for column in (('verbs', 'id'), ('verb_conjugations', 'id'), ('verb_conjugations', 'verb_id')):
+        column_type = types.get(column)
+        if column_type not in ID_TYPE_SIZES:
+            raise ValueError(f"{'.'.join(column)} is {column_type or 'missing'}, expected integer or bigint")
+        sizes.append(ID_TYPE_SIZES[column_type])
+    return tuple(sizes)
+
+
+def load_binary(conn, corpus_path=None):
+    """Replace verbs and verb_conjugations with the corpus using binary COPY
+
+    Both tables are truncated and reloaded in the connection's current
+    transaction, which is committed on success. Ids are encoded with the
+    width of the live id columns. Returns the verb count.
+    """
+    with conn.cursor() as cur:
+        verb_size, conjugation_size, verb_id_size = id_sizes(cur)
+        cur.execute("TRUNCATE TABLE verb_conjugations, verbs RESTART IDENTITY CASCADE")
+        cur.copy_expert(_copy_sql('verbs', VERB_COPY_COLUMNS, 'binary'),
+                        ChunkReader(binary_copy_chunks(verb_tuples(iter_verbs(corpus_path), verb_size))))
+        cur.copy_expert(_copy_sql('verb_conjugations', CONJUGATION_COPY_COLUMNS, 'binary'),
+                        ChunkReader(binary_copy_chunks(conjugation_tuples(iter_verbs(corpus_path), conjugation_size,
+                                                                          verb_id_size))))
+        _reset_sequences(cur)
+        cur.execute("SELECT COUNT(*) FROM verbs")
+        count = cur.fetchone()[0]
+    conn.commit()
+    return count
+
+
+def _load_insert(cur, sql):
+    cur.execute("TRUNCATE TABLE verb_conjugations, verbs RESTART IDENTITY CASCADE")
+    cur.execute(sql.decode('utf-8'))
+
+
+def _load_text_copy(cur, verbs_data, conjugations_data):
+    cur.execute("TRUNCATE TABLE verb_conjugations, verbs RESTART IDENTITY CASCADE")
+    cur.copy_expert(_copy_sql('verbs', VERB_COPY_COLUMNS, 'text'), io.BytesIO(verbs_data))
+    cur.copy_expert(_copy_sql('verb_conjugations', CONJUGATION_COPY_COLUMNS, 'text'), io.BytesIO(conjugations_data))
+
+
+def _load_binary_copy(cur, verbs_data, conjugations_data):
+    cur.execute("TRUNCATE TABLE verb_conjugations, verbs RESTART IDENTITY CASCADE")
+    cur.copy_expert(_copy_sql('verbs', VERB_COPY_COLUMNS, 'binary'), io.BytesIO(verbs_data))
+    cur.copy_expert(_copy_sql('verb_conjugations', CONJUGATION_COPY_COLUMNS, 'binary'), io.BytesIO(conjugations_data))
+
+
+def benchmark(corpus_path=None, dsn=None, repeat=5):
+    """Compare INSERT, text COPY and binary COPY output on the full corpus
+
+    Reports the best formatting time and output size of each path. With a
+    DSN, each output is also loaded (verbs and verb_conjugations are
+    truncated!) and the best load time reported.
+    """
+    verbs = list(unique_verbs(load_verbs(corpus_path)))
+
+    def insert_sql():
+        out = io.StringIO()
+        out.write("DO $$\nDECLARE\n  verb_id INT;\nBEGIN\n")
+        write_returning_import(out, verbs)
+        out.write("END $$;\n")
+        return (out.getvalue().encode('utf-8'),)
+
+    def text_copy():
+        verbs_out, conjugations_out = io.StringIO(), io.StringIO()
+        write_copy_verbs(verbs_out, conjugations_out, verbs)
+        return verbs_out.getvalue().encode('utf-8'), conjugations_out.getvalue().encode('utf-8')
+
+    def binary_copy():
+        verbs_out, conjugations_out = io.BytesIO(), io.BytesIO()
+        write_binary_verbs(verbs_out, conjugations_out, verbs)
+        return verbs_out.getvalue(), conjugations_out.getvalue()
+
+    paths = [('INSERT (DO block)', insert_sql, _load_insert),
+             ('text COPY', text_copy, _load_text_copy),
+             ('binary COPY', binary_copy, _load_binary_copy)]
+
+    conn = None
+    if dsn:
+        import psycopg2
+        conn = psycopg2.connect(dsn)
+
+    print(f"{len(verbs)} verbs, {len(CONJUGATION_COLUMNS)} conjugation columns")
+    print(f"{'path':<20}{'format':>10}{'size':>12}{'load':>10}")
+    for name, produce, load in paths:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            outputs = produce()
+            times.append(time.perf_counter() - start)
+        size = sum(len(data) for data in outputs)
+        load_time = ''
+        if conn is not None:
+            load_times = []
+            for _ in range(repeat):
+                with conn.cursor() as cur:
+                    start = time.perf_counter()
+                    load(cur, *outputs)
+                    conn.commit()
+                    load_times.append(time.perf_counter() - start)
+            load_time = f"{min(load_times) * 1000:.0f} ms"
+        print(f"{name:<20}{min(times) * 1000:>7.0f} ms{size / 1024:>9.0f} KB{load_time:>10}")
+
+    if conn is not None:
+        with conn.cursor() as cur:
+            _reset_sequences(cur)
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Binary COPY for verbs and verb_conjugations")
+    parser.add_argument('command', choices=('bench', 'load'))
+    parser.add_argument('corpus', nargs='?', default=None)
+    parser.add_argument('--dsn', help="libpq connection string (required for load)")
+    args = parser.parse_args()
+
+    if args.command == 'bench':
+        benchmark(args.corpus, args.dsn)
+    else:
+        if not args.dsn:
+            parser.error("load requires --dsn")
+        import psycopg2
+        start = time.perf_counter()
+        with psycopg2.connect(args.dsn) as conn:
+            count = load_binary(conn, args.corpus)
+        print(f"✓ Loaded {count} verbs in {time.perf_counter() - start:.2f}s")
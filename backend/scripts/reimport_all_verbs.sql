@@ -1,6 +1,5 @@
 -- Reimport all verbs into database
 -- Generated: 2025-10-31
--- Total verbs: 984
 
 -- Clear existing verbs
 TRUNCATE TABLE verbs RESTART IDENTITY CASCADE;
@@ -211,7 +210,7 @@ INSERT INTO verbs (infinitive, conjugations) VALUES
 ('étouffer', '{"Infinitif": "étouffer", "ParticipePasse": "étouffé", "ParticipePresent": "étouffant", "Auxiliaire": "avoir", "FormePronominale": "s''étouffer", "Present": ["étouffe", "étouffes", "étouffe", "étouffons", "étouffez", "étouffent"], "Imparfait": ["étouffais", "étouffais", "étouffait", "étouffions", "étouffiez", "étouffaient"], "PasseSimple": ["étouffai", "étouffas", "étouffa", "étouffâmes", "étouffâtes", "étouffèrent"], "FuturSimple": ["étoufferai", "étoufferas", "étouffera", "étoufferons", "étoufferez", "étoufferont"], "PasseCompose": ["ai étouffé", "as étouffé", "a étouffé", "avons étouffé", "avez étouffé", "ont étouffé"], "PlusQueParfait": ["avais étouffé", "avais étouffé", "avait étouffé", "avions étouffé", "aviez étouffé", "avaient étouffé"], "PasseAnterieur": ["eus étouffé", "eus étouffé", "eut étouffé", "eûmes étouffé", "eûtes étouffé", "eurent étouffé"], "FuturAnterieur": ["aurai étouffé", "auras étouffé", "aura étouffé", "aurons étouffé", "aurez étouffé", "auront étouffé"], "SubjonctifPresent": ["étouffe", "étouffes", "étouffe", "étouffions", "étouffiez", "étouffent"], "SubjonctifImparfait": ["étouffasse", "étouffasses", "étouffât", "étouffassions", "étouffassiez", "étouffassent"], "SubjonctifPasse": ["aie étouffé", "aies étouffé", "ait étouffé", "ayons étouffé", "ayez étouffé", "aient étouffé"], "SubjonctifPlusQueParfait": ["eusse étouffé", "eusses étouffé", "eût étouffé", "eussions étouffé", "eussiez étouffé", "eussent étouffé"], "ConditionnelPresent": ["étoufferais", "étoufferais", "étoufferait", "étoufferions", "étoufferiez", "étoufferaient"], "ConditionnelPasse": ["aurais étouffé", "aurais étouffé", "aurait étouffé", "aurions étouffé", "auriez étouffé", "auraient étouffé"], "ConditionnelPasseII": ["eusse étouffé", "eusses étouffé", "eût étouffé", "eussions étouffé", "eussiez étouffé", "eussent étouffé"], "Imperatif": ["", "étouffe !", "", "étouffons !", "étouffez !", ""], "ImperatifPasse": ["", "aie étouffé !", "", "ayons étouffé !", "ayez étouffé !", ""]}'::jsonb),
 ('étudier', '{"Infinitif": "étudier", "ParticipePasse": "étudié", "ParticipePresent": "étudiant", "Auxiliaire": "avoir", "Present": ["étudie", "étudies", "étudie", "étudions", "étudiez", "étudient"], "Imparfait": ["étudiais", "étudiais", "étudiait", "étudiions", "étudiiez", "étudiaient"], "PasseSimple": ["étudiai", "étudias", "étudia", "étudiâmes", "étudiâtes", "étudièrent"], "FuturSimple": ["étudierai", "étudieras", "étudiera", "étudierons", "étudierez", "étudieront"], "PasseCompose": ["ai étudié", "as étudié", "a étudié", "avons étudié", "avez étudié", "ont étudié"], "PlusQueParfait": ["avais étudié", "avais étudié", "avait étudié", "avions étudié", "aviez étudié", "avaient étudié"], "PasseAnterieur": ["eus étudié", "eus étudié", "eut étudié", "eûmes étudié", "eûtes étudié", "eurent étudié"], "FuturAnterieur": ["aurai étudié", "auras étudié", "aura étudié", "aurons étudié", "aurez étudié", "auront étudié"], "SubjonctifPresent": ["étudie", "étudies", "étudie", "étudiions", "étudiiez", "étudient"], "SubjonctifImparfait": ["étudiasse", "étudiasses", "étudiât", "étudiassions", "étudiassiez", "étudiassent"], "SubjonctifPasse": ["aie étudié", "aies étudié", "ait étudié", "ayons étudié", "ayez étudié", "aient étudié"], "SubjonctifPlusQueParfait": ["eusse étudié", "eusses étudié", "eût étudié", "eussions étudié", "eussiez étudié", "eussent étudié"], "ConditionnelPresent": ["étudierais", "étudierais", "étudierait", "étudierions", "étudieriez", "étudieraient"], "ConditionnelPasse": ["aurais étudié", "aurais étudié", "aurait étudié", "aurions étudié", "auriez étudié", "auraient étudié"], "ConditionnelPasseII": ["eusse étudié", "eusses étudié", "eût étudié", "eussions étudié", "eussiez étudié", "eussent étudié"], "Imperatif": ["", "étudie !", "", "étudions !", "étudiez !", ""], "ImperatifPasse": ["", "aie étudié !", "", "ayons étudié !", "ayez étudié !", ""]}'::jsonb),
 ('éviter', '{"Infinitif": "éviter", "ParticipePasse": "évité", "ParticipePresent": "évitant", "Auxiliaire": "avoir", "Present": ["évite", "évites", "évite", "évitons", "évitez", "évitent"], "Imparfait": ["évitais", "évitais", "évitait", "évitions", "évitiez", "évitaient"], "PasseSimple": ["évitai", "évitas", "évita", "évitâmes", "évitâtes", "évitèrent"], "FuturSimple": ["éviterai", "éviteras", "évitera", "éviterons", "éviterez", "éviteront"], "PasseCompose": ["ai évité", "as évité", "a évité", "avons évité", "avez évité", "ont évité"], "PlusQueParfait": ["avais évité", "avais évité", "avait évité", "avions évité", "aviez évité", "avaient évité"], "PasseAnterieur": ["eus évité", "eus évité", "eut évité", "eûmes évité", "eûtes évité", "eurent évité"], "FuturAnterieur": ["aurai évité", "auras évité", "aura évité", "aurons évité", "aurez évité", "auront évité"], "SubjonctifPresent": ["évite", "évites", "évite", "évitions", "évitiez", "évitent"], "SubjonctifImparfait": ["évitasse", "évitasses", "évitât", "évitassions", "évitassiez", "évitassent"], "SubjonctifPasse": ["aie évité", "aies évité", "ait évité", "ayons évité", "ayez évité", "aient évité"], "SubjonctifPlusQueParfait": ["eusse évité", "eusses évité", "eût évité", "eussions évité", "eussiez évité", "eussent évité"], "ConditionnelPresent": ["éviterais", "éviterais", "éviterait", "éviterions", "éviteriez", "éviteraient"], "ConditionnelPasse": ["aurais évité", "aurais évité", "aurait évité", "aurions évité", "auriez évité", "auraient évité"], "ConditionnelPasseII": ["eusse évité", "eusses évité", "eût évité", "eussions évité", "eussiez évité", "eussent évité"], "Imperatif": ["", "évite !", "", "évitons !", "évitez !", ""], "ImperatifPasse": ["", "aie évité !", "", "ayons évité !", "ayez évité !", ""]}'::jsonb),
-('être', '{"Infinitif": "être", "ParticipePasse": "été", "ParticipePresent": "étant", "Auxiliaire": "avoir", "Present": ["suis", "es", "est", "sommes", "êtes", "sont"], "Imparfait": ["étais", "étais", "était", "étions", "étiez", "étaient"], "PasseSimple": ["fus", "fus", "fut", "fûmes", "fûtes", "furent"], "FuturSimple": ["serai", "seras", "sera", "serons", "serez", "seront"], "PasseCompose": ["ai été", "as été", "a été", "avons été", "avez été", "ont été"], "PlusQueParfait": ["avais été", "avais été", "avait été", "avions été", "aviez été", "avaient été"], "PasseAnterieur": ["eus été", "eus été", "eut été", "eûmes été", "eûtes été", "eurent été"], "FuturAnterieur": ["aurai été", "auras été", "aura été", "aurons été", "aurez été", "auront été"], "SubjonctifPresent": ["sois", "sois", "soit", "soyons", "soyez", "soient"], "SubjonctifImparfait": ["fusse", "fusses", "fût", "fussions", "fussiez", "fussent"], "SubjonctifPasse": ["aie été", "aies été", "ait été", "ayons été", "ayez été", "aient été"], "SubjonctifPlusQueParfait": ["eusse été", "eusses été", "eût été", "eussions été", "eussiez été", "eussent été"], "ConditionnelPresent": ["serais", "serais", "serait", "serions", "seriez", "seraient"], "ConditionnelPasse": ["aurais été", "aurais été", "aurait été", "aurions été", "auriez été", "auraient été"], "ConditionnelPasseII": ["eusse été", "eusses été", "eût été", "eussions été", "eussiez été", "eussent été"], "Imperatif": ["", "sois !", "", "soyons !", "soyez !", ""], "ImperatifPasse": ["", "aie été !", "", "ayons été !", "ayez été !", ""]}'::jsonb),
+('être', '{"Infinitif": "être", "ParticipePasse": "été", "ParticipePresent": "étant", "Auxiliaire": "avoir", "Present": ["suis", "es", "est", "sommes", "êtes", "sont"], "Imparfait": ["étais", "étais", "était", "étions", "étiez", "étaient"], "PasseSimple": ["fus", "fus", "fut", "fûmes", "fûtes", "furent"], "FuturSimple": ["serai", "seras", "sera", "serons", "serez", "seront"], "PasseCompose": ["ai été", "as été", "a été", "avons été", "avez été", "ont été"], "PlusQueParfait": ["avais été", "avais été", "avait été", "avions été", "aviez été", "avaient été"], "PasseAnterieur": ["eus été", "eus été", "eut été", "eûmes été", "eûtes été", "eurent été"], "FuturAnterieur": ["aurai été", "auras été", "aura été", "aurons été", "aurez été", "auront été"], "SubjonctifPresent": ["sois", "sois", "soit", "soyons", "soyez", "soient"], "SubjonctifImparfait": ["fusse", "fusses", "fût", "fussions", "fussiez", "fussent"], "SubjonctifPasse": ["aie été", "aies été", "ait été", "ayons été", "ayez été", "aient été"], "SubjonctifPlusQueParfait": ["eusse été", "eusses été", "eût été", "eussions été", "eussiez été", "eussent été"], "ConditionnelPresent": ["serais", "serais", "serait", "serions", "seriez", "seraient"], "ConditionnelPasse": ["aurais été", "aurais été", "aurait été", "aurions été", "auriez été", "auraient été"], "ConditionnelPasseII": ["eusse été", "eusses été", "eût été", "eussions été", "eussiez été", "eussent été"], "Imperatif": ["", "sois !", "", "soyons !", "soyez !", ""], "ImperatifPasse": ["", "aie été !", "", "ayons été !", "ayez été !", ""]}'::jsonb),
 ('faillir', '{"Infinitif": "faillir", "ParticipePasse": "faillant", "ParticipePresent": "faillissant,", "Auxiliaire": "avoir", "Present": ["faillis, faux *old spelling", "faillis, faux", "faillit, faut", "faillissons, faillons", "faillissez, faillez", "faillissent, faillent"], "Imparfait": ["faillissais, faillais", "faillissais, faillais", "faillissait, faillait", "faillissions, faillions", "faillissiez, failliez", "faillissaient, faillaient"], "PasseSimple": ["faillis", "faillis", "faillit", "faillîmes", "faillîtes", "faillirent"], "FuturSimple": ["faillirai, faudrai", "failliras, faudras", "faillira, faudra", "faillirons, faudrons", "faillirez, faudrez", "failliront, faudront"], "PasseCompose": ["ai failli", "as failli", "a failli", "avons failli", "avez failli", "ont failli"], "PlusQueParfait": ["avais failli", "avais failli", "avait failli", "avions failli", "aviez failli", "avaient failli"], "PasseAnterieur": ["eus failli", "eus failli", "eut failli", "eûmes failli", "eûtes failli", "eurent failli"], "FuturAnterieur": ["aurai failli", "auras failli", "aura failli", "aurons failli", "aurez failli", "auront failli"], "SubjonctifPresent": ["faillisse, faille", "faillisses, failles", "faillisse, faille", "faillissions, faillions", "faillissiez, failliez", "faillissent, faillent"], "SubjonctifImparfait": ["faillisse", "faillisses", "faillît", "faillissions", "faillissiez", "faillissent"], "SubjonctifPasse": ["aie failli", "aies failli", "ait failli", "ayons failli", "ayez failli", "aient failli"], "SubjonctifPlusQueParfait": ["eusse failli", "eusses failli", "eût failli", "eussions failli", "eussiez failli", "eussent failli"], "ConditionnelPresent": ["faillirais, faudrais", "faillirais, faudrais", "faillirait, faudrait", "faillirions, faudrions", "failliriez, faudriez", "failliraient, faudraient"], "ConditionnelPasse": ["aurais failli", "aurais failli", "aurait failli", "aurions failli", "auriez failli", "auraient failli"], "ConditionnelPasseII": ["eusse failli", "eusses failli", "eût failli", "eussions failli", "eussiez failli", "eussent failli"]}'::jsonb),
 ('faire', '{"Infinitif": "faire", "ParticipePasse": "fait", "ParticipePresent": "faisant", "Auxiliaire": "avoir", "FormePronominale": "se faire", "Present": ["fais", "fais", "fait", "faisons", "faites", "font"], "Imparfait": ["faisais", "faisais", "faisait", "faisions", "faisiez", "faisaient"], "PasseSimple": ["fis", "fis", "fit", "fîmes", "fîtes", "firent"], "FuturSimple": ["ferai", "feras", "fera", "ferons", "ferez", "feront"], "PasseCompose": ["ai fait", "as fait", "a fait", "avons fait", "avez fait", "ont fait"], "PlusQueParfait": ["avais fait", "avais fait", "avait fait", "avions fait", "aviez fait", "avaient fait"], "PasseAnterieur": ["eus fait", "eus fait", "eut fait", "eûmes fait", "eûtes fait", "eurent fait"], "FuturAnterieur": ["aurai fait", "auras fait", "aura fait", "aurons fait", "aurez fait", "auront fait"], "SubjonctifPresent": ["fasse", "fasses", "fasse", "fassions", "fassiez", "fassent"], "SubjonctifImparfait": ["fisse", "fisses", "fît", "fissions", "fissiez", "fissent"], "SubjonctifPasse": ["aie fait", "aies fait", "ait fait", "ayons fait", "ayez fait", "aient fait"], "SubjonctifPlusQueParfait": ["eusse fait", "eusses fait", "eût fait", "eussions fait", "eussiez fait", "eussent fait"], "ConditionnelPresent": ["ferais", "ferais", "ferait", "ferions", "feriez", "feraient"], "ConditionnelPasse": ["aurais fait", "aurais fait", "aurait fait", "aurions fait", "auriez fait", "auraient fait"], "ConditionnelPasseII": ["eusse fait", "eusses fait", "eût fait", "eussions fait", "eussiez fait", "eussent fait"], "Imperatif": ["", "fais !", "", "faisons !", "faites !", ""], "ImperatifPasse": ["", "aie fait !", "", "ayons fait !", "ayez fait !", ""]}'::jsonb),
 ('falloir', '{"Infinitif": "falloir", "ParticipePasse": "fallu", "Auxiliaire": "avoir", "Present": ["", "", "faut", "", "", ""], "Imparfait": ["", "", "fallait", "", "", ""], "PasseSimple": ["", "", "fallut", "", "", ""], "FuturSimple": ["", "", "faudra", "", "", ""], "PasseCompose": ["", "", "a fallu", "", "", ""], "PlusQueParfait": ["", "", "avait fallu", "", "", ""], "PasseAnterieur": ["", "", "eut fallu", "", "", ""], "FuturAnterieur": ["", "", "aura fallu", "", "", ""], "SubjonctifPresent": ["", "", "faille", "", "", ""], "SubjonctifImparfait": ["", "", "fallût", "", "", ""], "SubjonctifPasse": ["", "", "ait fallu", "", "", ""], "SubjonctifPlusQueParfait": ["", "", "eût fallu", "", "", ""], "ConditionnelPresent": ["", "", "faudrait", "", "", ""], "ConditionnelPasse": ["", "", "aurait fallu", "", "", ""], "ConditionnelPasseII": ["", "", "eût fallu", "", "", ""]}'::jsonb),
@@ -989,7 +988,6 @@ INSERT INTO verbs (infinitive, conjugations) VALUES
 ('introduire', '{"Infinitif": "introduire", "ParticipePasse": "introduiu", "ParticipePresent": "introduiant", "Auxiliaire": "avoir", "FormePronominale": "se introduire", "Present": ["introduis", "introduis", "introdui", "introduions", "introduiez", "introduient"], "Imparfait": ["introduiais", "introduiais", "introduiait", "introduiions", "introduiiez", "introduiaient"], "PasseSimple": ["introduiis", "introduiis", "introduiit", "introduiîmes", "introduiîtes", "introduiirent"], "FuturSimple": ["introduirai", "introduiras", "introduira", "introduirons", "introduirez", "introduiront"], "PasseCompose": ["ai introduiu", "as introduiu", "a introduiu", "avons introduiu", "avez introduiu", "ont introduiu"], "PlusQueParfait": ["avais introduiu", "avais introduiu", "avait introduiu", "avions introduiu", "aviez introduiu", "avaient introduiu"], "PasseAnterieur": ["eus introduiu", "eus introduiu", "eut introduiu", "eûmes introduiu", "eûtes introduiu", "eurent introduiu"], "FuturAnterieur": ["aurai introduiu", "auras introduiu", "aura introduiu", "aurons introduiu", "aurez introduiu", "auront introduiu"], "SubjonctifPresent": ["introduie", "introduies", "introduie", "introduiions", "introduiiez", "introduient"], "SubjonctifImparfait": ["introduiisse", "introduiisses", "introduiît", "introduiissions", "introduiissiez", "introduiissent"], "SubjonctifPasse": ["aie introduiu", "aies introduiu", "ait introduiu", "ayons introduiu", "ayez introduiu", "aient introduiu"], "SubjonctifPlusQueParfait": ["eusse introduiu", "eusses introduiu", "eût introduiu", "eussions introduiu", "eussiez introduiu", "eussent introduiu"], "ConditionnelPresent": ["introduirais", "introduirais", "introduirait", "introduirions", "introduiriez", "introduiraient"], "ConditionnelPasse": ["aurais introduiu", "aurais introduiu", "aurait introduiu", "aurions introduiu", "auriez introduiu", "auraient introduiu"], "ConditionnelPasseII": ["eusse introduiu", "eusses introduiu", "eût introduiu", "eussions introduiu", "eussiez introduiu", "eussent introduiu"], "Imperatif": ["", "introduis !", "", "introduions !", "introduiez !", ""], "ImperatifPasse": ["", "aie introduiu !", "", "ayons introduiu !", "ayez introduiu !", ""]}'::jsonb),
 ('reproduire', '{"Infinitif": "reproduire", "ParticipePasse": "reproduiu", "ParticipePresent": "reproduiant", "Auxiliaire": "avoir", "FormePronominale": "se reproduire", "Present": ["reproduis", "reproduis", "reprodui", "reproduions", "reproduiez", "reproduient"], "Imparfait": ["reproduiais", "reproduiais", "reproduiait", "reproduiions", "reproduiiez", "reproduiaient"], "PasseSimple": ["reproduiis", "reproduiis", "reproduiit", "reproduiîmes", "reproduiîtes", "reproduiirent"], "FuturSimple": ["reproduirai", "reproduiras", "reproduira", "reproduirons", "reproduirez", "reproduiront"], "PasseCompose": ["ai reproduiu", "as reproduiu", "a reproduiu", "avons reproduiu", "avez reproduiu", "ont reproduiu"], "PlusQueParfait": ["avais reproduiu", "avais reproduiu", "avait reproduiu", "avions reproduiu", "aviez reproduiu", "avaient reproduiu"], "PasseAnterieur": ["eus reproduiu", "eus reproduiu", "eut reproduiu", "eûmes reproduiu", "eûtes reproduiu", "eurent reproduiu"], "FuturAnterieur": ["aurai reproduiu", "auras reproduiu", "aura reproduiu", "aurons reproduiu", "aurez reproduiu", "auront reproduiu"], "SubjonctifPresent": ["reproduie", "reproduies", "reproduie", "reproduiions", "reproduiiez", "reproduient"], "SubjonctifImparfait": ["reproduiisse", "reproduiisses", "reproduiît", "reproduiissions", "reproduiissiez", "reproduiissent"], "SubjonctifPasse": ["aie reproduiu", "aies reproduiu", "ait reproduiu", "ayons reproduiu", "ayez reproduiu", "aient reproduiu"], "SubjonctifPlusQueParfait": ["eusse reproduiu", "eusses reproduiu", "eût reproduiu", "eussions reproduiu", "eussiez reproduiu", "eussent reproduiu"], "ConditionnelPresent": ["reproduirais", "reproduirais", "reproduirait", "reproduirions", "reproduiriez", "reproduiraient"], "ConditionnelPasse": ["aurais reproduiu", "aurais reproduiu", "aurait reproduiu", "aurions reproduiu", "auriez reproduiu", "auraient reproduiu"], "ConditionnelPasseII": ["eusse reproduiu", "eusses reproduiu", "eût reproduiu", "eussions reproduiu", "eussiez reproduiu", "eussent reproduiu"], "Imperatif": ["", "reproduis !", "", "reproduions !", "reproduiez !", ""], "ImperatifPasse": ["", "aie reproduiu !", "", "ayons reproduiu !", "ayez reproduiu !", ""]}'::jsonb),
 ('séduire', '{"Infinitif": "séduire", "ParticipePasse": "séduiu", "ParticipePresent": "séduiant", "Auxiliaire": "avoir", "FormePronominale": "se séduire", "Present": ["séduis", "séduis", "sédui", "séduions", "séduiez", "séduient"], "Imparfait": ["séduiais", "séduiais", "séduiait", "séduiions", "séduiiez", "séduiaient"], "PasseSimple": ["séduiis", "séduiis", "séduiit", "séduiîmes", "séduiîtes", "séduiirent"], "FuturSimple": ["séduirai", "séduiras", "séduira", "séduirons", "séduirez", "séduiront"], "PasseCompose": ["ai séduiu", "as séduiu", "a séduiu", "avons séduiu", "avez séduiu", "ont séduiu"], "PlusQueParfait": ["avais séduiu", "avais séduiu", "avait séduiu", "avions séduiu", "aviez séduiu", "avaient séduiu"], "PasseAnterieur": ["eus séduiu", "eus séduiu", "eut séduiu", "eûmes séduiu", "eûtes séduiu", "eurent séduiu"], "FuturAnterieur": ["aurai séduiu", "auras séduiu", "aura séduiu", "aurons séduiu", "aurez séduiu", "auront séduiu"], "SubjonctifPresent": ["séduie", "séduies", "séduie", "séduiions", "séduiiez", "séduient"], "SubjonctifImparfait": ["séduiisse", "séduiisses", "séduiît", "séduiissions", "séduiissiez", "séduiissent"], "SubjonctifPasse": ["aie séduiu", "aies séduiu", "ait séduiu", "ayons séduiu", "ayez séduiu", "aient séduiu"], "SubjonctifPlusQueParfait": ["eusse séduiu", "eusses séduiu", "eût séduiu", "eussions séduiu", "eussiez séduiu", "eussent séduiu"], "ConditionnelPresent": ["séduirais", "séduirais", "séduirait", "séduirions", "séduiriez", "séduiraient"], "ConditionnelPasse": ["aurais séduiu", "aurais séduiu", "aurait séduiu", "aurions séduiu", "auriez séduiu", "auraient séduiu"], "ConditionnelPasseII": ["eusse séduiu", "eusses séduiu", "eût séduiu", "eussions séduiu", "eussiez séduiu", "eussent séduiu"], "Imperatif": ["", "séduis !", "", "séduions !", "séduiez !", ""], "ImperatifPasse": ["", "aie séduiu !", "", "ayons séduiu !", "ayez séduiu !", ""]}'::jsonb),
-('être', '{"Infinitif": "être", "ParticipePasse": "été", "ParticipePresent": "étant", "Auxiliaire": "avoir", "FormePronominale": "", "Present": ["suis", "es", "est", "sommes", "êtes", "sont"], "Imparfait": ["étais", "étais", "était", "étions", "étiez", "étaient"], "PasseSimple": ["fus", "fus", "fut", "fûmes", "fûtes", "furent"], "FuturSimple": ["serai", "seras", "sera", "serons", "serez", "seront"], "PasseCompose": ["ai été", "as été", "a été", "avons été", "avez été", "ont été"], "PlusQueParfait": ["avais été", "avais été", "avait été", "avions été", "aviez été", "avaient été"], "PasseAnterieur": ["eus été", "eus été", "eut été", "eûmes été", "eûtes été", "eurent été"], "FuturAnterieur": ["aurai été", "auras été", "aura été", "aurons été", "aurez été", "auront été"], "SubjonctifPresent": ["sois", "sois", "soit", "soyons", "soyez", "soient"], "SubjonctifImparfait": ["fusse", "fusses", "fût", "fussions", "fussiez", "fussent"], "SubjonctifPasse": ["aie été", "aies été", "ait été", "ayons été", "ayez été", "aient été"], "SubjonctifPlusQueParfait": ["eusse été", "eusses été", "eût été", "eussions été", "eussiez été", "eussent été"], "ConditionnelPresent": ["serais", "serais", "serait", "serions", "seriez", "seraient"], "ConditionnelPasse": ["aurais été", "aurais été", "aurait été", "aurions été", "auriez été", "auraient été"], "ConditionnelPasseDeuxiemeForme": ["eusse été", "eusses été", "eût été", "eussions été", "eussiez été", "eussent été"], "Imperatif": ["sois", "soyons", "soyez"], "ImperatifPasse": ["aie été", "ayons été", "ayez été"]}'::jsonb),
 ('neiger', '{"Infinitif": "neiger", "ParticipePasse": "neigé", "ParticipePresent": "neigeant", "Auxiliaire": "avoir", "FormePronominale": "", "Present": ["", "", "neige", "", "", ""], "Imparfait": ["", "", "neigeait", "", "", ""], "PasseSimple": ["", "", "neigea", "", "", ""], "FuturSimple": ["", "", "neigera", "", "", ""], "PasseCompose": ["", "", "a neigé", "", "", ""], "PlusQueParfait": ["", "", "avait neigé", "", "", ""], "PasseAnterieur": ["", "", "eut neigé", "", "", ""], "FuturAnterieur": ["", "", "aura neigé", "", "", ""], "SubjonctifPresent": ["", "", "neige", "", "", ""], "SubjonctifImparfait": ["", "", "neigeât", "", "", ""], "SubjonctifPasse": ["", "", "ait neigé", "", "", ""], "SubjonctifPlusQueParfait": ["", "", "eût neigé", "", "", ""], "ConditionnelPresent": ["", "", "neigerait", "", "", ""], "ConditionnelPasse": ["", "", "aurait neigé", "", "", ""], "ConditionnelPasseDeuxiemeForme": ["", "", "eût neigé", "", "", ""], "Imperatif": ["", "", ""], "ImperatifPasse": ["", "", ""]}'::jsonb);
 
--- Total verbs inserted: 984
\ No newline at end of file
+-- Total verbs inserted: 983
\ No newline at end of file
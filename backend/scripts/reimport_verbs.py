@@ -2,47 +2,53 @@
 # -*- coding: utf-8 -*-
 """
 Generate SQL to reimport all verbs into database
+
+With --swap the verbs are loaded into a shadow table that replaces the live
+one in one short transaction (see shadow_swap.py) instead of truncating it,
+and written to reimport_all_verbs_swap.sql unless -o is given.
 """
 
-import json
-
-# Load all verbs from updated conjugation.json
-with open('conjugation.json', 'r', encoding='utf-8') as f:
-    all_verbs = json.load(f)
-
-print(f"Generating SQL for {len(all_verbs)} verbs...")
-
-# Generate SQL
-sql_lines = [
-    "-- Reimport all verbs into database",
-    "-- Generated: 2025-10-31",
-    f"-- Total verbs: {len(all_verbs)}",
-    "",
-    "-- Clear existing verbs",
-    "TRUNCATE TABLE verbs RESTART IDENTITY CASCADE;",
-    "",
-    "-- Insert all verbs",
-    "INSERT INTO verbs (infinitive, conjugations) VALUES"
-]
-
-verb_values = []
-for verb_data in all_verbs:
-    infinitive = verb_data.get('Infinitif', '').lower()
-    # Escape single quotes in infinitive
-    infinitive_escaped = infinitive.replace("'", "''")
-    conjugations = json.dumps(verb_data, ensure_ascii=False)
-    conjugations_escaped = conjugations.replace("'", "''")
-    
-    verb_values.append(f"('{infinitive_escaped}', '{conjugations_escaped}'::jsonb)")
-
-sql_lines.append(',\n'.join(verb_values) + ';')
-sql_lines.append("")
-sql_lines.append(f"-- Total verbs inserted: {len(all_verbs)}")
-
-# Write to file
-output_file = 'reimport_all_verbs.sql'
-with open(output_file, 'w', encoding='utf-8') as f:
-    f.write('\n'.join(sql_lines))
-
-print(f"✓ Generated SQL file: {output_file}")
-print(f"  Total verbs: {len(all_verbs)}")
+import argparse
+import sys
+
+from shadow_swap import shadow_table, write_swap_reload
+from sql_emitter import Batching, add_batching_arguments, open_sql, write_jsonb_insert, write_lines
+from verb_corpus import iter_verbs
+
+parser = argparse.ArgumentParser(description="Generate SQL reimporting all verbs")
+parser.add_argument('--swap', action='store_true',
+                    help="reload through a shadow table and a rename swap instead of TRUNCATE")
+parser.add_argument('-o', '--output', help="output file ('-' for stdout)")
+add_batching_arguments(parser)
+args = parser.parse_args()
+batching = Batching.from_args(args)
+
+# Keep stdout clean when the SQL goes there
+report = sys.stderr if args.output == '-' else sys.stdout
+print("Generating SQL for all verbs...", file=report)
+
+output_file = args.output or ('reimport_all_verbs_swap.sql' if args.swap else 'reimport_all_verbs.sql')
+
+# Stream verbs from conjugation.json straight into the SQL file
+with open_sql(output_file) as f:
+    write_lines(f, [
+        "-- Reimport all verbs into database",
+        "-- Generated: 2025-10-31",
+        "",
+    ])
+    if args.swap:
+        verb_count = write_swap_reload(f, ('verbs',), lambda out: write_jsonb_insert(
+            out, iter_verbs(), batching, table=shadow_table('verbs'), keep_ids_from='verbs'))
+    else:
+        write_lines(f, [
+            "-- Clear existing verbs",
+            "TRUNCATE TABLE verbs RESTART IDENTITY CASCADE;",
+            "",
+            "-- Insert all verbs",
+        ])
+        verb_count = write_jsonb_insert(f, iter_verbs(), batching)
+    f.write("\n")
+    f.write(f"-- Total verbs inserted: {verb_count}")
+
+print(f"✓ Generated SQL file: {output_file}", file=report)
+print(f"  Total verbs: {verb_count}", file=report)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Full table reloads through shadow tables and a rename swap
+
+Instead of TRUNCATE ... CASCADE and a reload on the tables the Go services
+are reading, a swap reload
+
+  1. creates UNLOGGED shadow tables ({table}_new) shaped like the live ones,
+  2. fills them (the caller's statements),
+  3. copies the live primary key, unique, foreign key and index definitions
+     onto them, switches them to LOGGED and runs ANALYZE,
+  4. swaps names in one short transaction, moving the id sequences and the
+     foreign keys of other tables (exercises, user_progresses, ...) over as
+     NOT VALID,
+  5. drops the old tables, restores the original constraint and index names
+     and validates the moved foreign keys.
+
+Readers keep using the live tables until step 4, which only holds its
+ACCESS EXCLUSIVE locks for a few catalog updates; lock_timeout makes it give
+up rather than queue behind a long query. Steps 1-3 hold no lock on the live
+tables, and a failed run leaves them untouched (the next run drops the stale
+shadows). Tables are given parents first.
+
+Usage:
+    from shadow_swap import shadow_table, write_swap_reload
+    write_swap_reload(out, ('verbs', 'verb_conjugations'), write_load)
+"""
+
+from sql_emitter import write_lines
+
+SHADOW_SUFFIX = '_new'
+OLD_SUFFIX = '_old'
+LOCK_TIMEOUT = '5s'
+
+
+def shadow_table(table):
+    """Return the name of a table's shadow"""
+    return f"{table}{SHADOW_SUFFIX}"
+
+
+def _do_block(out, body):
+    write_lines(out, ["DO $$", "DECLARE", "    item record;", "    seq text;", "BEGIN", *body, "END $$;", ""])
+
+
+def _regclass_list(tables):
+    return ', '.join(f"'{table}'::regclass" for table in tables)
+
+
+def _key_columns(keys, relation):
+    return (f"(SELECT string_agg(quote_ident(a.attname), ', ' ORDER BY k.n) FROM unnest({keys}) WITH ORDINALITY "
+            f"k(attnum, n) JOIN pg_attribute a ON a.attrelid = {relation} AND a.attnum = k.attnum)")
+
+
+# pg_constraint columns a foreign key definition is rebuilt from
+FOREIGN_KEY_COLUMNS = (f"{_key_columns('conkey', 'conrelid')} AS cols, "
+                       f"{_key_columns('confkey', 'confrelid')} AS refcols, "
+                       "confrelid, confupdtype, confdeltype, confmatchtype, condeferrable, condeferred")
+
+
+def _fk_action(column):
+    return (f"CASE item.{column} WHEN 'r' THEN 'RESTRICT' WHEN 'c' THEN 'CASCADE' WHEN 'n' THEN 'SET NULL' "
+            "WHEN 'd' THEN 'SET DEFAULT' ELSE 'NO ACTION' END")
+
+
+def _foreign_key_definition(tables):
+    """Return a SQL expression rebuilding the foreign key in item, with tables referenced through their shadows
+
+    The definition is rebuilt from the FOREIGN_KEY_COLUMNS of pg_constraint,
+    matched on confrelid, so schema-qualified or quoted table names in
+    pg_get_constraintdef() do not matter.
+    """
+    shadows = ' '.join(f"WHEN '{table}'::regclass THEN '{shadow_table(table)}'" for table in tables)
+    referenced = f"CASE item.confrelid {shadows} ELSE item.confrelid::regclass::text END"
+    return ("format('FOREIGN KEY (%s) REFERENCES %s(%s)%s ON UPDATE %s ON DELETE %s%s', item.cols, "
+            f"{referenced}, item.refcols, CASE item.confmatchtype WHEN 'f' THEN ' MATCH FULL' ELSE '' END, "
+            f"{_fk_action('confupdtype')}, {_fk_action('confdeltype')}, CASE WHEN item.condeferrable "
+            "THEN ' DEFERRABLE INITIALLY ' || CASE WHEN item.condeferred THEN 'DEFERRED' ELSE 'IMMEDIATE' END "
+            "ELSE '' END)")
+
+
+def write_create_shadows(out, tables):
+    """Write the (re)creation of empty UNLOGGED shadow tables"""
+    write_lines(out, [
+        "-- Shadow tables (dropped first in case an earlier run failed)",
+        f"DROP TABLE IF EXISTS {', '.join(shadow_table(table) for table in reversed(tables))};",
+    ])
+    for table in tables:
+        write_lines(out, [
+            f"CREATE UNLOGGED TABLE {shadow_table(table)} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS);"
+        ])
+    out.write("\n")
+
+
+def write_build_shadows(out, tables):
+    """Write the constraints, indexes, LOGGED switch and ANALYZE of the loaded shadows
+
+    Indexes are built once over the loaded rows rather than maintained row
+    by row, and foreign keys are added NOT VALID and validated in one pass.
+    """
+    write_lines(out, ["-- Constraints and indexes of the live tables, built on the loaded shadows"])
+    for table in tables:
+        shadow = shadow_table(table)
+        _do_block(out, [
+            "    FOR item IN",
+            f"        SELECT conname, contype, pg_get_constraintdef(oid) AS def, {FOREIGN_KEY_COLUMNS}",
+            "        FROM pg_constraint",
+            f"        WHERE conrelid = '{table}'::regclass AND contype IN ('p', 'u', 'x', 'f')",
+            "        ORDER BY contype = 'f', conname",
+            "    LOOP",
+            "        IF item.contype = 'f' THEN",
+            f"            EXECUTE format('ALTER TABLE {shadow} ADD CONSTRAINT %I %s NOT VALID',",
+            f"                           item.conname || '{SHADOW_SUFFIX}', {_foreign_key_definition(tables)});",
+            f"            EXECUTE format('ALTER TABLE {shadow} VALIDATE CONSTRAINT %I', item.conname || '{SHADOW_SUFFIX}');",
+            "        ELSE",
+            f"            EXECUTE format('ALTER TABLE {shadow} ADD CONSTRAINT %I %s', item.conname || '{SHADOW_SUFFIX}', item.def);",
+            "        END IF;",
+            "    END LOOP;",
+            "    -- Indexes that do not belong to a constraint",
+            "    FOR item IN",
+            "        SELECT c.relname, pg_get_indexdef(i.indexrelid) AS def",
+            "        FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid",
+            f"        WHERE i.indrelid = '{table}'::regclass AND NOT EXISTS (",
+            "            SELECT 1 FROM pg_constraint",
+            "            WHERE conindid = i.indexrelid AND conrelid = i.indrelid AND contype IN ('p', 'u', 'x'))",
+            "    LOOP",
+            "        EXECUTE regexp_replace(item.def, 'INDEX \\S+ ON (ONLY )?\\S+',",
+            f"                               format('INDEX %I ON {shadow}', item.relname || '{SHADOW_SUFFIX}'));",
+            "    END LOOP;",
+        ])
+    # Parents first: a logged table cannot reference an unlogged one
+    write_lines(out, [f"ALTER TABLE {shadow_table(table)} SET LOGGED;" for table in tables])
+    write_lines(out, [f"ANALYZE {shadow_table(table)};" for table in tables])
+    out.write("\n")
+
+
+def write_swap(out, tables, lock_timeout=LOCK_TIMEOUT):
+    """Write the transaction that puts the shadows in place of the live tables"""
+    swapped = _regclass_list(tables)
+    body = []
+    for table in tables:
+        shadow = shadow_table(table)
+        body.extend([
+            f"    -- Foreign keys of other tables now reference {shadow}",
+            "    FOR item IN",
+            f"        SELECT conrelid::regclass AS tbl, conname, {FOREIGN_KEY_COLUMNS} FROM pg_constraint",
+            f"        WHERE contype = 'f' AND confrelid = '{table}'::regclass AND conrelid NOT IN ({swapped})",
+            "    LOOP",
+            "        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', item.tbl, item.conname);",
+            "        EXECUTE format('ALTER TABLE %s ADD CONSTRAINT %I %s NOT VALID', item.tbl, item.conname,",
+            f"                       {_foreign_key_definition((table,))});",
+            "    END LOOP;",
+            f"    -- The id sequence must outlive {table}{OLD_SUFFIX}",
+            f"    seq := pg_get_serial_sequence('{table}', 'id');",
+            "    IF seq IS NOT NULL THEN",
+            f"        EXECUTE format('ALTER SEQUENCE %s OWNED BY {shadow}.id', seq);",
+            "    END IF;",
+        ])
+    write_lines(out, [
+        "-- Swap: the only step that locks the live tables",
+        "BEGIN;",
+        f"SET LOCAL lock_timeout = '{lock_timeout}';",
+        f"LOCK TABLE {', '.join(tables)} IN ACCESS EXCLUSIVE MODE;",
+    ])
+    _do_block(out, body)
+    for table in tables:
+        write_lines(out, [
+            f"ALTER TABLE {table} RENAME TO {table}{OLD_SUFFIX};",
+            f"ALTER TABLE {shadow_table(table)} RENAME TO {table};",
+        ])
+    write_lines(out, ["COMMIT;", ""])
+
+
+def write_cleanup(out, tables):
+    """Write the drop of the old tables, the renames back to the original names and FK validation"""
+    write_lines(out, [
+        "-- Cleanup",
+        f"DROP TABLE {', '.join(f'{table}{OLD_SUFFIX}' for table in reversed(tables))};",
+    ])
+    body = []
+    for table in tables:
+        body.extend([
+            "    FOR item IN",
+            "        SELECT conname FROM pg_constraint",
+            f"        WHERE conrelid = '{table}'::regclass AND conname LIKE '%\\{SHADOW_SUFFIX}'",
+            "    LOOP",
+            f"        EXECUTE format('ALTER TABLE {table} RENAME CONSTRAINT %I TO %I', item.conname,",
+            f"                       left(item.conname, -{len(SHADOW_SUFFIX)}));",
+            "    END LOOP;",
+            "    FOR item IN",
+            "        SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid",
+            f"        WHERE i.indrelid = '{table}'::regclass AND c.relname LIKE '%\\{SHADOW_SUFFIX}'",
+            "    LOOP",
+            f"        EXECUTE format('ALTER INDEX %I RENAME TO %I', item.relname, left(item.relname, -{len(SHADOW_SUFFIX)}));",
+            "    END LOOP;",
+        ])
+    body.extend([
+        "    -- Rows of other tables may reference ids that were not reloaded",
+        "    FOR item IN",
+        "        SELECT conrelid::regclass AS tbl, conname FROM pg_constraint",
+        f"        WHERE contype = 'f' AND NOT convalidated AND confrelid IN ({_regclass_list(tables)})",
+        "    LOOP",
+        "        BEGIN",
+        "            EXECUTE format('ALTER TABLE %s VALIDATE CONSTRAINT %I', item.tbl, item.conname);",
+        "        EXCEPTION WHEN foreign_key_violation THEN",
+        "            RAISE WARNING '% rows reference removed rows; % left NOT VALID', item.tbl, item.conname;",
+        "        END;",
+        "    END LOOP;",
+    ])
+    _do_block(out, body)
+
+
+def write_swap_reload(out, tables, write_load, lock_timeout=LOCK_TIMEOUT):
+    """Write a complete swap reload; write_load(out) fills the shadow tables
+
+    Returns what write_load returns.
+    """
+    write_create_shadows(out, tables)
+    loaded = write_load(out)
+    out.write("\n")
+    write_build_shadows(out, tables)
+    write_swap(out, tables, lock_timeout)
+    write_cleanup(out, tables)
+    return loaded
@@ -0,0 +1,577 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming SQL emitter for the verb import scripts
+
+Rows come from the schema registry (verb_schema.py) and every statement is
+written as soon as it is formatted to a buffered file handle, so memory use
+does not depend on the size of the output. Each write_* function takes an
+iterable of verb records, skips later duplicates of an infinitive and returns
+the number of verbs written.
+
+The write_copy_* functions produce data files for COPY ... FROM in text or
+CSV format, with explicit ids so verb_conjugations rows can reference verbs
+without a lookup; write_copy_driver() writes the psql script that loads them.
+
+With --jobs N (Batching.jobs) the per-verb formatting runs in a process
+pool and is merged back in corpus order, so the output does not change.
+
+Usage:
+    from sql_emitter import open_sql, write_returning_import
+    with open_sql('import_all_verbs_proper.sql') as out:
+        count = write_returning_import(out, iter_verbs())
+
+    python3 sql_emitter.py [--verbs 50000] [--max-jobs N]   # --jobs scaling benchmark
+"""
+
+import argparse
+import hashlib
+import itertools
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+
+from verb_corpus import load_verbs
+from verb_index import normalize_infinitive
+from verb_schema import CONJUGATION_COLUMNS, VERB_COLUMNS, conjugation_row, conjugations_json, verb_row
+
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Records per task with --jobs
+FORMAT_CHUNK = 512
+# Infinitives per DELETE statement
+DELETE_BATCH = 500
+_END = object()
+
+COPY_FORMATS = ('text', 'csv')
+COPY_EXTENSIONS = {'text': 'tsv', 'csv': 'csv', 'binary': 'bin'}
+# Backslash and the row/column separators are the only characters COPY text
+# format needs escaped; the delimiter is a tab
+COPY_TEXT_ESCAPES = (('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r'))
+
+VERB_COLUMN_LIST = ', '.join(VERB_COLUMNS)
+CONJUGATION_COLUMN_LIST = ', '.join(CONJUGATION_COLUMNS)
+
+
+def sql_literal(value):
+    """Return value as a SQL literal"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def sql_strings(values):
+    """Return a row of strings as comma-separated SQL literals
+
+    The row is joined and escaped in one pass instead of once per value.
+    """
+    return "'" + '\0'.join(values).replace("'", "''").replace('\0', "', '") + "'"
+
+
+def copy_escape(text):
+    """Escape a string for COPY text format"""
+    for char, escaped in COPY_TEXT_ESCAPES:
+        if char in text:
+            text = text.replace(char, escaped)
+    return text
+
+
+def copy_field(value, fmt='text'):
+    """Return value as one COPY field; None is NULL"""
+    if fmt == 'csv':
+        if value is None:
+            return ''
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        # Quoted so that empty strings are not read back as NULL
+        return '"' + str(value).replace('"', '""') + '"'
+    if value is None:
+        return '\\N'
+    return copy_escape(str(value))
+
+
+def copy_line(values, fmt='text'):
+    """Return a row of values as one COPY line"""
+    if fmt == 'csv':
+        return ','.join(copy_field(value, fmt) for value in values) + '\n'
+    return '\t'.join(copy_field(value, fmt) for value in values) + '\n'
+
+
+def copy_strings(values, fmt='text'):
+    """Return a row of strings as COPY fields without the line end, escaped in one pass"""
+    if fmt == 'csv':
+        return '"' + '\0'.join(values).replace('"', '""').replace('\0', '","') + '"'
+    return copy_escape('\0'.join(values)).replace('\0', '\t')
+
+
+def pg_array(values):
+    """Return a list of strings as a PostgreSQL array literal"""
+    elements = []
+    for value in values:
+        if value is None:
+            elements.append('NULL')
+        elif not value or value.upper() == 'NULL' or any(c in value for c in '{}," \\\t\n'):
+            elements.append('"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"')
+        else:
+            elements.append(value)
+    return '{' + ','.join(elements) + '}'
+
+
+@contextmanager
+def open_sql(path):
+    """Open path for writing SQL; '-' writes to stdout"""
+    if path == '-':
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    with open(path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as out:
+        yield out
+
+
+def write_lines(out, lines):
+    """Write each line followed by a newline"""
+    for line in lines:
+        out.write(line)
+        out.write('\n')
+
+
+def unique_verbs(verbs):
+    """Yield records whose normalized infinitive has not been seen yet"""
+    seen = set()
+    for verb_data in verbs:
+        key = normalize_infinitive(verb_data.get('Infinitif', ''))
+        if key in seen:
+            continue
+        seen.add(key)
+        yield verb_data
+
+
+_shared_verbs = None
+
+
+def _share_verbs(verbs):
+    global _shared_verbs
+    _shared_verbs = verbs
+
+
+def _format_range(formatter, start, stop):
+    return [formatter(verb_data) for verb_data in _shared_verbs[start:stop]]
+
+
+def format_verbs(formatter, verbs, jobs=None, chunk_size=FORMAT_CHUNK):
+    """Yield formatter(record) for each unique verb, in corpus order
+
+    With jobs > 1 the records are collected and handed to that many worker
+    processes once, when they start (under fork they are inherited rather
+    than pickled); each task then formats an index range of chunk_size
+    records, and results are yielded in submission order so the output is
+    the same as with one process. At most 2 * jobs ranges are in flight.
+    formatter must be picklable: a module-level function or a
+    functools.partial of one.
+    """
+    verbs = unique_verbs(verbs)
+    if not jobs or jobs < 2:
+        yield from map(formatter, verbs)
+        return
+    verbs = list(verbs)
+    with ProcessPoolExecutor(jobs, initializer=_share_verbs, initargs=(verbs,)) as pool:
+        pending = deque()
+        for start in range(0, len(verbs), chunk_size):
+            pending.append(pool.submit(_format_range, formatter, start, start + chunk_size))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class Batching:
+    """How rows are grouped into statements and statements into transactions
+
+    rows_per_statement=None puts every row in one statement, and
+    batches_per_transaction=None leaves transactions to the caller. A batch is
+    the statement (or, for the set-based import, the verbs and conjugations
+    statement pair) written for one group of rows. With explicit transactions
+    a failing batch only rolls back its own transaction when the file is run
+    through psql without ON_ERROR_STOP. Progress markers are psql \\echo
+    lines, written by default whenever batching is enabled. With jobs > 1
+    rows are formatted in that many processes (see format_verbs()).
+    """
+
+    def __init__(self, rows_per_statement=None, batches_per_transaction=None, progress=None, jobs=None):
+        if rows_per_statement is not None and rows_per_statement < 1:
+            raise ValueError(f"rows_per_statement must be at least 1, got {rows_per_statement}")
+        if batches_per_transaction is not None and batches_per_transaction < 1:
+            raise ValueError(f"batches_per_transaction must be at least 1, got {batches_per_transaction}")
+        self.rows_per_statement = rows_per_statement
+        self.batches_per_transaction = batches_per_transaction
+        if progress is None:
+            progress = rows_per_statement is not None or batches_per_transaction is not None
+        self.progress = progress
+        self.jobs = jobs
+
+    @classmethod
+    def from_args(cls, args, rows_per_statement=None):
+        """Return the batching selected by add_batching_arguments() options
+
+        rows_per_statement is used when --batch-size is not given; progress
+        markers are only written when a batching option is.
+        """
+        requested = args.batch_size is not None or args.batches_per_transaction is not None
+        return cls(args.batch_size or rows_per_statement, args.batches_per_transaction,
+                   requested and not args.no_progress, getattr(args, 'jobs', None))
+
+    def format(self, formatter, verbs):
+        """Yield formatter(record) for each unique verb, using self.jobs processes"""
+        return format_verbs(formatter, verbs, self.jobs)
+
+    def batches(self, rows):
+        """Yield lists of at most rows_per_statement rows
+
+        Without rows_per_statement the single batch is the rows iterator
+        itself, so one-statement output is streamed rather than collected.
+        """
+        rows = iter(rows)
+        if self.rows_per_statement is None:
+            first = next(rows, _END)
+            if first is not _END:
+                yield itertools.chain((first,), rows)
+            return
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.rows_per_statement:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def write(self, out, rows, write_batch, label='rows'):
+        """Call write_batch(out, batch) for each batch of rows; returns the row count
+
+        The progress marker follows its batch, so psql echoes it once the
+        batch has run.
+        """
+        written = 0
+
+        def counted():
+            nonlocal written
+            for row in rows:
+                written += 1
+                yield row
+
+        start = 0
+        in_transaction = False
+        for number, batch in enumerate(self.batches(counted()), 1):
+            if self.batches_per_transaction and not in_transaction:
+                out.write("BEGIN;\n")
+                in_transaction = True
+            write_batch(out, batch)
+            if self.progress:
+                out.write(f"\\echo {label} batch {number}: rows {start + 1}-{written}\n")
+            start = written
+            if in_transaction and number % self.batches_per_transaction == 0:
+                out.write("COMMIT;\n\n")
+                in_transaction = False
+        if in_transaction:
+            out.write("COMMIT;\n\n")
+        return written
+
+
+def add_batching_arguments(parser, jobs=True):
+    """Add the --batch-size, --batches-per-transaction and --no-progress options
+
+    jobs=True also adds --jobs, for scripts that format verbs.
+    """
+    parser.add_argument('--batch-size', type=int, metavar='ROWS', help="rows per statement (default: all)")
+    parser.add_argument('--batches-per-transaction', type=int, metavar='N',
+                        help="wrap every N statements in BEGIN/COMMIT (default: no explicit transactions)")
+    parser.add_argument('--no-progress', action='store_true', help="do not write \\echo progress markers")
+    if jobs:
+        parser.add_argument('--jobs', type=int, metavar='N', help="format verbs in N processes (same output)")
+
+
+def write_values_insert(out, head, rows, tail='', batching=None, label='rows'):
+    """Write pre-formatted row tuples as multi-row INSERT statements
+
+    Each statement is head, then the batch's rows separated by ",\\n", then
+    tail and ";". Returns the row count.
+    """
+    def write_batch(out, batch):
+        out.write(head)
+        out.write("\n")
+        out.write(",\n".join(batch))
+        out.write(tail)
+        out.write(";\n")
+    return (batching or Batching()).write(out, rows, write_batch, label)
+
+
+def _jsonb_row(verb_data):
+    return (f"({sql_literal(normalize_infinitive(verb_data.get('Infinitif', '')))}, "
+            f"{sql_literal(conjugations_json(verb_data))}::jsonb)")
+
+
+def verb_insert_head(table, columns, keep_ids_from=None):
+    """Return the (head, tail) around VALUES rows of an INSERT into a verbs table
+
+    With keep_ids_from, each row takes the id of the keep_ids_from row with
+    the same infinitive (the first column), or a new one from its id
+    sequence, so a reloaded copy keeps the ids other tables reference.
+    """
+    column_list = ', '.join(columns)
+    if keep_ids_from is None:
+        return f"INSERT INTO {table} ({column_list}) VALUES", ""
+    head = "\n".join([
+        f"INSERT INTO {table} (id, {column_list})",
+        f"SELECT COALESCE(k.id, nextval(pg_get_serial_sequence('{keep_ids_from}', 'id'))), "
+        f"{', '.join('c.' + column for column in columns)}",
+        "FROM (VALUES",
+    ])
+    tail = "\n".join([
+        "",
+        f") AS c ({column_list})",
+        f"LEFT JOIN {keep_ids_from} k ON k.infinitive = c.infinitive",
+    ])
+    return head, tail
+
+
+def write_jsonb_insert(out, verbs, batching=None, table='verbs', keep_ids_from=None):
+    """Write multi-row INSERTs of (infinitive, conjugations::jsonb)"""
+    batching = batching or Batching()
+    head, tail = verb_insert_head(table, ('infinitive', 'conjugations'), keep_ids_from)
+    return write_values_insert(out, head, batching.format(_jsonb_row, verbs), tail, batching=batching, label='verbs')
+
+
+def _returning_sql(indent, verb_data):
+    return "".join([
+        f"{indent}INSERT INTO verbs ({VERB_COLUMN_LIST}) VALUES (",
+        sql_strings(verb_row(verb_data)),
+        ") RETURNING id INTO verb_id;\n",
+        f"{indent}INSERT INTO verb_conjugations (verb_id, {CONJUGATION_COLUMN_LIST}) VALUES (verb_id, ",
+        sql_strings(conjugation_row(verb_data)),
+        ");\n\n",
+    ])
+
+
+def write_returning_import(out, verbs, batching=None, indent='  '):
+    """Write DO blocks inserting each verb with RETURNING id and then its conjugations"""
+    def write_batch(out, batch):
+        write_lines(out, ["DO $$", "DECLARE", "  verb_id INT;", "BEGIN"])
+        for verb_sql in batch:
+            out.write(verb_sql)
+        out.write("END $$;\n")
+    batching = batching or Batching()
+    return batching.write(out, batching.format(partial(_returning_sql, indent), verbs), write_batch, 'verbs')
+
+
+def _guarded_sql(difficulty, verb_data):
+    row = verb_row(verb_data)
+    infinitive = row[0]
+    # Inside RAISE NOTICE format strings % is a placeholder
+    notice = infinitive.replace("'", "''").replace('%', '%%')
+    return "\n".join((
+        f"    -- Adding verb: {infinitive}",
+        f"    IF NOT EXISTS (SELECT 1 FROM verbs WHERE infinitive = {sql_literal(infinitive)}) THEN",
+        "        -- Insert verb",
+        f"        INSERT INTO verbs ({VERB_COLUMN_LIST}, difficulty)",
+        f"        VALUES ({sql_strings(row)}, {sql_literal(difficulty)})",
+        "        RETURNING id INTO v_id;",
+        "",
+        "        -- Insert conjugations",
+        f"        INSERT INTO verb_conjugations (verb_id, {CONJUGATION_COLUMN_LIST})",
+        f"        VALUES (v_id, {sql_strings(conjugation_row(verb_data))});",
+        "",
+        f"        RAISE NOTICE 'Added verb: {notice} (ID: %)', v_id;",
+        "    ELSE",
+        f"        RAISE NOTICE 'Skipped verb: {notice} (already exists)';",
+        "    END IF;",
+        "",
+    ))
+
+
+def write_guarded_import(out, verbs, difficulty=1, batching=None):
+    """Write DO blocks that insert each verb only if it is not in the database yet
+
+    By default every verb gets its own block.
+    """
+    def write_batch(out, batch):
+        write_lines(out, ["DO $$", "DECLARE", "    v_id BIGINT;", "BEGIN"])
+        for verb_sql in batch:
+            out.write(verb_sql)
+        write_lines(out, ["END $$;", ""])
+    batching = batching or Batching(rows_per_statement=1, progress=False)
+    return batching.write(out, batching.format(partial(_guarded_sql, difficulty), verbs), write_batch, 'verbs')
+
+
+def _set_rows(verb_data):
+    row = verb_row(verb_data)
+    return f"({sql_strings(row)})", f"({sql_strings((row[0],) + conjugation_row(verb_data))})"
+
+
+def write_set_import(out, verbs, on_conflict='update', batching=None,
+                     tables=('verbs', 'verb_conjugations'), keep_ids_from=None):
+    """Write set-based verbs INSERTs, each followed by a conjugation INSERT joined on infinitive
+
+    on_conflict='update' updates existing verbs and conjugation rows in place,
+    'nothing' leaves them untouched (both through ON CONFLICT on
+    verbs.infinitive and verb_conjugations.verb_id, so the output can be
+    re-run), and None writes plain INSERTs. tables names the (verbs,
+    conjugations) tables to fill, and keep_ids_from is passed to
+    verb_insert_head().
+    """
+    verbs_table, conjugations_table = tables
+    if on_conflict == 'update':
+        verb_conflict = "\nON CONFLICT (infinitive) DO UPDATE SET " + ', '.join(
+            f"{column} = EXCLUDED.{column}" for column in VERB_COLUMNS[1:])
+        conjugation_conflict = "\nON CONFLICT (verb_id) DO UPDATE SET " + ', '.join(
+            f"{column} = EXCLUDED.{column}" for column in CONJUGATION_COLUMNS)
+    elif on_conflict == 'nothing':
+        verb_conflict = "\nON CONFLICT (infinitive) DO NOTHING"
+        conjugation_conflict = "\nON CONFLICT (verb_id) DO NOTHING"
+    elif on_conflict is None:
+        verb_conflict = conjugation_conflict = ""
+    else:
+        raise ValueError(f"Unknown on_conflict: {on_conflict!r}")
+
+    verb_head, verb_tail = verb_insert_head(verbs_table, VERB_COLUMNS, keep_ids_from)
+    verb_tail += verb_conflict
+    conjugation_head = "\n".join([
+        f"INSERT INTO {conjugations_table} (verb_id, {CONJUGATION_COLUMN_LIST})",
+        f"SELECT v.id, {', '.join('c.' + column for column in CONJUGATION_COLUMNS)}",
+        "FROM (VALUES",
+    ])
+    conjugation_tail = "\n".join([
+        "",
+        f") AS c (infinitive, {CONJUGATION_COLUMN_LIST})",
+        f"JOIN {verbs_table} v ON v.infinitive = c.infinitive",
+    ]) + conjugation_conflict
+
+    def write_batch(out, batch):
+        # Each batch is read twice, once per statement
+        batch = list(batch)
+        write_values_insert(out, verb_head, (verb_values for verb_values, _ in batch), verb_tail)
+        out.write("\n")
+        write_values_insert(out, conjugation_head, (conjugation_values for _, conjugation_values in batch),
+                            conjugation_tail)
+        out.write("\n")
+    batching = batching or Batching()
+    return batching.write(out, batching.format(_set_rows, verbs), write_batch, 'verbs')
+
+
+def write_verb_deletes(out, infinitives):
+    """Write DELETEs of verbs by infinitive; conjugations follow through ON DELETE CASCADE
+
+    Returns the number of infinitives.
+    """
+    infinitives = list(infinitives)
+    for start in range(0, len(infinitives), DELETE_BATCH):
+        names = ', '.join(sql_literal(key) for key in infinitives[start:start + DELETE_BATCH])
+        write_lines(out, [f"DELETE FROM verbs WHERE infinitive IN ({names});", ""])
+    return len(infinitives)
+
+
+def _copy_rows(fmt, verb_data):
+    return copy_strings(verb_row(verb_data), fmt), copy_strings(conjugation_row(verb_data), fmt)
+
+
+def write_copy_verbs(verbs_out, conjugations_out, verbs, fmt='text', jobs=None):
+    """Write verbs and verb_conjugations COPY data with ids numbered from 1"""
+    separator = ',' if fmt == 'csv' else '\t'
+    count = 0
+    for verb_fields, conjugation_fields in format_verbs(partial(_copy_rows, fmt), verbs, jobs):
+        count += 1
+        verbs_out.write(f"{count}{separator}")
+        verbs_out.write(verb_fields)
+        verbs_out.write('\n')
+        conjugations_out.write(f"{count}{separator}{count}{separator}")
+        conjugations_out.write(conjugation_fields)
+        conjugations_out.write('\n')
+    return count
+
+
+def write_copy_driver(out, loads, fmt='text', preamble=(), truncate=()):
+    """Write a psql script that loads COPY data files in one transaction
+
+    loads is a list of (table, columns, data file) or (table, columns, data
+    file, format) when a file is not in fmt; data files are resolved relative
+    to the directory psql is started from. Each table's id sequence is moved
+    past the loaded ids.
+    """
+    write_lines(out, [
+        "-- Load COPY data files",
+        "-- Run from this directory: psql -v ON_ERROR_STOP=1 -f load.sql",
+        "",
+        *preamble,
+        "BEGIN;",
+    ])
+    if truncate:
+        write_lines(out, [f"TRUNCATE TABLE {', '.join(truncate)} RESTART IDENTITY CASCADE;"])
+    for table, columns, data_file, *load_fmt in loads:
+        load_fmt = load_fmt[0] if load_fmt else fmt
+        # Binary files carry no text, so they take no ENCODING option
+        options = "(FORMAT binary)" if load_fmt == 'binary' else f"(FORMAT {load_fmt}, ENCODING 'UTF8')"
+        write_lines(out, [f"\\copy {table} ({', '.join(columns)}) FROM '{data_file}' WITH {options}"])
+    for table, columns, *_ in loads:
+        if 'id' in columns:
+            write_lines(out, [
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table};"
+            ])
+    write_lines(out, ["COMMIT;"])
+
+
+class _DigestWriter:
+    """Write-only sink that keeps a digest and size of what was written"""
+
+    def __init__(self):
+        self._digest = hashlib.blake2b(digest_size=16)
+        self.size = 0
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self._digest.update(data)
+        self.size += len(data)
+
+    def hexdigest(self):
+        return self._digest.hexdigest()
+
+
+def synthetic_verbs(count, verbs=None):
+    """Return count records cycled from the corpus with distinct infinitives"""
+    verbs = list(unique_verbs(verbs if verbs is not None else load_verbs()))
+    return [dict(verbs[i % len(verbs)], Infinitif=f"{verbs[i % len(verbs)]['Infinitif']} {i // len(verbs)}")
+            for i in range(count)]
+
+
+def benchmark(verb_count=50000, max_jobs=None, rows_per_statement=1000):
+    """Time the set-based import of a synthetic corpus with 1 to max_jobs processes
+
+    Every run must produce the same bytes as the single-process run.
+    """
+    verbs = synthetic_verbs(verb_count)
+    max_jobs = max_jobs or os.cpu_count()
+    print(f"{verb_count} synthetic verbs, {os.cpu_count()} CPUs")
+    print(f"{'jobs':>4}{'time':>10}{'speedup':>9}")
+    baseline = None
+    for jobs in range(1, max_jobs + 1):
+        out = _DigestWriter()
+        start = time.perf_counter()
+        write_set_import(out, verbs, batching=Batching(rows_per_statement, progress=False, jobs=jobs))
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = (elapsed, out.hexdigest())
+            print(f"  output: {out.size / 1024 / 1024:.1f} MB")
+        elif out.hexdigest() != baseline[1]:
+            raise AssertionError(f"--jobs {jobs} output differs from --jobs 1")
+        print(f"{jobs:>4}{elapsed * 1000:>7.0f} ms{baseline[0] / elapsed:>8.2f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark parallel SQL formatting")
+    parser.add_argument('--verbs', type=int, default=50000, help="synthetic corpus size (default: 50000)")
+    parser.add_argument('--max-jobs', type=int, help="highest process count (default: CPU count)")
+    args = parser.parse_args()
+    benchmark(args.verbs, args.max_jobs)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-verb content hashes for incremental SQL regeneration
+
+The manifest stored next to the generated SQL (verbs.manifest.json) maps
+each normalized infinitive to a hash of the verbs and verb_conjugations rows
+it produces, so edits that do not change the database rows (key order,
+NFD vs NFC) are not changes. An incremental run compares the corpus with the
+manifest and writes only the added and changed verbs as upserts and the
+removed ones as DELETEs (conjugations follow through ON DELETE CASCADE).
+
+The manifest records what the generated SQL brings the database to: it is
+rewritten after every full or incremental generation, so apply each
+migration before generating the next one.
+"""
+
+import hashlib
+import json
+import os
+
+from sql_emitter import unique_verbs, write_lines, write_set_import, write_verb_deletes
+from verb_index import normalize_infinitive
+from verb_schema import conjugation_row, verb_row
+
+MANIFEST_NAME = 'verbs.manifest.json'
+MANIFEST_VERSION = 1
+
+
+def row_hash(verb_data):
+    """Return the hash of the database rows produced by a record"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\0'.join(verb_row(verb_data) + conjugation_row(verb_data)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def corpus_hashes(verbs):
+    """Return {normalized infinitive: row hash} in corpus order"""
+    return {normalize_infinitive(verb_data.get('Infinitif', '')): row_hash(verb_data)
+            for verb_data in unique_verbs(verbs)}
+
+
+def hashes_digest(hashes):
+    """Return one hash identifying a whole manifest, verb order included"""
+    digest = hashlib.blake2b(digest_size=16)
+    for infinitive, verb_hash in hashes.items():
+        digest.update(f"{infinitive}\0{verb_hash}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def manifest_path_for(output_file):
+    """Return the manifest path stored next to a generated SQL file"""
+    return os.path.join(os.path.dirname(os.path.abspath(output_file)), MANIFEST_NAME)
+
+
+def read_manifest(path):
+    """Return the hashes recorded in a manifest, or None if there is none"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version in {path}: {manifest.get('version')}")
+    return manifest['verbs']
+
+
+def write_manifest(path, hashes):
+    """Atomically replace the manifest with hashes"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'verbs': hashes}, f, ensure_ascii=False, indent=0)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def write_incremental(out, verbs, old_hashes, batching=None):
+    """Write the migration from old_hashes to verbs in one transaction
+
+    Returns (new hashes, upserted infinitives, removed infinitives); nothing
+    but a comment is written when there are no changes.
+    """
+    hashes = {}
+    pending = []
+    for verb_data in unique_verbs(verbs):
+        key = normalize_infinitive(verb_data.get('Infinitif', ''))
+        hashes[key] = row_hash(verb_data)
+        if old_hashes.get(key) != hashes[key]:
+            pending.append(verb_data)
+    removed = [key for key in old_hashes if key not in hashes]
+    upserted = [normalize_infinitive(verb_data.get('Infinitif', '')) for verb_data in pending]
+
+    if not pending and not removed:
+        write_lines(out, ["-- No changes"])
+        return hashes, upserted, removed
+
+    # One transaction for the migration unless batches get their own
+    single_transaction = batching is None or batching.batches_per_transaction is None
+    write_lines(out, [f"-- {len(upserted)} verbs added or changed, {len(removed)} removed", ""])
+    if single_transaction:
+        write_lines(out, ["BEGIN;", ""])
+    write_verb_deletes(out, removed)
+    if pending:
+        write_set_import(out, pending, batching=batching)
+    if single_transaction:
+        write_lines(out, ["COMMIT;"])
+    return hashes, upserted, removed
@@ -0,0 +1,14 @@
+from compact_corpus import CompactCorpus
+
+
+def test_compact_round_trip(corpus):
+    compact = CompactCorpus.from_verbs(corpus)
+    assert len(compact) == len(corpus)
+    assert [verb.to_dict() for verb in compact] == corpus
+
+
+def test_compact_lookup(corpus):
+    compact = CompactCorpus.from_verbs(corpus)
+    assert compact['parler']['Present'][3] == 'parlons'
+    assert compact['Parler'].get('Auxiliaire') == 'avoir'
+    assert 'pas un verbe' not in compact
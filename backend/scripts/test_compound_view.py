@@ -0,0 +1,21 @@
+import json
+
+from compound_view import CompoundView, dumps, encode_corpus
+from verb_schema import conjugation_row
+
+
+def test_view_round_trip(corpus):
+    view = CompoundView(json.loads(dumps(encode_corpus(corpus))))
+    assert len(view) == len(corpus)
+    assert [verb.to_dict() for verb in view] == corpus
+
+
+def test_view_flat_columns(corpus):
+    view = CompoundView(json.loads(dumps(encode_corpus(corpus))))
+    assert [conjugation_row(verb) for verb in view] == [conjugation_row(verb_data) for verb_data in corpus]
+
+
+def test_view_derives_compound_tenses(corpus):
+    view = CompoundView(encode_corpus(corpus))
+    assert view['se lever']['PasseCompose'][0] == 'me suis levé(e)'
+    assert view['neiger']['PasseCompose'] == ['', '', 'a neigé', '', '', '']
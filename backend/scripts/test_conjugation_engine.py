@@ -0,0 +1,51 @@
+import pytest
+
+from conjugation_engine import conjugate, rule_for
+from verb_index import normalize_infinitive
+from verb_schema import conjugation_row, verb_row
+
+# Corpus verbs the rules reproduce cell for cell
+REGULAR_VERBS = ('parler', 'placer', 'manger', 'appeler', 'acheter', 'employer', 'finir', 'vendre', 'battre',
+                 'craindre', 'ouvrir', 'recevoir', 'se lever', 'se parler')
+
+
+@pytest.fixture(scope='module')
+def records(corpus):
+    first = {}
+    for verb_data in corpus:
+        first.setdefault(normalize_infinitive(verb_data['Infinitif']), verb_data)
+    return first
+
+
+@pytest.mark.parametrize('infinitive', REGULAR_VERBS)
+def test_engine_matches_corpus(records, infinitive):
+    stored = records[infinitive]
+    generated = conjugate(infinitive)
+    assert verb_row(generated) == verb_row(stored)
+    assert conjugation_row(generated) == conjugation_row(stored)
+
+
+def test_spelling_rules():
+    assert conjugate('négliger')['Present'][3] == 'négligeons'
+    assert conjugate('céder')['Present'][0] == 'cède'
+    assert conjugate('jeter')['FuturSimple'][0] == 'jetterai'
+    assert conjugate('payer')['Present'][0] == 'paie, paye'
+
+
+def test_agreement():
+    assert conjugate('venir')['PasseCompose'][:4] == ['suis venu(e)', 'es venu(e)', 'est venu(e)', 'sommes venu(e)s']
+    assert conjugate("s'habiller")['PasseCompose'][0] == "me suis habillé(e)"
+    # Indirect-object pronoun: the participle stays invariable
+    assert conjugate('se permettre')['PasseCompose'][2] == "s'est permis"
+
+
+def test_impersonal():
+    assert conjugate('neiger')['Present'] == ['', '', 'neige', '', '', '']
+    assert conjugate('neiger')['FormePronominale'] == ''
+
+
+@pytest.mark.parametrize('infinitive', ('aller', 'faire', 'pouvoir', 'paître', 'saillir', 'souvenir', "s'en aller"))
+def test_no_rule(infinitive):
+    assert rule_for(infinitive) is None
+    with pytest.raises(ValueError):
+        conjugate(infinitive)
@@ -0,0 +1,12 @@
+import json
+
+from paradigm_codec import ParadigmDecoder, dumps, encode_corpus
+
+
+def test_paradigm_round_trip(corpus):
+    document = encode_corpus(corpus)
+    decoder = ParadigmDecoder(json.loads(dumps(document)))
+    assert len(decoder) == len(corpus)
+    assert list(decoder) == corpus
+    # Verbs of one paradigm share its templates
+    assert len(document['paradigms']) < len(corpus)
@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from verb_corpus import SCRIPTS_DIR
+
+# Committed SQL files and the commands that regenerate them ({out}: output path)
+GENERATED_SQL = (
+    ('import_all_verbs_proper.sql', ('import_verbs_proper.py', '-o', '{out}')),
+    ('reimport_all_verbs.sql', ('reimport_verbs.py', '-o', '{out}')),
+)
+
+
+@pytest.mark.parametrize('committed, command', GENERATED_SQL)
+def test_regenerated_sql_is_byte_identical(committed, command, tmp_path):
+    out = str(tmp_path / committed)
+    subprocess.run([sys.executable, *(arg.format(out=out) for arg in command)], cwd=SCRIPTS_DIR, check=True,
+                   stdout=subprocess.DEVNULL)
+    with open(out, 'rb') as f:
+        regenerated = f.read()
+    with open(os.path.join(SCRIPTS_DIR, committed), 'rb') as f:
+        assert regenerated == f.read()
@@ -0,0 +1,20 @@
+from verb_corpus import clear_cache, iter_verbs, load_verbs, read_cached
+
+
+def test_iter_verbs_matches_json_load(corpus, corpus_path):
+    assert list(iter_verbs(corpus_path)) == corpus
+
+
+def test_iter_verbs_small_chunks(corpus, corpus_path):
+    # Records and strings split across chunk boundaries
+    assert list(iter_verbs(corpus_path, chunk_size=97)) == corpus
+
+
+def test_load_verbs_matches_json_load(corpus, corpus_path):
+    clear_cache(corpus_path)
+    assert load_verbs(corpus_path) == corpus
+
+
+def test_cached_snapshot_matches_json_load(corpus, corpus_path):
+    load_verbs(corpus_path)
+    assert read_cached(corpus_path) == corpus
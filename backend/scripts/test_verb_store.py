@@ -0,0 +1,16 @@
+from verb_index import normalize_infinitive
+from verb_store import VerbStore, export_store
+
+
+def test_store_round_trip(corpus, corpus_path, tmp_path):
+    first = {}
+    for verb_data in corpus:
+        first.setdefault(normalize_infinitive(verb_data['Infinitif']), verb_data)
+
+    with VerbStore(export_store(corpus_path, str(tmp_path / 'corpus.vstore'))) as store:
+        assert len(store) == len(first)
+        assert list(store.keys()) == sorted(first, key=lambda key: key.encode('utf-8'))
+        for key, verb_data in first.items():
+            assert store.get(key) == verb_data
+        assert store.get('pas un verbe') is None
+        assert store.is_current_for(corpus_path)
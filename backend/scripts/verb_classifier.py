@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nearest model verb by longest shared suffix, over a suffix trie of the corpus
+
+Every infinitive of conjugation.json is inserted reversed into a trie. Each
+node counts the verbs ending with its suffix by paradigm: the conjugation
+cells with the verb's stem masked out, so conduire, produire and détruire
+share one paradigm and vendre another. A new infinitive walks the trie from
+its last letter; the deepest node reached gives its model verb, the first
+verb of the most common paradigm there, and a confidence: the share of that
+node's verbs in the model's paradigm. A lookup is one step per letter.
+
+Verbs are generated with the rule engine (conjugation_engine.py) unless
+the model shares the verb's rule but is irregular, or no rule covers the
+verb; the model's forms are then copied with its prefix swapped for the new
+one in every cell (entrevoir from revoir).
+
+Pronominal records and records with capital letters in their cells are
+left out of the trie.
+
+Usage:
+    from verb_classifier import ModelClassifier
+    classifier = ModelClassifier.for_corpus()
+    classifier.classify('accourir')   # ('courir', 'courir', 1.0)
+    verb_data, model, confidence = classifier.generate('combattre')
+
+    python3 verb_classifier.py accourir séduire entrevoir
+"""
+
+import os
+import sys
+import time
+
+from conjugation_engine import RECORD_TENSES, VOWELS, conjugate, reflexive_infinitive, rule_for, split_reflexive
+from verb_corpus import DEFAULT_CORPUS_PATH, load_verbs
+from verb_index import normalize_infinitive
+from verb_schema import conjugation_row, tense_forms, verb_row
+
+# Key of the per-node counts in a trie node (letters are the other keys)
+COUNTS = ''
+# Infinitive endings, longest first
+INFINITIVE_ENDINGS = ('oir', 'er', 'ir', 'ïr', 're')
+
+
+def _last_word(words):
+    """Return the index of the verb form in a cell split on spaces ("ai vu", "vois !")"""
+    last = len(words) - 1
+    if words[last] == '!':
+        last -= 1
+    return last
+
+
+def paradigm_signature(verb_data):
+    """Return the participles, auxiliary and conjugation cells of a record with its stem masked
+
+    The stem is the longest prefix shared by the infinitive and the verb
+    form of every cell ("bat" for battre: bats, battons, battu).
+    """
+    infinitive, participle, present_participle, auxiliary, _ = verb_row(verb_data)
+    cells = (participle, present_participle) + conjugation_row(verb_data)
+    split = [cell.split(' ') if cell else None for cell in cells]
+    stem = os.path.commonprefix([infinitive] + [words[_last_word(words)] for words in split if words])
+    signature = [auxiliary]
+    for cell, words in zip(cells, split):
+        if words:
+            last = _last_word(words)
+            words[last] = '\0' + words[last][len(stem):]
+            cell = ' '.join(words)
+        signature.append(cell)
+    return tuple(signature)
+
+
+def check_infinitive(verb):
+    """Raise ValueError unless verb (pronoun removed) is one word with a stem before its ending
+
+    Catches bare endings ("er", "dre") and clitics or phrases ("en aller",
+    "y prendre") that neither the rules nor a model can conjugate.
+    """
+    if not verb or ' ' in verb:
+        raise ValueError(f"Cannot conjugate {verb!r}: not a single-word infinitive")
+    for ending in INFINITIVE_ENDINGS:
+        if verb.endswith(ending):
+            if not VOWELS.intersection(verb[:-len(ending)]):
+                raise ValueError(f"Cannot conjugate {verb!r}: no stem before -{ending}")
+            return
+    raise ValueError(f"Cannot conjugate {verb!r}: not an infinitive")
+
+
+def _usable(verb_data):
+    infinitive = verb_data.get('Infinitif') or ''
+    if split_reflexive(infinitive)[1] or not isinstance(verb_data.get('Present'), list):
+        return False
+    cells = verb_row(verb_data) + conjugation_row(verb_data)
+    return all(cell == cell.lower() for cell in cells)
+
+
+def _impersonal(verb_data):
+    """Return whether a record is conjugated in the third person singular only (falloir)"""
+    present = tense_forms(verb_data, 'Present')
+    return bool(present[2]) and not any(present[:2] + present[3:])
+
+
+def _transfer_word(form, model_prefix, prefix):
+    """Return form with the model prefix of its last word replaced, or None"""
+    words = form.split(' ')
+    last = _last_word(words)
+    if last < 0 or not words[last].startswith(model_prefix):
+        return None
+    words[last] = prefix + words[last][len(model_prefix):]
+    return ' '.join(words)
+
+
+def transfer(model_data, model, infinitive, suffix):
+    """Return the record for infinitive copied from a model verb sharing suffix
+
+    Raises ValueError when a form of the model does not start with the
+    model's prefix (a stem change the prefix swap cannot follow).
+    """
+    model_prefix = model[:len(model) - len(suffix)]
+    prefix = infinitive[:len(infinitive) - len(suffix)]
+
+    def swap(form):
+        if not form:
+            return ''
+        variants = [_transfer_word(variant, model_prefix, prefix) for variant in form.split(', ')]
+        if None in variants:
+            raise ValueError(f"Cannot derive {infinitive!r} from {model!r}: {form!r}")
+        return ', '.join(variants)
+
+    _, participle, present_participle, auxiliary, _ = verb_row(model_data)
+    record = {
+        'Infinitif': infinitive,
+        'ParticipePasse': swap(participle),
+        'ParticipePresent': swap(present_participle),
+        'Auxiliaire': auxiliary or 'avoir',
+        'FormePronominale': '' if _impersonal(model_data) else reflexive_infinitive(infinitive),
+    }
+    for tense in RECORD_TENSES:
+        record[tense] = [swap(form) for form in tense_forms(model_data, tense)]
+    return record
+
+
+class ModelClassifier:
+    """Suffix trie over the corpus infinitives, keyed by reversed letters"""
+
+    def __init__(self, verbs):
+        self.records = {}
+        self.signatures = {}
+        ids = {}
+        root = {COUNTS: {}}
+        for verb_data in verbs:
+            if not _usable(verb_data):
+                continue
+            key = normalize_infinitive(verb_data['Infinitif'])
+            if key in self.records:
+                continue
+            signature = ids.setdefault(paradigm_signature(verb_data), len(ids))
+            self.records[key] = verb_data
+            self.signatures[key] = signature
+            node = root
+            self._count(node, signature, key)
+            for letter in reversed(key):
+                node = node.setdefault(letter, {COUNTS: {}})
+                self._count(node, signature, key)
+        self.root = root
+        self._finish(root)
+        self._engine_fits = {}
+
+    @classmethod
+    def for_corpus(cls, path=None):
+        return cls(load_verbs(path or DEFAULT_CORPUS_PATH))
+
+    @staticmethod
+    def _count(node, signature, key):
+        entry = node[COUNTS].setdefault(signature, [0, []])
+        entry[0] += 1
+        # Two models per paradigm, so a verb can be classified without itself
+        if len(entry[1]) < 2:
+            entry[1].append(key)
+
+    def _finish(self, root):
+        """Replace each node's paradigm counts by (total, its two largest paradigms)"""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            counts = node[COUNTS]
+            ranked = sorted(((count, signature, tuple(models)) for signature, (count, models) in counts.items()),
+                            key=lambda entry: -entry[0])
+            node[COUNTS] = (sum(count for count, _, _ in ranked), tuple(ranked[:2]))
+            stack.extend(child for letter, child in node.items() if letter != COUNTS)
+
+    def __len__(self):
+        return len(self.records)
+
+    def classify(self, infinitive):
+        """Return (model infinitive, shared suffix, confidence) or (None, '', 0.0)
+
+        A verb already in the corpus is classified as if it were not.
+        """
+        key = split_reflexive(normalize_infinitive(infinitive))[0]
+        own = self.signatures.get(key)
+        best = (None, '', 0.0)
+        node = self.root
+        for depth, letter in enumerate(reversed(key), 1):
+            node = node.get(letter)
+            if node is None:
+                break
+            total, ranked = node[COUNTS]
+            candidates = []
+            for count, signature, models in ranked:
+                if signature == own:
+                    # This verb is counted here; leave it out
+                    count -= 1
+                    models = tuple(model for model in models if model != key)
+                if count and models:
+                    candidates.append((count, models[0]))
+            if own is not None:
+                total -= 1
+            if not candidates:
+                continue
+            count, model = max(candidates)
+            best = (model, key[-depth:], count / total)
+        return best
+
+    def engine_fits(self, model):
+        """Return whether the rule engine regenerates a model verb exactly"""
+        fits = self._engine_fits.get(model)
+        if fits is None:
+            model_data = self.records[model]
+            fits = False
+            if rule_for(model) is not None:
+                generated = conjugate(model, model_data.get('Auxiliaire'))
+                fits = (verb_row(generated)[1:3] + conjugation_row(generated)
+                        == verb_row(model_data)[1:3] + conjugation_row(model_data))
+            self._engine_fits[model] = fits
+        return fits
+
+    def generate(self, infinitive):
+        """Return (record, model infinitive, confidence) for a new infinitive
+
+        The engine conjugates the verb when it has a rule and the model
+        either follows another rule or is one the engine reproduces;
+        otherwise the model's forms are copied. Raises ValueError when
+        neither covers the verb or it is not a plain infinitive
+        (check_infinitive).
+        """
+        infinitive = normalize_infinitive(infinitive)
+        verb, pronominal = split_reflexive(infinitive)
+        check_infinitive(verb)
+        model, suffix, confidence = self.classify(verb)
+        rule = rule_for(verb)
+        if rule is not None and (model is None or rule_for(model) != rule or self.engine_fits(model)):
+            return conjugate(infinitive), model, confidence
+        if model is None:
+            raise ValueError(f"No rule or model verb for {infinitive!r}")
+        if pronominal:
+            raise ValueError(f"No rule for {infinitive!r}, and pronominal verbs cannot be copied from {model!r}")
+        try:
+            return transfer(self.records[model], model, verb, suffix), model, confidence
+        except ValueError:
+            if rule is None:
+                raise
+            return conjugate(infinitive), model, confidence
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    classifier = ModelClassifier.for_corpus()
+    print(f"Indexed {len(classifier)} model verbs in {(time.perf_counter() - start) * 1000:.0f} ms")
+    for query in sys.argv[1:]:
+        model, suffix, confidence = classifier.classify(query)
+        if model is None:
+            print(f"{query}: no model")
+        else:
+            print(f"{query}: like {model} (-{suffix}, confidence {confidence:.2f})")
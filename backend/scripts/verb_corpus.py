@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared loader for the conjugation corpus (conjugation.json)
+
+The corpus is parsed lazily and memoized per process. After the first parse a
+marshal snapshot is written to .corpus_cache/ next to the JSON file, keyed by
+file size, mtime and SHA-256 of the content, so later runs skip JSON parsing.
+
+For corpora too large to hold in memory, iter_verbs() streams one record
+at a time straight from the JSON array.
+
+Usage:
+    from verb_corpus import iter_verbs, load_verbs
+    all_verbs = load_verbs()
+    for verb_data in iter_verbs():
+        ...
+
+Run `python3 verb_corpus.py --bench` to measure cold and warm startup.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CORPUS_PATH = os.path.join(SCRIPTS_DIR, 'conjugation.json')
+MISSING_VERBS_PATH = os.path.join(SCRIPTS_DIR, 'missing_verbs.txt')
+CACHE_DIR_NAME = '.corpus_cache'
+CACHE_VERSION = 1
+
+# Scalar fields of a verb record, in corpus order
+SCALAR_KEYS = (
+    'Infinitif', 'ParticipePasse', 'ParticipePresent', 'Auxiliaire',
+    'FormePronominale', 'formeNonPronominale',
+)
+
+# The 17 tenses of a verb record, in corpus order (6 persons each)
+TENSE_KEYS = (
+    'Present', 'Imparfait', 'PasseSimple', 'FuturSimple',
+    'PasseCompose', 'PlusQueParfait', 'PasseAnterieur', 'FuturAnterieur',
+    'SubjonctifPresent', 'SubjonctifImparfait', 'SubjonctifPasse', 'SubjonctifPlusQueParfait',
+    'ConditionnelPresent', 'ConditionnelPasse', 'ConditionnelPasseII',
+    'Imperatif', 'ImperatifPasse',
+)
+PERSONS = 6
+
+# Corpora already loaded in this process, keyed by absolute path
+_loaded = {}
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file"""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def cache_path_for(path, suffix='verbs.marshal'):
+    """Return the cache file used for a corpus file"""
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, CACHE_DIR_NAME, f"{name}.{suffix}")
+
+
+def source_key(path):
+    """Return the (size, mtime_ns) part of the cache key for a corpus file"""
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def read_cached(path, suffix='verbs.marshal'):
+    """Return the cached object for a corpus file, or None if the cache is stale
+
+    The size/mtime pair is checked first; when it differs (e.g. after a
+    checkout touched the file) the content hash decides, and a matching
+    hash refreshes the header instead of forcing a reparse.
+    """
+    cache_path = cache_path_for(path, suffix)
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    try:
+        version, size, mtime_ns, digest, payload = marshal.loads(data)
+    except (EOFError, ValueError, TypeError):
+        return None
+    if version != CACHE_VERSION:
+        return None
+
+    if (size, mtime_ns) == source_key(path):
+        return payload
+    if digest == file_digest(path):
+        write_cached(path, payload, suffix, digest)
+        return payload
+    return None
+
+
+def write_cached(path, payload, suffix='verbs.marshal', digest=None):
+    """Write a marshal snapshot of payload keyed on the corpus file"""
+    cache_path = cache_path_for(path, suffix)
+    if digest is None:
+        digest = file_digest(path)
+    size, mtime_ns = source_key(path)
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps((CACHE_VERSION, size, mtime_ns, digest, payload)))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only checkout still works, it just never gets warm
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_verbs(path=None, use_cache=True):
+    """Load the list of verb records from a conjugation corpus
+
+    Results are memoized per path, so callers share the same list and must
+    copy records before mutating them.
+    """
+    path = os.path.abspath(path or DEFAULT_CORPUS_PATH)
+    if path in _loaded:
+        return _loaded[path]
+
+    verbs = read_cached(path) if use_cache else None
+    if verbs is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            verbs = json.load(f)
+        if use_cache:
+            write_cached(path, verbs)
+
+    _loaded[path] = verbs
+    return verbs
+
+
+def iter_verbs(path=None, chunk_size=1 << 16):
+    """Yield verb records one at a time from the top-level JSON array
+
+    Only the current record and one read buffer are held in memory, so this
+    runs in constant memory whatever the corpus size.
+    """
+    path = os.path.abspath(path or DEFAULT_CORPUS_PATH)
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = f.read(chunk_size)
+        pos = 0
+        eof = not buf
+        started = False
+        while True:
+            # Skip whitespace and separators between records
+            while True:
+                while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos < len(buf) or eof:
+                    break
+                buf = f.read(chunk_size)
+                pos = 0
+                eof = not buf
+
+            if pos >= len(buf):
+                raise ValueError(f"{path}: unexpected end of file")
+            if not started:
+                if buf[pos] != '[':
+                    raise ValueError(f"{path}: expected a top-level JSON array")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == ']':
+                return
+
+            try:
+                verb_data, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # Record straddles the buffer: keep its start and read more
+                more = f.read(max(chunk_size, len(buf) - pos))
+                buf = buf[pos:] + more
+                pos = 0
+                eof = not more
+                continue
+            yield verb_data
+            pos = end
+
+
+def read_word_list(path=None):
+    """Return the infinitives of a word list, one per line, in file order
+
+    Blank lines and # comments are skipped.
+    """
+    with open(path or MISSING_VERBS_PATH, 'r', encoding='utf-8') as f:
+        return [word for word in (line.split('#', 1)[0].strip() for line in f) if word]
+
+
+def write_verbs_json(path, verbs):
+    """Stream records to a JSON array file, formatted like json.dump(indent=2)"""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for verb_data in verbs:
+            f.write(',\n  ' if count else '\n  ')
+            f.write(json.dumps(verb_data, ensure_ascii=False, indent=2).replace('\n', '\n  '))
+            count += 1
+        f.write('\n]' if count else ']')
+    return count
+
+
+def clear_cache(path=None):
+    """Forget memoized corpora and remove on-disk caches for a corpus file"""
+    path = os.path.abspath(path or DEFAULT_CORPUS_PATH)
+    _loaded.pop(path, None)
+    cache_dir = os.path.dirname(cache_path_for(path))
+    prefix = os.path.basename(path) + '.'
+    if os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            if name.startswith(prefix):
+                os.remove(os.path.join(cache_dir, name))
+
+
+def benchmark(path=None, repeat=5):
+    """Measure cold (JSON parse + cache write) and warm (cache hit) load times"""
+    path = os.path.abspath(path or DEFAULT_CORPUS_PATH)
+    cold = []
+    warm = []
+    for _ in range(repeat):
+        clear_cache(path)
+        start = time.perf_counter()
+        verbs = load_verbs(path)
+        cold.append(time.perf_counter() - start)
+
+        _loaded.pop(path, None)
+        start = time.perf_counter()
+        load_verbs(path)
+        warm.append(time.perf_counter() - start)
+
+    print(f"Corpus: {path} ({len(verbs)} verbs, {os.path.getsize(path) / 1024:.0f} KB)")
+    print(f"  Cold load (json + cache write): {min(cold) * 1000:.1f} ms")
+    print(f"  Warm load (marshal cache):      {min(warm) * 1000:.1f} ms")
+    print(f"  Speedup: {min(cold) / min(warm):.1f}x")
+
+
+if __name__ == '__main__':
+    if '--bench' in sys.argv:
+        args = [a for a in sys.argv[1:] if a != '--bench']
+        benchmark(args[0] if args else None)
+    else:
+        verbs = load_verbs(sys.argv[1] if len(sys.argv) > 1 else None)
+        print(f"Loaded {len(verbs)} verbs")
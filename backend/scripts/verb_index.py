@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Normalized infinitive index over the conjugation corpus
+
+Keys are NFC-normalized and case-folded, so "Conduire" and a decomposed
+"être" resolve like their plain lowercase spellings. Exact lookups are dict
+hits; prefix and suffix queries bisect over sorted key lists. The index is
+persisted in .corpus_cache/ next to the corpus (see verb_corpus.py).
+
+Usage:
+    from verb_index import VerbIndex
+    index = VerbIndex.for_corpus()
+    index.get('conduire')
+    index.get_many(['aimer', 'finir'])
+    index.with_suffix('duire')
+"""
+
+import bisect
+import sys
+import unicodedata
+
+from verb_corpus import DEFAULT_CORPUS_PATH, load_verbs, read_cached, write_cached
+
+INDEX_CACHE_SUFFIX = 'index.marshal'
+
+
+def normalize_infinitive(infinitive):
+    """Return the lookup key for an infinitive"""
+    return unicodedata.normalize('NFC', infinitive).strip().casefold()
+
+
+def _prefix_range(sorted_keys, prefix):
+    """Return the slice bounds of keys starting with prefix"""
+    start = bisect.bisect_left(sorted_keys, prefix)
+    end = bisect.bisect_left(sorted_keys, prefix + '\U0010ffff', start)
+    return start, end
+
+
+class VerbIndex:
+    """Map of normalized infinitive to verb record"""
+
+    def __init__(self, verbs, positions=None):
+        self.verbs = verbs
+        if positions is None:
+            positions = {}
+            for i, verb_data in enumerate(verbs):
+                # First record wins, later duplicates are shadowed
+                positions.setdefault(normalize_infinitive(verb_data.get('Infinitif', '')), i)
+        self.positions = positions
+        self._sorted_keys = None
+        self._sorted_reversed = None
+
+    @classmethod
+    def for_corpus(cls, path=None):
+        """Return the index for a corpus file, building and caching it if needed"""
+        path = path or DEFAULT_CORPUS_PATH
+        verbs = load_verbs(path)
+        positions = read_cached(path, INDEX_CACHE_SUFFIX)
+        if positions is None:
+            index = cls(verbs)
+            write_cached(path, index.positions, INDEX_CACHE_SUFFIX)
+            return index
+        return cls(verbs, positions)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, infinitive):
+        return normalize_infinitive(infinitive) in self.positions
+
+    def get(self, infinitive, default=None):
+        """Return the record for an infinitive, or default"""
+        i = self.positions.get(normalize_infinitive(infinitive))
+        return default if i is None else self.verbs[i]
+
+    def get_many(self, infinitives):
+        """Return {infinitive: record} for the infinitives found, in input order"""
+        found = {}
+        for infinitive in infinitives:
+            i = self.positions.get(normalize_infinitive(infinitive))
+            if i is not None:
+                found[infinitive] = self.verbs[i]
+        return found
+
+    def missing(self, infinitives):
+        """Return the infinitives that are not in the index, in input order"""
+        return [v for v in infinitives if normalize_infinitive(v) not in self.positions]
+
+    def with_prefix(self, prefix):
+        """Return the records whose infinitive starts with prefix, sorted by key"""
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self.positions)
+        start, end = _prefix_range(self._sorted_keys, normalize_infinitive(prefix))
+        return [self.verbs[self.positions[k]] for k in self._sorted_keys[start:end]]
+
+    def with_suffix(self, suffix):
+        """Return the records whose infinitive ends with suffix, sorted by reversed key"""
+        if self._sorted_reversed is None:
+            self._sorted_reversed = sorted(k[::-1] for k in self.positions)
+        start, end = _prefix_range(self._sorted_reversed, normalize_infinitive(suffix)[::-1])
+        return [self.verbs[self.positions[k[::-1]]] for k in self._sorted_reversed[start:end]]
+
+
+if __name__ == '__main__':
+    index = VerbIndex.for_corpus()
+    print(f"Indexed {len(index)} infinitives")
+    for query in sys.argv[1:]:
+        if query.startswith('*'):
+            matches = index.with_suffix(query[1:])
+        elif query.endswith('*'):
+            matches = index.with_prefix(query[:-1])
+        else:
+            verb_data = index.get(query)
+            matches = [verb_data] if verb_data else []
+        print(f"{query}: {', '.join(v['Infinitif'] for v in matches) or '(none)'}")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Schema registry mapping conjugation.json records to database rows
+
+Single source for the verbs and verb_conjugations column names, which follow
+the Go models (internal/models/models.go) and create_conjugations_table.sql:
+pronominal_form, present_1 ... imperatif_passe_6.
+"""
+
+import json
+import unicodedata
+
+from verb_corpus import PERSONS, TENSE_KEYS
+from verb_index import normalize_infinitive
+
+# Older spellings of corpus keys
+KEY_ALIASES = {
+    'ConditionnelPasseDeuxiemeForme': 'ConditionnelPasseII',
+}
+
+# Imperatives only exist for tu, nous, vous (0-based persons)
+IMPERATIVE_TENSES = ('Imperatif', 'ImperatifPasse')
+IMPERATIVE_PERSONS = (1, 3, 4)
+
+# (JSON key, verbs column)
+VERB_FIELDS = (
+    ('Infinitif', 'infinitive'),
+    ('ParticipePasse', 'past_participle'),
+    ('ParticipePresent', 'present_participle'),
+    ('Auxiliaire', 'auxiliary'),
+    ('FormePronominale', 'pronominal_form'),
+)
+VERB_COLUMNS = tuple(column for _, column in VERB_FIELDS)
+
+# (JSON key, verb_conjugations column prefix), in TENSE_KEYS order
+TENSE_COLUMNS = (
+    ('Present', 'present'),
+    ('Imparfait', 'imparfait'),
+    ('PasseSimple', 'passe_simple'),
+    ('FuturSimple', 'futur_simple'),
+    ('PasseCompose', 'passe_compose'),
+    ('PlusQueParfait', 'plus_que_parfait'),
+    ('PasseAnterieur', 'passe_anterieur'),
+    ('FuturAnterieur', 'futur_anterieur'),
+    ('SubjonctifPresent', 'subjonctif_present'),
+    ('SubjonctifImparfait', 'subjonctif_imparfait'),
+    ('SubjonctifPasse', 'subjonctif_passe'),
+    ('SubjonctifPlusQueParfait', 'subjonctif_plus_que_parfait'),
+    ('ConditionnelPresent', 'conditionnel_present'),
+    ('ConditionnelPasse', 'conditionnel_passe'),
+    ('ConditionnelPasseII', 'conditionnel_passe_ii'),
+    ('Imperatif', 'imperatif'),
+    ('ImperatifPasse', 'imperatif_passe'),
+)
+assert tuple(key for key, _ in TENSE_COLUMNS) == TENSE_KEYS
+
+CONJUGATION_COLUMNS = tuple(
+    f"{prefix}_{person}" for _, prefix in TENSE_COLUMNS for person in range(1, PERSONS + 1)
+)
+
+# Column lists for bulk loads that carry explicit ids
+VERB_COPY_COLUMNS = ('id',) + VERB_COLUMNS
+CONJUGATION_COPY_COLUMNS = ('id', 'verb_id') + CONJUGATION_COLUMNS
+
+
+def _nfc(value):
+    if unicodedata.is_normalized('NFC', value):
+        return value
+    return unicodedata.normalize('NFC', value)
+
+
+def tense_forms(verb_data, json_key):
+    """Return the 6 forms of a tense, resolving key aliases and 3-slot imperatives
+
+    Missing tenses and persons are returned as empty strings.
+    """
+    forms = verb_data.get(json_key)
+    if forms is None:
+        for alias, canonical in KEY_ALIASES.items():
+            if canonical == json_key and alias in verb_data:
+                forms = verb_data[alias]
+                break
+    if not isinstance(forms, list):
+        return [''] * PERSONS
+    if json_key in IMPERATIVE_TENSES and len(forms) == 3:
+        spread = [''] * PERSONS
+        for person, form in zip(IMPERATIVE_PERSONS, forms):
+            spread[person] = form
+        forms = spread
+    forms = [_nfc(form or '') for form in forms[:PERSONS]]
+    return forms + [''] * (PERSONS - len(forms))
+
+
+def verb_row(verb_data):
+    """Return the verbs row for a record, in VERB_COLUMNS order"""
+    row = [normalize_infinitive(verb_data.get('Infinitif', ''))]
+    row.extend(_nfc(verb_data.get(key) or '') for key, _ in VERB_FIELDS[1:])
+    return tuple(row)
+
+
+def conjugation_row(verb_data):
+    """Return the verb_conjugations row for a record, in CONJUGATION_COLUMNS order"""
+    row = []
+    for json_key, _ in TENSE_COLUMNS:
+        forms = verb_data.get(json_key)
+        # Well-formed tenses are copied as is and normalized below in one check
+        if isinstance(forms, list) and len(forms) == PERSONS:
+            row.extend(forms)
+        else:
+            row.extend(tense_forms(verb_data, json_key))
+    try:
+        joined = '\0'.join(row)
+    except TypeError:
+        # None among the forms
+        return tuple(_nfc(form or '') for form in row)
+    if unicodedata.is_normalized('NFC', joined):
+        return tuple(row)
+    return tuple(_nfc(form) for form in row)
+
+
+def conjugations_json(verb_data):
+    """Return the record as the JSON document stored in verbs.conjugations"""
+    return json.dumps(verb_data, ensure_ascii=False)
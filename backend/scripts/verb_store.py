@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memory-mapped binary conjugation store with random access per verb
+
+Layout (little-endian):
+    header        magic, version, record count, source size/mtime/SHA-256,
+                  and offsets of the three sections below
+    field names   u8 count, then u8 length + UTF-8 name per JSON key
+    offset table  one fixed-size entry per verb, sorted by the UTF-8 bytes of
+                  the normalized infinitive: (key offset, key length,
+                  record offset, record length)
+    blobs         normalized infinitives followed by the encoded records
+
+A record is u8 field count, then per field: u8 field id, u8 string count
+(SCALAR for a plain string) and u16 length + UTF-8 bytes per string. The
+reader binary-searches the offset table and decodes only the records it
+returns, so fetching a few verbs touches a few pages of the file.
+
+Usage:
+    python3 verb_store.py export [conjugation.json] [out.vstore]
+    python3 verb_store.py get conduire être
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+
+from verb_corpus import DEFAULT_CORPUS_PATH, cache_path_for, file_digest, load_verbs, source_key
+from verb_index import normalize_infinitive
+
+MAGIC = b'VRBSTOR\x00'
+VERSION = 1
+HEADER = struct.Struct('<8sHIQq32sIII')
+ENTRY = struct.Struct('<IHII')
+U8 = struct.Struct('<B')
+U16 = struct.Struct('<H')
+FIELD_HEADER = struct.Struct('<BB')
+# Source size and mtime inside HEADER, after magic, version and record count
+SOURCE_KEY = struct.Struct('<Qq')
+SOURCE_KEY_OFFSET = struct.calcsize('<8sHI')
+SCALAR = 0xFF
+
+
+def default_store_path(corpus_path=None):
+    """Return the store file used for a corpus file"""
+    return cache_path_for(corpus_path or DEFAULT_CORPUS_PATH, 'vstore')
+
+
+def _encode_string(value):
+    data = value.encode('utf-8')
+    return U16.pack(len(data)) + data
+
+
+def _encode_record(verb_data, field_ids):
+    parts = [U8.pack(len(verb_data))]
+    for key, value in verb_data.items():
+        if key not in field_ids:
+            field_ids[key] = len(field_ids)
+        if isinstance(value, list):
+            parts.append(FIELD_HEADER.pack(field_ids[key], len(value)))
+            parts.extend(_encode_string(form) for form in value)
+        else:
+            parts.append(FIELD_HEADER.pack(field_ids[key], SCALAR))
+            parts.append(_encode_string(value))
+    return b''.join(parts)
+
+
+def export_store(corpus_path=None, out_path=None):
+    """Write the binary store for a corpus file and return its path"""
+    corpus_path = os.path.abspath(corpus_path or DEFAULT_CORPUS_PATH)
+    out_path = out_path or default_store_path(corpus_path)
+    verbs = load_verbs(corpus_path)
+
+    # First record wins for duplicate infinitives, as in VerbIndex
+    by_key = {}
+    for verb_data in verbs:
+        key = normalize_infinitive(verb_data.get('Infinitif', '')).encode('utf-8')
+        by_key.setdefault(key, verb_data)
+    keys = sorted(by_key)
+
+    field_ids = {}
+    records = [_encode_record(by_key[key], field_ids) for key in keys]
+    if len(field_ids) > SCALAR:
+        raise ValueError(f"Too many distinct fields for the store format: {len(field_ids)}")
+
+    field_table = U8.pack(len(field_ids)) + b''.join(
+        U8.pack(len(name.encode('utf-8'))) + name.encode('utf-8') for name in field_ids
+    )
+    fields_offset = HEADER.size
+    table_offset = fields_offset + len(field_table)
+    data_offset = table_offset + ENTRY.size * len(keys)
+
+    entries = []
+    blob = bytearray()
+    for key in keys:
+        entries.append([data_offset + len(blob), len(key)])
+        blob += key
+    for entry, record in zip(entries, records):
+        entry += [data_offset + len(blob), len(record)]
+        blob += record
+
+    size, mtime_ns = source_key(corpus_path)
+    digest = bytes.fromhex(file_digest(corpus_path))
+    header = HEADER.pack(MAGIC, VERSION, len(keys), size, mtime_ns, digest,
+                         fields_offset, table_offset, data_offset)
+
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(field_table)
+        f.write(b''.join(ENTRY.pack(*entry) for entry in entries))
+        f.write(blob)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+class VerbStore:
+    """Read-only, memory-mapped view over a store file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.count, self.source_size, self.source_mtime_ns,
+         self.source_digest, fields_offset, self._table_offset, _) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} verb store")
+
+        self.fields = []
+        pos = fields_offset + 1
+        for _ in range(self._mm[fields_offset]):
+            length = self._mm[pos]
+            self.fields.append(self._mm[pos + 1:pos + 1 + length].decode('utf-8'))
+            pos += 1 + length
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def is_current_for(self, corpus_path):
+        """Return True if the store was exported from this corpus content
+
+        Like verb_corpus.read_cached(), a size/mtime change with the same
+        content hash (e.g. after a checkout) refreshes the header, so the
+        next open does not hash the corpus again.
+        """
+        key = source_key(corpus_path)
+        if (self.source_size, self.source_mtime_ns) == key:
+            return True
+        if self.source_digest.hex() != file_digest(corpus_path):
+            return False
+        try:
+            with open(self.path, 'r+b') as f:
+                f.seek(SOURCE_KEY_OFFSET)
+                f.write(SOURCE_KEY.pack(*key))
+        except OSError:
+            # A read-only store still works, it just keeps hashing
+            pass
+        else:
+            self.source_size, self.source_mtime_ns = key
+        return True
+
+    def _entry(self, i):
+        return ENTRY.unpack_from(self._mm, self._table_offset + i * ENTRY.size)
+
+    def _key(self, i):
+        key_offset, key_len, _, _ = self._entry(i)
+        return self._mm[key_offset:key_offset + key_len]
+
+    def _find(self, key):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self._key(lo) == key:
+            return lo
+        return None
+
+    def _decode(self, i):
+        _, _, offset, _ = self._entry(i)
+        mm = self._mm
+        verb_data = {}
+        pos = offset + 1
+        for _ in range(mm[offset]):
+            field_id, count = FIELD_HEADER.unpack_from(mm, pos)
+            pos += FIELD_HEADER.size
+            values = []
+            for _ in range(1 if count == SCALAR else count):
+                (length,) = U16.unpack_from(mm, pos)
+                pos += U16.size
+                values.append(mm[pos:pos + length].decode('utf-8'))
+                pos += length
+            verb_data[self.fields[field_id]] = values[0] if count == SCALAR else values
+        return verb_data
+
+    def __contains__(self, infinitive):
+        return self._find(normalize_infinitive(infinitive).encode('utf-8')) is not None
+
+    def get(self, infinitive, default=None):
+        """Return the decoded record for an infinitive, or default"""
+        i = self._find(normalize_infinitive(infinitive).encode('utf-8'))
+        return default if i is None else self._decode(i)
+
+    def get_many(self, infinitives):
+        """Return {infinitive: record} for the infinitives found, in input order"""
+        found = {}
+        for infinitive in infinitives:
+            verb_data = self.get(infinitive)
+            if verb_data is not None:
+                found[infinitive] = verb_data
+        return found
+
+    def keys(self):
+        """Yield the normalized infinitives in store order"""
+        for i in range(self.count):
+            yield self._key(i).decode('utf-8')
+
+    def __iter__(self):
+        """Yield every record in store order, decoding one at a time"""
+        for i in range(self.count):
+            yield self._decode(i)
+
+
+def open_store(corpus_path=None, store_path=None):
+    """Open the store for a corpus, exporting it first if missing or stale"""
+    corpus_path = os.path.abspath(corpus_path or DEFAULT_CORPUS_PATH)
+    store_path = store_path or default_store_path(corpus_path)
+    if os.path.exists(store_path):
+        try:
+            store = VerbStore(store_path)
+        except ValueError:
+            store = None
+        if store is not None:
+            if store.is_current_for(corpus_path):
+                return store
+            store.close()
+    return VerbStore(export_store(corpus_path, store_path))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 2 and sys.argv[1] == 'export':
+        corpus = sys.argv[2] if len(sys.argv) > 2 else None
+        out = sys.argv[3] if len(sys.argv) > 3 else None
+        path = export_store(corpus, out)
+        print(f"✓ Exported store: {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+    elif len(sys.argv) >= 3 and sys.argv[1] == 'get':
+        with open_store() as store:
+            for infinitive in sys.argv[2:]:
+                print(json.dumps(store.get(infinitive), ensure_ascii=False, indent=2))
+    else:
+        print(__doc__.strip().split('Usage:')[1])
+        sys.exit(1)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Self-consistency check of a conjugation corpus against the conjugation rules
+
+Every record is regenerated twice where possible: by the rule engine
+(conjugation_engine.py, with the record's auxiliary) and by copying the
+nearest model verb of the corpus (verb_classifier.py, the verb itself left
+out). The participles and the 102 conjugation cells of the record are
+diffed against each regeneration, and the closest one decides the verdict:
+
+    consistent   a regeneration matches every cell
+    data-error   only letter case differs ("Conduis", "couPasseS"), at most
+                 MAX_FORM_ERRORS cells differ, or the engine and the model
+                 agree with each other but not with the record; structural
+                 issues of lint_corpus.py (3-slot imperatives, an empty
+                 FormePronominale, ...), capitalized forms and duplicates
+                 also count
+    irregular    more cells differ and the regenerations disagree: the verb
+                 does not follow its rule or its neighbours (aller, faire)
+    unverified   neither the engine nor a model covers the verb
+
+Records are sharded across a process pool; each worker builds the model
+classifier once.
+
+Usage:
+    python3 verify_corpus.py [conjugation.json] [--jobs N] [--quiet] [--irregular]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from conjugation_engine import AUXILIARY_FORMS, conjugate, rule_for, split_reflexive
+from lint_corpus import lint_record
+from verb_classifier import ModelClassifier, transfer
+from verb_corpus import DEFAULT_CORPUS_PATH, PERSONS, load_verbs
+from verb_index import normalize_infinitive
+from verb_schema import TENSE_COLUMNS, conjugation_row, verb_row
+
+# More differing cells than this make a verb irregular rather than mistyped
+MAX_FORM_ERRORS = 6
+# Lint issues that point at a hand-written record rather than a defective verb
+STRUCTURE_CODES = ('alias-key', 'unknown-key', 'short-tense', 'bad-length', 'empty-scalar', 'missing-scalar')
+CELL_FIELDS = ('ParticipePasse', 'ParticipePresent') + tuple(
+    f"{tense}[{person}]" for tense, _ in TENSE_COLUMNS for person in range(1, PERSONS + 1)
+)
+CHUNK_SIZE = 128
+
+# Classifier of the current process (built by _load_classifier)
+_classifier = None
+
+
+def _load_classifier(corpus_path):
+    global _classifier
+    _classifier = ModelClassifier.for_corpus(corpus_path)
+
+
+def _cells(verb_data):
+    return verb_row(verb_data)[1:3] + conjugation_row(verb_data)
+
+
+def diff_cells(stored, expected):
+    """Return (field, stored form, expected form, code) for every differing cell
+
+    Codes: case (only letter case differs), missing (stored empty), extra
+    (stored where none is expected) and form.
+    """
+    differences = []
+    for field, form, other in zip(CELL_FIELDS, stored, expected):
+        if form == other:
+            continue
+        if form.lower() == other.lower():
+            code = 'case'
+        elif not form:
+            code = 'missing'
+        elif not other:
+            code = 'extra'
+        else:
+            code = 'form'
+        differences.append((field, form, other, code))
+    return differences
+
+
+def _form_errors(differences):
+    return sum(1 for difference in differences if difference[3] != 'case')
+
+
+def regenerate(verb_data, classifier):
+    """Return [(source, model, confidence, cells)] for the regenerations of a record"""
+    infinitive = normalize_infinitive(verb_data.get('Infinitif') or '')
+    verb, pronominal = split_reflexive(infinitive)
+    auxiliary = normalize_infinitive(verb_data.get('Auxiliaire') or '')
+    regenerations = []
+    if rule_for(infinitive) is not None:
+        generated = conjugate(infinitive, auxiliary if auxiliary in AUXILIARY_FORMS else None)
+        regenerations.append(('engine', None, 1.0, _cells(generated)))
+    model, suffix, confidence = classifier.classify(verb)
+    if model is not None and not pronominal:
+        try:
+            copied = transfer(classifier.records[model], model, verb, suffix)
+        except ValueError:
+            pass
+        else:
+            regenerations.append(('model', model, confidence, _cells(copied)))
+    return regenerations
+
+
+def verify_record(verb_data, classifier):
+    """Return (verdict, source, model, confidence, differences, structure issues) for one record"""
+    issues = lint_record(verb_data)[0]
+    structure = [issue for issue in issues if issue[0] in STRUCTURE_CODES]
+    capitalized = sum(1 for issue in issues if issue[0] == 'capitalized')
+    if capitalized:
+        structure.append(('capitalized', 'cells', f"{capitalized} forms start with a capital letter"))
+    stored = _cells(verb_data)
+    regenerations = regenerate(verb_data, classifier)
+    if not regenerations:
+        return ('data-error' if structure else 'unverified'), None, None, 0.0, [], structure
+
+    compared = [(diff_cells(stored, cells), source, model, confidence, cells)
+                for source, model, confidence, cells in regenerations]
+    differences, source, model, confidence, _ = min(compared, key=lambda entry: (_form_errors(entry[0]),
+                                                                                 len(entry[0])))
+    errors = _form_errors(differences)
+    # Two independent regenerations that agree outvote the record
+    agree = any(_form_errors(diff_cells(engine[4], copied[4])) == 0
+                for engine in compared if engine[1] == 'engine'
+                for copied in compared if copied[1] == 'model')
+    if not differences:
+        verdict = 'data-error' if structure else 'consistent'
+    elif structure or errors <= MAX_FORM_ERRORS or agree:
+        verdict = 'data-error'
+    else:
+        verdict = 'irregular'
+    return verdict, source, model, confidence, differences, structure
+
+
+def verify_chunk(chunk):
+    """Verify a list of (position, record) pairs; runs in a worker process"""
+    return [(position, verb_data.get('Infinitif') or '', *verify_record(verb_data, _classifier))
+            for position, verb_data in chunk]
+
+
+def verify_corpus(verbs, corpus_path=None, jobs=None):
+    """Verify all records; returns results in corpus order
+
+    Results are (position, infinitive, verdict, source, model, confidence,
+    differences, structure issues) tuples. Later duplicates of an
+    infinitive are data errors.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    pairs = list(enumerate(verbs))
+    chunks = [pairs[start:start + CHUNK_SIZE] for start in range(0, len(pairs), CHUNK_SIZE)]
+    if jobs == 1:
+        _load_classifier(corpus_path)
+        chunk_results = list(map(verify_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks)), initializer=_load_classifier,
+                                 initargs=(corpus_path,)) as executor:
+            chunk_results = list(executor.map(verify_chunk, chunks))
+
+    results = []
+    first_seen = {}
+    for chunk_result in chunk_results:
+        for position, infinitive, verdict, source, model, confidence, differences, structure in chunk_result:
+            key = normalize_infinitive(infinitive)
+            if key in first_seen:
+                structure = structure + [('duplicate', 'Infinitif', f"already defined by record #{first_seen[key]}")]
+                verdict = 'data-error'
+            else:
+                first_seen[key] = position
+            results.append((position, infinitive, verdict, source, model, confidence, differences, structure))
+    return results
+
+
+def _describe(source, model, confidence):
+    if source == 'model':
+        return f"like {model} (confidence {confidence:.2f})"
+    return "by the rules" if source else "no rule or model"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate every verb and report data errors and irregular verbs")
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS_PATH)
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--quiet', action='store_true', help="only print the summary")
+    parser.add_argument('--irregular', action='store_true', help="also print the cells of irregular verbs")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    verbs = load_verbs(args.corpus)
+    results = verify_corpus(verbs, args.corpus, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    name = os.path.basename(args.corpus)
+    counts = {}
+    for position, infinitive, verdict, source, model, confidence, differences, structure in results:
+        counts[verdict] = counts.get(verdict, 0) + 1
+        if args.quiet or verdict in ('consistent', 'unverified'):
+            continue
+        where = f"{name}:#{position} {infinitive}"
+        if verdict == 'irregular':
+            print(f"{where}: irregular, {len(differences)} cells differ when generated "
+                  f"{_describe(source, model, confidence)}")
+            if not args.irregular:
+                continue
+        elif differences:
+            print(f"{where}: {len(differences)} cells differ when generated {_describe(source, model, confidence)}")
+        for code, field, message in structure:
+            print(f"{where}: {field}: {message} [{code}]")
+        for field, form, expected, code in differences:
+            print(f"{where}: {field}: {form!r}, expected {expected!r} [{code}]")
+
+    print(f"\n{len(verbs)} verbs verified in {elapsed:.2f}s")
+    for verdict in ('consistent', 'data-error', 'irregular', 'unverified'):
+        print(f"  - {verdict}: {counts.get(verdict, 0)}")
+    return 1 if counts.get('data-error') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())